@@ -1,27 +1,59 @@
 from carrot_like import CarrotLikeBot  # (1) 좋아요 봇
 from carrot_read_like import CarrotProfileReader  # (2) 프로필 리더
+from carrot_session import PERFORMANCE_PROFILES, AppiumSession  # 공유 Appium 세션
+from carrot_index import WatchlistIndex, load_known_titles  # 관심목록 색인
+from carrot_titles import find_missing, find_missing_streaming  # 정규화된 제목 비교
+from carrot_sink import TitleSink, iter_sink_titles  # 관심목록 디스크 기록
+from carrot_daemon import client_session  # 세션 데몬 연결
+import argparse
 
-def verify_likes():
-    # (1) 좋아요 누르고 제목 목록 받아오기
-    print("좋아요 봇 시작")
-    like_bot = CarrotLikeBot()
-    liked_results = like_bot.run()  # 결과 딕셔너리 받아오기
-    liked_titles = liked_results['liked_titles']  # 좋아요 누른 제목들 리스트
-    print(f"좋아요 누른 제목 {len(liked_titles)}개: {liked_titles}")
-    
-    # (2) 프로필 리더로 관심목록 받아오기
-    print("\n프로필 리더 시작...")
-    profile_reader = CarrotProfileReader()
-    profile_titles = profile_reader.run()  # 프로필의 관심목록 제목들
-    print(f"프로필 관심목록 {len(profile_titles)}개: {profile_titles}")
+def verify_likes(device_name=AppiumSession.DEFAULT_DEVICE_NAME, index_path=None, fuzzy_cutoff=None, session=None,
+                 stream_path=None):
+    # index_path를 지정하면 색인에 있는 제목은 좋아요 봇이 열지 않고 건너뛰고, 관심목록은 색인 기반으로 증분 수집
+    # fuzzy_cutoff(0~1)를 지정하면 정확히 일치하지 않는 제목을 유사도로 한 번 더 비교
+    # session을 넘기면 그 세션을 쓰고 닫지 않음 (기록/재생 등)
+    # stream_path를 지정하면 관심목록을 메모리에 모으지 않고 파일에 쓴 뒤 파일을 읽으며 비교
+    # 두 단계가 하나의 세션을 공유하여 세션 시작 비용을 한 번만 지불
+    owns_session = session is None
+    session = session or AppiumSession(device_name)
+    try:
+        session.start()
+
+        # (1) 좋아요 누르고 제목 목록 받아오기
+        print("좋아요 봇 시작")
+        like_bot = CarrotLikeBot(session=session, known_titles=load_known_titles(index_path))
+        liked_results = like_bot.run()  # 결과 딕셔너리 받아오기
+        liked_titles = liked_results['liked_titles']  # 좋아요 누른 제목들 리스트
+        print(f"좋아요 누른 제목 {len(liked_titles)}개: {liked_titles}")
+        
+        # (2) 프로필 리더로 관심목록 받아오기
+        print("\n프로필 리더 시작...")
+        index = WatchlistIndex(index_path) if index_path else None
+        sink = TitleSink(stream_path) if stream_path else None
+        try:
+            profile_reader = CarrotProfileReader(session=session, index=index)
+            profile_titles = profile_reader.run(incremental=index is not None, sink=sink)  # 프로필의 관심목록 제목들
+        finally:
+            if index is not None:
+                index.close()
+            if sink is not None:
+                sink.close()
+        if sink is not None:
+            print(f"프로필 관심목록 {sink.count}개: {stream_path}")
+        else:
+            print(f"프로필 관심목록 {len(profile_titles)}개: {profile_titles}")
+    finally:
+        if owns_session:
+            print("공유 세션 종료 중...")
+            session.quit()
     
     # (1)의 모든 항목이 (2)에 포함되어 있는지 확인
     print("\n검증 시작...")
     
-    missing_titles = []
-    for liked_title in liked_titles:
-        if liked_title not in profile_titles:
-            missing_titles.append(liked_title)
+    if stream_path:
+        missing_titles = find_missing_streaming(liked_titles, iter_sink_titles(stream_path), fuzzy_cutoff)
+    else:
+        missing_titles = find_missing(liked_titles, profile_titles, fuzzy_cutoff)
     
     # 결과 판정
     if len(missing_titles) == 0:
@@ -32,10 +64,40 @@ def verify_likes():
         print(f"누락된 항목들: {missing_titles}")
         return False
 
+def verify_likes_inline(device_name=AppiumSession.DEFAULT_DEVICE_NAME, session=None, verify_batch=5):
+    # 전체 관심목록을 다시 읽지 않고, 좋아요 봇이 verify_batch개마다 관심목록 맨 위만 읽어 반영 여부 확인
+    # 전체 목록 비교(verify_likes)는 주기적인 점검용으로만 사용
+    like_bot = CarrotLikeBot(device_name, session=session, verify_batch=verify_batch)
+    liked_results = like_bot.run()
+    unverified_titles = liked_results['unverified_titles']
+
+    if len(unverified_titles) == 0:
+        print(f"PASS: 좋아요 누른 {len(liked_results['verified_titles'])}개 항목이 모두 관심목록 맨 위에서 확인되었습니다!")
+        return True
+    else:
+        print(f"FAIL: {len(unverified_titles)}개 항목이 관심목록에서 확인되지 않음")
+        print(f"확인되지 않은 항목들: {unverified_titles}")
+        return False
+
 def main():
-    """메인 실행 함수"""
+    """메인 실행 함수 (--attach: 세션 데몬의 세션 사용, --inline: 전체 목록 대신 좋아요마다 관심목록 앞부분만 확인,
+    --index: 관심목록 색인으로 증분 수집)"""
+    parser = argparse.ArgumentParser(description="좋아요 후 관심목록 검증")
+    parser.add_argument("--attach", action="store_true", help="carrot_daemon.py가 유지하는 세션에 붙어서 실행")
+    parser.add_argument("--stream", metavar="PATH", help="관심목록을 JSONL 파일에 기록하고 파일로 비교 (큰 관심목록용)")
+    parser.add_argument("--inline", type=int, metavar="BATCH", help="좋아요 BATCH개마다 관심목록 맨 위만 읽어 확인 (전체 목록 비교 생략)")
+    parser.add_argument("--profile", choices=list(PERFORMANCE_PROFILES), help="UiAutomator2 성능 프로필 (기본: 서버 기본값)")
+    parser.add_argument("--index", metavar="PATH", nargs="?", const=WatchlistIndex.DEFAULT_PATH,
+                        help=f"관심목록 색인 파일 - 색인된 제목은 좋아요 봇이 건너뛰고 관심목록은 증분 수집 "
+                             f"(경로 생략 시 {WatchlistIndex.DEFAULT_PATH})")
+    args = parser.parse_args()
+
+    session = client_session(profile=args.profile) if args.attach else AppiumSession(profile=args.profile)
     try:
-        result = verify_likes()
+        if args.inline:
+            result = verify_likes_inline(session=session, verify_batch=args.inline)
+        else:
+            result = verify_likes(session=session, index_path=args.index, stream_path=args.stream)
         
         if result:
             print("\n검증 성공!")
@@ -45,5 +107,8 @@ def main():
     except Exception as e:
         print(f"오류 발생: {e}")
 
+    finally:
+        session.quit()  # 데몬 세션이면 연결만 끊음
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,1300 @@
+from carrot_confirm import ToastWatcher, toggle_state
+from carrot_events import JsonlEventSink
+from carrot_feed import FeedCursor, row_title
+from carrot_index import load_known_titles
+from carrot_journal import RunJournal
+from carrot_layout import DetailLayoutClassifier
+from carrot_like import CarrotLikeBot
+from carrot_metrics import CommandMetrics
+from carrot_navigation import WatchlistNavigator
+from carrot_pacing import PacingController
+from carrot_read_like import CarrotProfileReader
+from carrot_recovery import RecoveryManager
+from carrot_runner import load_inventory, merge_results, print_report
+from carrot_scroll import EndOfListDetector, ScrollEngine
+from carrot_session import PERFORMANCE_PROFILES, AppiumSession
+from carrot_snapshot import PageSnapshot, parse_bounds, parse_page_source
+from carrot_tap import CoordinateTapper
+from carrot_titles import TitleIndex, normalize_title
+from carrot_wait import ScreenSettleWaiter
+from selenium.webdriver.common.by import By
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+import aiohttp
+import argparse
+import asyncio
+import hashlib
+import time
+
+
+# W3C 응답에서 element id가 들어 있는 키
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class AsyncWebDriverError(Exception):
+    """Appium 서버가 돌려준 W3C 오류 (error: "stale element reference" 등)"""
+
+    def __init__(self, error: str, message: str = ""):
+        super().__init__(f"{error}: {message}")
+        self.error = error
+        self.msg = message
+
+
+class AsyncConnectionPool:
+    """Appium 서버마다 keep-alive 연결을 재사용하는 aiohttp 세션 풀"""
+
+    LIMIT_PER_SERVER = 16
+    KEEPALIVE_TIMEOUT = 60
+    COMMAND_TIMEOUT = 120
+
+    def __init__(self):
+        """초기화 (aiohttp 세션은 이벤트 루프 안에서 처음 쓸 때 생성)"""
+        self._clients: Dict[str, aiohttp.ClientSession] = {}
+
+    def client(self, server_url: str) -> aiohttp.ClientSession:
+        """서버 URL별 공유 HTTP 클라이언트"""
+        server_url = server_url.rstrip("/")
+        if server_url not in self._clients:
+            self._clients[server_url] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.LIMIT_PER_SERVER, keepalive_timeout=self.KEEPALIVE_TIMEOUT),
+                timeout=aiohttp.ClientTimeout(total=self.COMMAND_TIMEOUT),
+            )
+        return self._clients[server_url]
+
+    async def close(self) -> None:
+        """모든 연결 닫기"""
+        for client in self._clients.values():
+            await client.close()
+        self._clients = {}
+
+    async def __aenter__(self) -> "AsyncConnectionPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+class AsyncAppiumDriver:
+    """W3C WebDriver 명령을 직접 보내는 비동기 driver (봇에서 쓰는 명령만 구현)"""
+
+    def __init__(self, client: aiohttp.ClientSession, server_url: str, session_id: str,
+                 metrics: Optional[CommandMetrics] = None):
+        """초기화"""
+        self.client = client
+        self.server_url = server_url.rstrip("/")
+        self.session_id = session_id
+        self.metrics = metrics
+
+    @classmethod
+    async def create(cls, client: aiohttp.ClientSession, server_url: str, capabilities: Dict,
+                     metrics: Optional[CommandMetrics] = None) -> "AsyncAppiumDriver":
+        """새 세션 생성"""
+        driver_value = cls(client, server_url, "", metrics)
+        value = await driver_value._command("newSession", "POST", "/session", {
+            'capabilities': {'alwaysMatch': capabilities, 'firstMatch': [{}]},
+        })
+        driver_value.session_id = value['sessionId']
+        return driver_value
+
+    async def _command(self, command: str, method: str, path: str, body: Optional[Dict] = None):
+        """명령 하나 전송 후 value 반환 (CommandMetrics에 지연 기록)"""
+        step_value = self.metrics._caller_step() if self.metrics is not None else None
+        # newSession 외의 모든 /session 명령에 세션 ID를 붙임 (quit의 DELETE /session 포함)
+        if path.startswith("/session") and command != "newSession":
+            path = f"/session/{self.session_id}{path[len('/session'):]}"
+        started_value = time.perf_counter()
+        try:
+            async with self.client.request(method, self.server_url + path, json=body) as response:
+                payload_value = await response.json(content_type=None)
+            value = (payload_value or {}).get('value')
+            if isinstance(value, dict) and 'error' in value:
+                raise AsyncWebDriverError(value['error'], value.get('message', ""))
+            if response.status >= 400:
+                raise AsyncWebDriverError(str(response.status), str(value))
+        except Exception:
+            if self.metrics is not None:
+                self.metrics.record(step_value, command, time.perf_counter() - started_value, error=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record(step_value, command, time.perf_counter() - started_value)
+        return value
+
+    async def find_elements(self, by: str, value: str) -> List[str]:
+        """element id 목록"""
+        elements_value = await self._command("findElements", "POST", "/session/elements", {'using': by, 'value': value})
+        return [element[ELEMENT_KEY] for element in elements_value]
+
+    async def find_element(self, by: str, value: str) -> Optional[str]:
+        """첫 번째 element id (없으면 None)"""
+        elements_value = await self.find_elements(by, value)
+        return elements_value[0] if elements_value else None
+
+    async def click(self, element_id: str) -> None:
+        await self._command("clickElement", "POST", f"/session/element/{element_id}/click", {})
+
+    async def attribute(self, element_id: str, name: str) -> Optional[str]:
+        return await self._command("getElementAttribute", "GET", f"/session/element/{element_id}/attribute/{name}")
+
+    async def page_source(self) -> str:
+        return await self._command("getPageSource", "GET", "/session/source")
+
+    async def back(self) -> None:
+        await self._command("back", "POST", "/session/back", {})
+
+    async def current_activity(self) -> str:
+        return await self._command("getCurrentActivity", "GET", "/session/appium/device/current_activity")
+
+    async def execute_script(self, script: str, args: Optional[Dict] = None):
+        """mobile: 명령 실행"""
+        return await self._command("executeScript", "POST", "/session/execute/sync",
+                                   {'script': script, 'args': [args or {}]})
+
+    async def window_size(self) -> Dict[str, int]:
+        rect_value = await self._command("getWindowRect", "GET", "/session/window/rect")
+        return {'width': rect_value['width'], 'height': rect_value['height']}
+
+    async def update_settings(self, settings: Dict) -> None:
+        """UiAutomator2 서버 설정 변경"""
+        await self._command("updateSettings", "POST", "/session/appium/settings", {'settings': settings})
+
+    async def perform_actions(self, actions: List[Dict]) -> None:
+        """W3C 터치 동작 한 번에 전송"""
+        await self._command("w3cActions", "POST", "/session/actions", {'actions': [{
+            'type': 'pointer', 'id': 'touch', 'parameters': {'pointerType': 'touch'}, 'actions': actions,
+        }]})
+
+    async def quit(self) -> None:
+        await self._command("quit", "DELETE", "/session")
+
+
+class AsyncAppiumSession:
+    """AppiumSession과 같은 capabilities로 여는 비동기 세션 (연결은 AsyncConnectionPool에서 공유)"""
+
+    def __init__(self, config: Optional[AppiumSession] = None, pool: Optional[AsyncConnectionPool] = None):
+        """초기화 (config: capabilities/server_url/metrics를 가진 AppiumSession - driver는 만들지 않음)"""
+        self.config = config or AppiumSession()
+        self.device_name = self.config.device_name
+        self.metrics = self.config.metrics
+        self._owns_pool = pool is None
+        self.pool = pool or AsyncConnectionPool()
+        self.driver: Optional[AsyncAppiumDriver] = None
+        self.start_count = 0
+        self._abandoned_drivers: List[AsyncAppiumDriver] = []
+
+    @classmethod
+    def for_device(cls, device: Dict, pool: Optional[AsyncConnectionPool] = None) -> "AsyncAppiumSession":
+        """디바이스 목록 항목({"udid", "server_url", "system_port"})으로 세션 생성"""
+        return cls(AppiumSession.for_device(
+            device['udid'],
+            device.get('server_url', AppiumSession.DEFAULT_SERVER_URL),
+            device.get('system_port'),
+            device.get('profile'),
+        ), pool)
+
+    async def _create_driver(self, capabilities: Optional[Dict] = None) -> None:
+        self.driver = await AsyncAppiumDriver.create(
+            self.pool.client(self.config.server_url), self.config.server_url,
+            capabilities or self.config.desired_caps, self.metrics
+        )
+        self.start_count += 1
+        if self.config.profile is not None:
+            await self.driver.update_settings(PERFORMANCE_PROFILES[self.config.profile])
+
+    async def start(self) -> AsyncAppiumDriver:
+        """세션이 없을 때만 새로 시작"""
+        if self.driver is None:
+            await self._create_driver()
+            print(f"[{self.device_name}] Appium session 시작 완료")
+        return self.driver
+
+    async def restart(self) -> AsyncAppiumDriver:
+        """crash 등으로 세션을 재시작"""
+        await self.quit()
+        await asyncio.sleep(self.config.RESTART_DELAY)
+        await self._create_driver()
+        print(f"[{self.device_name}] Appium session 재시작 완료")
+        return self.driver
+
+    async def warm_restart(self) -> AsyncAppiumDriver:
+        """앱을 종료하지 않고 새 세션 시작 (AppiumSession.warm_restart와 같음 - 이전 세션은 quit() 때 정리)"""
+        if self.driver is not None:
+            self._abandoned_drivers.append(self.driver)
+        self.driver = None
+        await self._create_driver(dict(self.config.desired_caps, **AppiumSession.WARM_RESTART_CAPABILITIES))
+        print(f"[{self.device_name}] Appium session 재시작 완료 (화면 유지)")
+        return self.driver
+
+    async def server_ready(self, timeout: float = 2) -> bool:
+        """Appium 서버가 /status에 응답하는지"""
+        try:
+            async with self.pool.client(self.config.server_url).get(
+                    f"{self.config.server_url.rstrip('/')}/status", timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    async def return_to(self, locator: Tuple[str, str]) -> bool:
+        """locator가 보일 때까지 뒤로 가기 (AppiumSession.return_to와 같음)"""
+        for _ in range(self.config.BACK_LIMIT + 1):
+            if await self.driver.find_elements(*locator):
+                return True
+            await self.driver.back()
+        return False
+
+    async def quit(self) -> None:
+        """세션 종료 (warm_restart가 남겨둔 이전 세션 포함)"""
+        for driver in self._abandoned_drivers + [self.driver]:
+            try:
+                if driver:
+                    await driver.quit()
+            except Exception:
+                pass
+        self._abandoned_drivers = []
+        self.driver = None
+
+    async def close(self) -> None:
+        """세션 종료 후 직접 만든 연결 풀도 닫기"""
+        await self.quit()
+        if self._owns_pool:
+            await self.pool.close()
+
+    async def __aenter__(self) -> "AsyncAppiumSession":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+class AsyncSettleWaiter(ScreenSettleWaiter):
+    """ScreenSettleWaiter의 비동기 버전 (대기 중에 다른 디바이스의 명령이 진행됨)"""
+
+    async def _hierarchy_hash(self) -> Optional[str]:
+        try:
+            self.last_page_source = await self.driver.page_source()
+        except Exception:
+            self.last_page_source = None
+            return None
+        return hashlib.blake2b(self.last_page_source.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def _current_activity(self) -> Optional[str]:
+        try:
+            return await self.driver.current_activity()
+        except Exception:
+            return None
+
+    async def _locator_present(self, locator: Tuple[str, str]) -> bool:
+        try:
+            return len(await self.driver.find_elements(*locator)) > 0
+        except Exception:
+            return False
+
+    async def _poll(self, ceiling: float, is_ready: Callable) -> float:
+        """is_ready(코루틴 함수)가 참이 될 때까지 backoff 폴링 (최대 ceiling초)"""
+        self.last_page_source = None
+        started_value = time.monotonic()
+        deadline_value = started_value + ceiling
+        interval_value = self.INITIAL_INTERVAL
+        ready_value = False
+
+        while True:
+            if await is_ready():
+                ready_value = True
+                break
+            remaining_value = deadline_value - time.monotonic()
+            if remaining_value <= 0:
+                break
+            await asyncio.sleep(min(interval_value, remaining_value))
+            interval_value = min(interval_value * self.BACKOFF_FACTOR, self.MAX_INTERVAL)
+
+        elapsed_value = time.monotonic() - started_value
+        self.stats['waits'] += 1
+        self.stats['waited_seconds'] += elapsed_value
+        self.stats['fixed_seconds'] += ceiling
+        if not ready_value:
+            self.stats['timeouts'] += 1
+        self.last_ready = ready_value
+        return elapsed_value
+
+    async def wait_until_stable(self, ceiling: float) -> float:
+        """계층구조 해시가 연속 두 번 같아질 때까지 대기"""
+        previous_hash = [None]
+
+        async def is_stable() -> bool:
+            current_hash = await self._hierarchy_hash()
+            stable_value = current_hash is not None and current_hash == previous_hash[0]
+            previous_hash[0] = current_hash
+            return stable_value
+
+        return await self._poll(ceiling, is_stable)
+
+    async def wait_for_locator(self, locator: Tuple[str, str], ceiling: float) -> float:
+        """locator에 해당하는 요소가 나타날 때까지 대기"""
+        return await self._poll(ceiling, lambda: self._locator_present(locator))
+
+    async def wait_for_activity(self, ceiling: float, previous_activity: Optional[str] = None,
+                                expected_activity: Optional[str] = None) -> float:
+        """현재 activity가 expected_activity가 되거나 previous_activity에서 바뀔 때까지 대기"""
+        async def is_ready() -> bool:
+            activity_value = await self._current_activity()
+            if activity_value is None:
+                return False
+            if expected_activity is not None:
+                return activity_value == expected_activity
+            return activity_value != previous_activity
+
+        return await self._poll(ceiling, is_ready)
+
+
+class AsyncRecoveryManager(RecoveryManager):
+    """RecoveryManager의 비동기 버전 - 같은 오류 종류와 복구 단계를 AsyncAppiumSession으로 실행
+
+    AsyncWebDriverError는 W3C 오류 코드와 메시지로, 연결 실패는 aiohttp 예외로 분류
+    """
+
+    @classmethod
+    def classify(cls, error: Exception) -> Optional[str]:
+        """오류 종류 (복구할 수 없는 오류면 None)"""
+        if isinstance(error, aiohttp.ClientConnectionError):
+            return cls.SERVER_DOWN
+        if not isinstance(error, AsyncWebDriverError):
+            return None
+        if error.error == "stale element reference":
+            return cls.STALE
+        if error.error == "invalid session id":
+            return cls.SESSION_GONE
+        message_value = str(error)
+        if any(message in message_value for message in cls.INSTRUMENTATION_MESSAGES):
+            return cls.INSTRUMENTATION
+        if any(message in message_value for message in cls.SESSION_GONE_MESSAGES):
+            return cls.SESSION_GONE
+        return None
+
+    async def _current_activity(self) -> Optional[str]:
+        try:
+            return await self.driver.current_activity() if self.driver is not None else None
+        except Exception:
+            return None
+
+    async def _probe(self) -> bool:
+        try:
+            await self.driver.window_size()
+            return True
+        except Exception:
+            return False
+
+    async def _wait_for_server(self) -> bool:
+        deadline_value = time.monotonic() + self.SERVER_WAIT
+        while not await self.session.server_ready():
+            if time.monotonic() >= deadline_value:
+                return False
+            await asyncio.sleep(self.SERVER_POLL_INTERVAL)
+        return True
+
+    async def _run_tier(self, tier: str) -> bool:
+        """복구 단계 하나 실행 - 세션이 다시 명령을 받으면 True"""
+        try:
+            if tier == self.REFIND:
+                return True
+            if tier == self.PROBE:
+                await asyncio.sleep(self.PROBE_DELAY)
+                return await self._probe()
+            if tier == self.WAIT_SERVER:
+                if not await self._wait_for_server():
+                    return False
+                await self.session.warm_restart()
+            elif tier == self.WARM:
+                await self.session.warm_restart()
+            else:
+                await self.session.restart()
+        except Exception as e:
+            self.log(f"복구 단계 {tier} 실패: {e}")
+            return False
+        return await self._probe()
+
+    async def _restore_activity(self, activity: Optional[str]) -> bool:
+        """복구 전 activity로 되돌리기 - 이미 같은 화면이면 아무것도 하지 않음"""
+        if activity is None or await self._current_activity() == activity:
+            return True
+        try:
+            await self.driver.execute_script("mobile: startActivity", {
+                'component': f"{self.session.config.desired_caps['appium:appPackage']}/{activity}",
+                'stop': False,
+            })
+        except AsyncWebDriverError as e:
+            self.log(f"이전 화면({activity}) 복원 실패: {e.msg}")
+            return False
+        if self.settle is not None:
+            await self.settle(self.RESTORE_SETTLE)
+        return True
+
+    async def recover(self, error: Exception) -> str:
+        """RecoveryManager.recover와 같음 (사용한 단계 반환, 모든 단계가 실패하면 RecoveryFailed)"""
+        kind_value = self.classify(error)
+        if kind_value is None:
+            raise error
+
+        activity_value = await self._current_activity() if kind_value != self.STALE else None
+        incident_value = self._open_incident(kind_value, activity_value)
+
+        for tier in self.TIERS[kind_value]:
+            if kind_value != self.STALE:
+                self.log(f"{kind_value} 감지 — 복구 단계 {tier} 시도")
+            if await self._run_tier(tier):
+                incident_value.update(tier=tier, recovered=True)
+                break
+
+        if incident_value['recovered'] and kind_value != self.STALE:
+            incident_value['restored'] = await self._restore_activity(activity_value)
+        return self._close_incident(incident_value, error)
+
+
+class AsyncCoordinateTapper(CoordinateTapper):
+    """CoordinateTapper의 비동기 버전 (레이아웃별 좌표 캐시와 통계는 그대로 쓰고 탭만 AsyncAppiumDriver로 전송)"""
+
+    async def tap(self, x: int, y: int) -> None:
+        """좌표 탭 (누르기-떼기를 한 번의 W3C 액션으로 전송)"""
+        await self.driver.perform_actions([
+            {'type': 'pointerMove', 'duration': 0, 'x': x, 'y': y},
+            {'type': 'pointerDown', 'button': 0},
+            {'type': 'pause', 'duration': int(self.PRESS_SECONDS * 1000)},
+            {'type': 'pointerUp', 'button': 0},
+        ])
+        self.stats['taps'] += 1
+
+    async def tap_bounds(self, bounds: Tuple[int, int, int, int]) -> None:
+        left_value, top_value, right_value, bottom_value = bounds
+        await self.tap((left_value + right_value) // 2, (top_value + bottom_value) // 2)
+
+    async def tap_cached(self, layout_key, signature: Optional[str], bounds: Optional[Tuple[int, int, int, int]]) -> bool:
+        """CoordinateTapper.tap_cached와 같음"""
+        cached_bounds_value = self._cached_bounds(layout_key, signature, bounds)
+        if cached_bounds_value is None:
+            return False
+        await self.tap_bounds(cached_bounds_value)
+        return True
+
+    async def tap_node(self, node) -> bool:
+        bounds_value = parse_bounds(node.get("bounds")) if node is not None else None
+        if bounds_value is None:
+            return False
+        await self.tap_bounds(bounds_value)
+        return True
+
+
+class AsyncFeedPost:
+    """피드 행 하나 - 클릭 시 element가 stale이면 같은 키의 행을 다시 찾아 클릭"""
+
+    def __init__(self, key: str, element_id: str, cursor: "AsyncFeedCursor"):
+        """초기화"""
+        self.key = key
+        self.element_id = element_id
+        self.cursor = cursor
+
+    async def click(self) -> None:
+        try:
+            await self.cursor.driver.click(self.element_id)
+        except AsyncWebDriverError as e:
+            if e.error != "stale element reference":
+                raise
+            # 스냅샷 한 번으로 같은 키의 행을 찾아 좌표로 탭 (가능하면)
+            if await self.cursor.tap_row(self.key):
+                return
+            self.element_id = await self.cursor.find_element(self.key)
+            if self.element_id is None:
+                raise
+            await self.cursor.driver.click(self.element_id)
+
+
+class AsyncFeedCursor(FeedCursor):
+    """FeedCursor의 비동기 버전 (처리한 게시물/관심목록 제목 기록은 그대로 사용)"""
+
+    def __init__(self, driver_getter: Callable, row_xpath: str, known_titles: Optional[Iterable[str]] = None,
+                 seen_limit: int = FeedCursor.SEEN_LIMIT, tapper: Optional[AsyncCoordinateTapper] = None):
+        """초기화 (tapper: stale 행을 좌표로 탭할 AsyncCoordinateTapper)"""
+        super().__init__(driver_getter, row_xpath, None, known_titles, seen_limit, tapper)
+
+    @property
+    def driver(self) -> AsyncAppiumDriver:
+        return self.driver_getter()
+
+    async def _rows(self) -> List[Tuple[str, Optional[str], str]]:
+        """현재 화면의 (키, 제목, element id) 목록 - 키와 제목은 page_source 한 번으로 읽음 (행마다 속성을
+        조회하면 제목은 None)"""
+        element_ids_value = await self.driver.find_elements(By.XPATH, self.row_xpath)
+        if not element_ids_value:
+            return []
+        snapshot_value = parse_page_source(await self.driver.page_source())
+        rows_value = [(row.get("content-desc"), row_title(row)) for row in snapshot_value.xpath(self.row_xpath)] \
+            if snapshot_value is not None else []
+        if len(rows_value) != len(element_ids_value):
+            rows_value = [(await self.driver.attribute(element_id, "content-desc"), None)
+                          for element_id in element_ids_value]
+        return [(key, title, element_id) for (key, title), element_id in zip(rows_value, element_ids_value)]
+
+    async def refresh(self) -> int:
+        """현재 스크롤 위치의 행을 읽어 아직 처리하지 않은 게시물만 대기열에 넣음 - 새 게시물 수 반환"""
+        self._pending = []
+        for key, title, element_id in await self._rows():
+            if not key or key in self._seen or self.is_known(key, title):
+                continue
+            self._pending.append(AsyncFeedPost(key, element_id, self))
+        return len(self._pending)
+
+    async def tap_row(self, key: str) -> bool:
+        """현재 화면 스냅샷에서 같은 키의 행을 찾아 좌표로 탭 (tapper가 없거나 행이 없으면 False)"""
+        if self.tapper is None:
+            return False
+        snapshot_value = parse_page_source(await self.driver.page_source())
+        if snapshot_value is None:
+            return False
+        for row in snapshot_value.xpath(self.row_xpath):
+            if row.get("content-desc") == key:
+                return await self.tapper.tap_node(row)
+        return False
+
+    async def find_element(self, key: str) -> Optional[str]:
+        """같은 키의 행 element 다시 찾기"""
+        for row_key, _, element_id in await self._rows():
+            if row_key == key:
+                return element_id
+        return None
+
+
+class AsyncWatchlistNavigator(WatchlistNavigator):
+    """WatchlistNavigator의 비동기 버전 - 같은 순서(딥링크 → startActivity → 탭 경로)와 상태 파일 사용
+
+    tap_path/recover는 코루틴 함수
+    """
+
+    def __init__(self, driver_getter: Callable, waiter: AsyncSettleWaiter, app_package: str,
+                 ready_locator: Tuple[str, str], tap_path: Callable, recover: Optional[Callable] = None,
+                 deep_link_url: Optional[str] = None, activity: Optional[str] = None,
+                 state_path: Optional[str] = WatchlistNavigator.STATE_PATH, log: Callable[[str], None] = print):
+        """초기화 (log: 이동 경로 출력 함수, 나머지는 WatchlistNavigator와 동일)"""
+        super().__init__(driver_getter, waiter, app_package, ready_locator, tap_path, recover, deep_link_url,
+                         activity, state_path)
+        self.log = log
+
+    async def _current_activity(self) -> Optional[str]:
+        try:
+            return await self.driver.current_activity()
+        except AsyncWebDriverError:
+            return None
+
+    async def _open_deep_link(self) -> None:
+        await self.driver.execute_script("mobile: deepLink", {'url': self.deep_link_url, 'package': self.app_package})
+
+    async def _open_activity(self) -> None:
+        await self.driver.execute_script("mobile: startActivity", {
+            'component': f"{self.app_package}/{self.activity}",
+            'stop': False,
+        })
+
+    async def _try_direct(self, name: str, open_screen: Callable) -> bool:
+        """직접 이동 한 가지 시도 - 관심목록 행이 DIRECT_TIMEOUT 안에 보이면 True"""
+        try:
+            await open_screen()
+        except AsyncWebDriverError as e:
+            self.log(f"{name} 이동 실패: {e.msg}")
+            return False
+        await self.waiter.wait_for_locator(self.ready_locator, self.DIRECT_TIMEOUT)
+        if not self.waiter.last_ready:
+            self.log(f"{name} 이동 후 관심목록이 보이지 않음")
+        return self.waiter.last_ready
+
+    async def _learn_activity(self, start_activity: Optional[str]) -> None:
+        """탭 경로로 연 관심목록이 별도 activity이면 다음 실행을 위해 기억"""
+        activity_value = await self._current_activity()
+        if activity_value and activity_value != start_activity and activity_value != self.activity:
+            self.activity = activity_value
+            self._save_state()
+            self.log(f"관심목록 activity 기억: {activity_value}")
+
+    async def open(self) -> str:
+        """관심목록 화면으로 이동 후 사용한 경로(DEEP_LINK/ACTIVITY/TAP) 반환"""
+        started_value = time.monotonic()
+        start_activity_value = await self._current_activity() if self.state_path is not None else None
+        path_value = self.TAP
+        direct_tried_value = bool(self.deep_link_url or self.activity)
+
+        if self.deep_link_url and await self._try_direct(self.DEEP_LINK, self._open_deep_link):
+            path_value = self.DEEP_LINK
+        elif self.activity and await self._try_direct(self.ACTIVITY, self._open_activity):
+            path_value = self.ACTIVITY
+        else:
+            if self.activity and self._learned_activity:
+                # 기억한 activity가 더 이상 관심목록이 아님 - 잊고 탭 경로에서 다시 배움
+                self.activity = None
+                self._save_state()
+            if direct_tried_value and self.recover is not None:
+                await self.recover()
+            await self.tap_path()
+            if self.state_path is not None:
+                await self._learn_activity(start_activity_value)
+
+        self.last_path = path_value
+        self.last_seconds = time.monotonic() - started_value
+        self.paths[path_value] = self.paths.get(path_value, 0) + 1
+        self.log(f"관심목록 이동 경로: {path_value} ({self.last_seconds:.1f}초)")
+        return path_value
+
+
+class AsyncDeviceFlow:
+    """비동기 봇 공통 부분 (세션, 화면 대기, 화면 크기, 스와이프)"""
+
+    def __init__(self, session: AsyncAppiumSession):
+        """초기화"""
+        self.session = session
+        self.device_name = session.device_name
+        self.waiter = AsyncSettleWaiter(lambda: self.driver)
+        self._screen_size = None
+
+    @property
+    def driver(self) -> AsyncAppiumDriver:
+        return self.session.driver
+
+    def log(self, message: str) -> None:
+        """디바이스 이름을 붙여 출력 (여러 디바이스 출력이 섞이므로)"""
+        print(f"[{self.device_name}] {message}")
+
+    async def get_screen_size(self) -> Dict[str, int]:
+        """화면 크기 가져오기 (세션마다 한 번만 조회)"""
+        if self._screen_size is None:
+            try:
+                self._screen_size = await self.driver.window_size()
+            except Exception:
+                return dict(ScrollEngine.DEFAULT_SCREEN_SIZE)
+        return self._screen_size
+
+    async def swipe(self, start_ratio: float, end_ratio: float, hold: bool = False) -> None:
+        """화면 높이 비율로 세로 스와이프 (hold: 놓기 전에 멈춰서 관성 스크롤 방지)"""
+        screen_size_value = await self.get_screen_size()
+        x_value = screen_size_value["width"] // 2
+        actions_value = [
+            {'type': 'pointerMove', 'duration': 0, 'x': x_value, 'y': int(screen_size_value["height"] * start_ratio)},
+            {'type': 'pointerDown', 'button': 0},
+            {'type': 'pointerMove', 'duration': 250, 'x': x_value, 'y': int(screen_size_value["height"] * end_ratio)},
+        ]
+        if hold:
+            actions_value.append({'type': 'pause', 'duration': 200})
+        await self.driver.perform_actions(actions_value + [{'type': 'pointerUp', 'button': 0}])
+
+
+class AsyncCarrotLikeBot(AsyncDeviceFlow):
+    """CarrotLikeBot의 비동기 버전 - 한 이벤트 루프에서 여러 디바이스를 동시에 처리"""
+
+    COMPOSE_VIEW_BASE = CarrotLikeBot.COMPOSE_VIEW_BASE
+    POST_LIST_XPATH = CarrotLikeBot.POST_LIST_XPATH
+    TOAST_SUCCESS_XPATH = CarrotLikeBot.TOAST_SUCCESS_XPATH
+    DETAIL_BUTTON_TEXT = CarrotLikeBot.DETAIL_BUTTON_TEXT
+
+    DEFAULT_TIMEOUT = CarrotLikeBot.DEFAULT_TIMEOUT
+    TOAST_TIMEOUT = CarrotLikeBot.TOAST_TIMEOUT
+    SCROLL_DELAY = CarrotLikeBot.SCROLL_DELAY
+    PAGE_LOAD_DELAY = CarrotLikeBot.PAGE_LOAD_DELAY
+    EMPTY_REFRESH_LIMIT = CarrotLikeBot.EMPTY_REFRESH_LIMIT
+
+    def __init__(self, session: AsyncAppiumSession, known_titles: Optional[List[str]] = None,
+                 journal: Optional[RunJournal] = None, adaptive: bool = False, background_confirm: bool = False):
+        """초기화 (session: AsyncAppiumSession, known_titles/journal/adaptive/background_confirm은 CarrotLikeBot과 동일)"""
+        super().__init__(session)
+        self.layout = DetailLayoutClassifier(self.COMPOSE_VIEW_BASE, self.DETAIL_BUTTON_TEXT)
+        self.recovery = AsyncRecoveryManager(session, self.waiter.wait_until_stable, log=self.log)
+        # 좌표 캐시 키에 쓰는 화면 크기 (stream()이 시작할 때 조회)
+        self.tapper = AsyncCoordinateTapper(lambda: self.driver,
+                                            lambda: self._screen_size or ScrollEngine.DEFAULT_SCREEN_SIZE)
+        self.journal = journal
+        self.feed = AsyncFeedCursor(lambda: self.driver, self.POST_LIST_XPATH, known_titles, tapper=self.tapper)
+        self._post_retries = 0
+        self._post_crashes = 0
+        self._toast_missed = False
+        # 새 세션으로 복구해 피드 대기열의 element를 더 쓸 수 없음
+        self._session_replaced = False
+        # crash 복구 후 실패해 한 번 더 열기로 한 게시물 키
+        self._crash_requeued = set()
+        self.stats = {
+            'liked_posts_titles': [],
+            'liked_posts_count': 0,
+            'failed_posts': [],
+            'processed_posts_count': 0
+        }
+        self.pacing = PacingController.for_bot(self, log=self.log) if adaptive else None
+        self.background_confirm = background_confirm
+
+    async def _wait_for_element(self, by: str, value: str, timeout: float) -> Optional[str]:
+        """element가 나타날 때까지 폴링 (없으면 None)"""
+        deadline_value = time.monotonic() + timeout
+        interval_value = AsyncSettleWaiter.INITIAL_INTERVAL
+        while True:
+            element_id_value = await self.driver.find_element(by, value)
+            if element_id_value is not None or time.monotonic() >= deadline_value:
+                return element_id_value
+            await asyncio.sleep(interval_value)
+            interval_value = min(interval_value * AsyncSettleWaiter.BACKOFF_FACTOR, AsyncSettleWaiter.MAX_INTERVAL)
+
+    async def _recover(self, error: Exception) -> None:
+        """CarrotLikeBot._recover와 같음 (stale이 아니면 crash로 집계, 새 세션이면 피드 대기열을 다시 가져오게 표시)"""
+        if self.recovery.classify(error) not in (None, RecoveryManager.STALE):
+            self._post_crashes += 1
+        if await self.recovery.recover(error) not in (RecoveryManager.REFIND, RecoveryManager.PROBE):
+            self._session_replaced = True
+
+    async def _with_recovery(self, action: Callable, retries: int = 2, retry_action: Optional[Callable] = None):
+        """CarrotLikeBot._with_recovery와 같음 (action/retry_action은 인자 없는 코루틴 함수)"""
+        for attempt in range(retries + 1):
+            try:
+                return await (action() if attempt == 0 or retry_action is None else retry_action())
+            except Exception as e:
+                if attempt == retries or self.recovery.classify(e) is None:
+                    raise
+                self.log(f"WebDriver 명령 실패 — 복구 시도 ({attempt+1}/{retries})")
+                self._post_retries += 1
+                await self._recover(e)
+
+    async def safe_click(self, locator_value: str, by: str = By.XPATH, retries: int = 2) -> None:
+        """특정 locator 클릭 시도 (stale 요소는 다시 찾고, crash는 단계별 복구 후 재시도)"""
+        timeout_value = self.DEFAULT_TIMEOUT
+        for attempt in range(retries + 1):
+            try:
+                element_id_value = await self._wait_for_element(by, locator_value, timeout_value)
+                if element_id_value is None:
+                    raise asyncio.TimeoutError(f"요소를 찾지 못함: {locator_value}")
+                await self.driver.click(element_id_value)
+                return
+            except asyncio.TimeoutError:
+                raise
+            except Exception as e:
+                if attempt == retries or self.recovery.classify(e) is None:
+                    raise
+                self._post_retries += 1
+                await self._recover(e)
+                # 복구 직후에는 화면이 늦게 뜰 수 있으므로 더 기다림
+                timeout_value = self.DEFAULT_TIMEOUT * 2
+
+    async def _open_post(self, post: AsyncFeedPost) -> None:
+        """CarrotLikeBot._open_post와 같음 (복구 후에는 피드로 돌아가 같은 키의 행을 다시 찾아 클릭)"""
+        async def reopen():
+            await self.session.return_to((By.XPATH, self.POST_LIST_XPATH))
+            post.element_id = await self.feed.find_element(post.key)
+            if post.element_id is None:
+                raise AsyncWebDriverError("no such element", f"피드에서 게시물을 다시 찾지 못함: {post.key}")
+            await self.driver.click(post.element_id)
+
+        await self._with_recovery(post.click, retry_action=reopen)
+
+    async def _refresh_feed(self) -> int:
+        """피드 행 다시 읽기 - crash는 복구 후 재시도 (CarrotLikeBot에서는 safe_find_elements가 맡음)"""
+        return await self._with_recovery(self.feed.refresh)
+
+    async def _back_to_feed(self) -> None:
+        """CarrotLikeBot._back_to_feed와 같음 (복구 후에는 피드가 보일 때까지만 뒤로 감)"""
+        await self._with_recovery(lambda: self.driver.back(),
+                                  retry_action=lambda: self.session.return_to((By.XPATH, self.POST_LIST_XPATH)))
+        await self._wait_for_feed()
+
+    async def _check_toast_message(self) -> bool:
+        """토스트 메시지 확인"""
+        try:
+            return await self._wait_for_element(By.XPATH, self.TOAST_SUCCESS_XPATH, self.TOAST_TIMEOUT) is not None
+        except Exception:
+            return False
+
+    async def _capture_snapshot(self) -> Optional[PageSnapshot]:
+        """현재 화면 스냅샷 (화면 안정화 확인에 쓴 page_source가 있으면 재사용)"""
+        try:
+            return parse_page_source(self.waiter.consume_page_source()
+                                     or await self._with_recovery(lambda: self.driver.page_source()))
+        except AsyncWebDriverError:
+            return None
+
+    async def _click_like_locator(self, layout: Dict) -> Tuple[str, str]:
+        """좋아요 버튼 클릭 후 사용한 locator 반환 (같은 레이아웃이면 기억한 좌표로 탭, 기억한 locator가 실패하면
+        XPath로 폴백)"""
+        if await self.tapper.tap_cached(layout['variant'], layout['like_signature'], layout['like_bounds']):
+            return layout['like_locator']
+        by_value, locator_value = layout['like_locator']
+        try:
+            await self.safe_click(locator_value, by_value)
+        except asyncio.TimeoutError:
+            if by_value == By.XPATH:
+                raise
+            self.log("기억한 좋아요 버튼 locator 실패 — XPath로 재시도")
+            self.layout.forget(layout['variant'])
+            by_value, locator_value = By.XPATH, layout['fallback_like_xpath']
+            await self.safe_click(locator_value, by_value)
+        return by_value, locator_value
+
+    async def _confirm_like(self, like_locator: Tuple[str, str]) -> Dict:
+        """ToastWatcher와 같은 방식으로 좋아요 확인 (버튼 상태 한 번, 이후 토스트) - 피드로 돌아가는 동안 task로 실행"""
+        started_value = time.monotonic()
+        result_value = {'confirmed': False, 'source': None, 'text': None}
+        try:
+            element_id_value = await self.driver.find_element(*like_locator)
+            if element_id_value is not None:
+                attributes_value = {name: await self.driver.attribute(element_id_value, name)
+                                    for name in ("checkable", "checked", "selected")}
+                if toggle_state(attributes_value.get):
+                    result_value.update(confirmed=True, source=ToastWatcher.STATE)
+        except AsyncWebDriverError:
+            pass  # 버튼을 읽기 전에 피드로 돌아가 stale이 됨 - 토스트로 확인
+        try:
+            if not result_value['confirmed']:
+                toast_id_value = await self._wait_for_element(
+                    By.XPATH, self.TOAST_SUCCESS_XPATH, max(self.TOAST_TIMEOUT - (time.monotonic() - started_value), 0))
+                if toast_id_value is not None:
+                    result_value.update(confirmed=True, source=ToastWatcher.TOAST,
+                                        text=await self.driver.attribute(toast_id_value, "text"))
+        except AsyncWebDriverError:
+            pass
+        result_value['seconds'] = time.monotonic() - started_value
+        return result_value
+
+    def _record_like(self, post_title: str, is_new_like: bool) -> str:
+        """좋아요 결과를 stats에 반영하고 RunJournal 결과 반환"""
+        if is_new_like:
+            self.stats['liked_posts_count'] += 1
+            self.stats['liked_posts_titles'].append(post_title)
+            self.log(f"새로운 관심 추가 성공! (총 {self.stats['liked_posts_count']}개)")
+            return RunJournal.LIKED
+        self.log("관심 상태 유지됨 (카운트 안함)")
+        return RunJournal.KEPT
+
+    async def click_like_button(self, layout: Dict) -> bool:
+        """좋아요 버튼 클릭 및 관심 추가 확인 (새로 추가된 경우 True)"""
+        by_value, locator_value = await self._click_like_locator(layout)
+
+        if await self._check_toast_message():
+            self.log("관심 추가 성공 감지됨")
+            return True
+
+        self.log("관심 추가 문구 감지 실패 — 재시도 중...")
+        self._toast_missed = True
+        # 좌표 탭이 빗나갔을 수 있으므로 다음 게시물은 locator로 클릭하며 다시 기억
+        self.tapper.forget(layout['variant'])
+        self._post_retries += 1
+        try:
+            await self.safe_click(locator_value, by_value)
+            await asyncio.sleep(1)
+            if await self._check_toast_message():
+                self.log("재클릭으로 관심 추가 성공")
+            else:
+                self.log("재클릭 후에도 관심 추가 문구 감지 실패")
+        except Exception:
+            self.log("재클릭 실패")
+        return False
+
+    async def _wait_for_feed(self) -> None:
+        """피드 게시물 목록이 나타날 때까지 대기 (최대 PAGE_LOAD_DELAY)"""
+        await self.waiter.wait_for_locator((By.XPATH, self.POST_LIST_XPATH), self.PAGE_LOAD_DELAY)
+
+    async def process_post(self, post: AsyncFeedPost, index: int) -> Dict:
+        """개별 게시물 처리 - CarrotLikeBot.process_post와 같은 형식(title, outcome, retries, crashes,
+        toast_missed, confirmation, timings) 반환"""
+        post_title_value = None
+        outcome_value = RunJournal.ERROR
+        timings_value = {}
+        pending_value = None
+        confirmation_value = None
+        self._post_retries = 0
+        self._post_crashes = 0
+        self._toast_missed = False
+        phase_started_value = time.monotonic()
+        try:
+            self.log(f"--- 게시물 {index+1} 처리 중 ---")
+            self.stats['processed_posts_count'] += 1
+            await self._open_post(post)
+            await self.waiter.wait_until_stable(self.PAGE_LOAD_DELAY)
+            timings_value['open'] = time.monotonic() - phase_started_value
+            phase_started_value = time.monotonic()
+
+            snapshot_value = await self._capture_snapshot()
+            if snapshot_value is None:
+                raise AsyncWebDriverError("no such window", "상세 화면 스냅샷 실패")
+            layout_value = self.layout.classify(snapshot_value)
+            if not layout_value['title']:
+                # 자리표시 제목으로 좋아요를 기록하지 않음
+                raise RuntimeError("제목을 읽지 못해 좋아요하지 않음")
+            post_title_value = normalize_title(layout_value['title'])
+            self.log(f"게시물 제목: {post_title_value}")
+
+            try:
+                # 백그라운드 확인은 버튼 상태를 알 때만 (CarrotLikeBot.process_post와 같음)
+                if not self.background_confirm or layout_value['like_state'] is None:
+                    outcome_value = self._record_like(post_title_value, await self.click_like_button(layout_value))
+                elif layout_value['like_state']:
+                    self.log("이미 관심 추가된 게시물 — 클릭하지 않음")
+                    outcome_value = self._record_like(post_title_value, False)
+                else:
+                    # 확인은 task로 진행하고 바로 피드로 돌아감 (결과는 돌아온 뒤 반영)
+                    pending_value = asyncio.ensure_future(self._confirm_like(await self._click_like_locator(layout_value)))
+            except Exception as like_error:
+                self.stats['failed_posts'].append(post_title_value)
+                self.log(f"관심 추가 실패: {post_title_value} - {like_error}")
+                outcome_value = RunJournal.FAILED
+            timings_value['like'] = time.monotonic() - phase_started_value
+            phase_started_value = time.monotonic()
+
+            await self._back_to_feed()
+            timings_value['back'] = time.monotonic() - phase_started_value
+
+            if pending_value is not None:
+                phase_started_value = time.monotonic()
+                confirmation_value = await pending_value
+                pending_value = None
+                timings_value['confirm'] = time.monotonic() - phase_started_value
+                if confirmation_value['confirmed']:
+                    outcome_value = self._record_like(post_title_value, True)
+                else:
+                    self.log("관심 추가 확인 실패 (토스트/버튼 상태 없음)")
+                    self._toast_missed = True
+                    self.tapper.forget(layout_value['variant'])
+                    # 관심 추가되지 않은 버튼을 눌렀으므로 확인되지 않으면 유지가 아니라 실패
+                    self.stats['failed_posts'].append(post_title_value)
+                    outcome_value = RunJournal.FAILED
+
+        except Exception as post_error:
+            self.log(f"게시물 {index+1} 처리 중 오류: {post_error}")
+            if pending_value is not None:
+                pending_value.cancel()
+            try:
+                # 게시물을 열기 전에 실패했을 수 있으므로 피드가 보일 때까지만 뒤로 감
+                await self._with_recovery(lambda: self.session.return_to((By.XPATH, self.POST_LIST_XPATH)))
+                await self._wait_for_feed()
+            except Exception as back_error:
+                self.log(f"피드로 돌아가지 못함: {back_error}")
+
+        return {'title': post_title_value, 'outcome': outcome_value, 'retries': self._post_retries,
+                'crashes': self._post_crashes, 'toast_missed': self._toast_missed,
+                'confirmation': confirmation_value, 'timings': timings_value}
+
+    async def _advance_feed(self, enable_scroll: bool) -> bool:
+        """현재 위치의 게시물을 모두 처리했을 때 피드를 갱신하고 새 게시물이 있는지 반환"""
+        if not enable_scroll:
+            return False
+        for _ in range(self.EMPTY_REFRESH_LIMIT):
+            try:
+                await self._with_recovery(lambda: self.swipe(0.25, 0.75))
+            except Exception as e:
+                self.log(f"위로 스크롤 중 오류: {e}")
+            await self.waiter.wait_until_stable(self.SCROLL_DELAY)
+            await self._wait_for_feed()
+            if await self._refresh_feed() > 0:
+                return True
+        self.log("더 이상 로드할 게시물이 없습니다.")
+        return False
+
+    def get_results(self) -> Dict:
+        """결과 데이터 반환 (CarrotLikeBot.get_results와 같은 형식)"""
+        results_value = {
+            'liked_count': self.stats['liked_posts_count'],
+            'liked_titles': self.stats['liked_posts_titles'],
+            'failed_posts': self.stats['failed_posts'],
+            'processed_count': self.stats['processed_posts_count']
+        }
+        if self.pacing is not None:
+            results_value['pacing'] = self.pacing.get_report()
+        if self.recovery.incidents:
+            results_value['recovery'] = self.recovery.get_report()
+        return results_value
+
+    async def stream(self, max_posts: int = 10, enable_scroll: bool = True,
+                     max_failures: Optional[int] = None) -> AsyncIterator[Dict]:
+        """CarrotLikeBot.stream()의 비동기 버전 (async for로 소비, 세션은 호출한 쪽에서 종료)"""
+        failures_value = 0
+        try:
+            if self.journal is not None:
+                self.journal.reset()
+            await self.session.start()
+            await self.get_screen_size()
+
+            processed_count_value = 0
+            if self.pacing is not None:
+                self.pacing.apply(self)
+                self.pacing.start()
+            await self._refresh_feed()
+            while self.stats['liked_posts_count'] < max_posts:
+                post_value = self.feed.next_post()
+                if post_value is None:
+                    if not await self._advance_feed(enable_scroll):
+                        break
+                    continue
+
+                self.feed.mark_seen(post_value.key)
+                started_value = time.monotonic()
+                post_result_value = await self.process_post(post_value, processed_count_value)
+                seconds_value = time.monotonic() - started_value
+
+                # crash를 복구한 뒤 실패한 게시물은 기록하지 않고 한 번 더 열 수 있도록 되돌림
+                requeue_value = post_result_value['outcome'] == RunJournal.ERROR and post_result_value['crashes'] > 0 \
+                    and post_value.key not in self._crash_requeued
+                if requeue_value:
+                    self.log(f"crash 복구 후 실패한 게시물은 다시 처리: {post_value.key.splitlines()[0]}")
+                    self._crash_requeued.add(post_value.key)
+                    self.feed.unmark_seen(post_value.key)
+                    self.stats['processed_posts_count'] -= 1
+                if self._session_replaced or requeue_value:
+                    # 새 세션에서는 대기열의 element를 쓸 수 없으므로 현재 화면의 행을 다시 가져옴
+                    self._session_replaced = False
+                    await self._refresh_feed()
+                if requeue_value:
+                    continue
+                if self.journal is not None:
+                    # 저널은 기록마다 fsync하므로 이벤트 루프(다른 디바이스)를 막지 않도록 스레드 풀에서 기록
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self.journal.append, post_value.key, post_result_value['title'], post_result_value['outcome'])
+                if self.pacing is not None:
+                    post_result_value['pacing'] = self.pacing.observe(
+                        seconds_value, post_result_value['crashes'], post_result_value['toast_missed'])
+                    self.pacing.apply(self)
+
+                yield dict(post_result_value, index=processed_count_value, key=post_value.key,
+                           seconds=seconds_value, time=time.time())
+                processed_count_value += 1
+
+                if post_result_value['outcome'] in (RunJournal.FAILED, RunJournal.ERROR):
+                    failures_value += 1
+                    if max_failures is not None and failures_value >= max_failures:
+                        self.log(f"실패 {failures_value}개 도달 - 조기 종료")
+                        break
+
+        finally:
+            if self.journal is not None:
+                self.journal.close()
+            self.session.metrics.dump()
+
+    async def run(self, max_posts: int = 10, enable_scroll: bool = True, max_failures: Optional[int] = None,
+                  event_sink: Optional[JsonlEventSink] = None) -> Dict:
+        """메인 실행 함수 (세션은 호출한 쪽에서 종료, event_sink: 게시물 이벤트 기록)"""
+        try:
+            async for event in self.stream(max_posts, enable_scroll, max_failures):
+                if event_sink is not None:
+                    event_sink.write(event, self.device_name)
+        except Exception as e:
+            self.log(f"실행 중 오류 발생: {e}")
+
+        return self.get_results()
+
+
+class AsyncCarrotProfileReader(AsyncDeviceFlow):
+    """CarrotProfileReader의 비동기 버전 (스냅샷 모드)"""
+
+    WATCHLIST_ROW_XPATH = CarrotProfileReader.WATCHLIST_ROW_XPATH
+    NAVIGATION_PROFILE_XPATH = CarrotProfileReader.NAVIGATION_PROFILE_XPATH
+    WATCHLIST_SECTION_XPATH = "//android.widget.TextView[@text='관심목록']"
+    SNAPSHOT_TIMEOUT = CarrotProfileReader.SNAPSHOT_TIMEOUT
+    SNAPSHOT_POLL_INTERVAL = CarrotProfileReader.SNAPSHOT_POLL_INTERVAL
+
+    def __init__(self, session: AsyncAppiumSession, watchlist_deep_link: Optional[str] = None,
+                 watchlist_activity: Optional[str] = None):
+        """초기화 (watchlist_deep_link/watchlist_activity: CarrotProfileReader와 동일)"""
+        super().__init__(session)
+        self.scroller = ScrollEngine(lambda: None)  # 행 경계 거리 계산(page_distance)만 사용
+        self.navigator = AsyncWatchlistNavigator(
+            lambda: self.driver, self.waiter, session.config.desired_caps["appium:appPackage"],
+            (By.XPATH, self.WATCHLIST_ROW_XPATH), self.open_watchlist_by_tap,
+            recover=lambda: self.session.return_to((By.XPATH, self.NAVIGATION_PROFILE_XPATH)),
+            deep_link_url=watchlist_deep_link, activity=watchlist_activity, log=self.log,
+        )
+        self._last_snapshot = None
+
+    async def open_watchlist(self) -> str:
+        """관심목록 화면으로 이동 (딥링크/activity로 바로 이동, 안 되면 탭 경로) - 사용한 경로 반환"""
+        return await self.navigator.open()
+
+    async def open_watchlist_by_tap(self) -> None:
+        """프로필 화면을 거쳐 관심목록 화면으로 이동"""
+        await self.driver.click(await self.driver.find_element(By.XPATH, self.NAVIGATION_PROFILE_XPATH))
+        await self.waiter.wait_until_stable(2)
+        await self.swipe(0.3, 0.2)
+        await self.waiter.wait_until_stable(1)
+        await self.driver.click(await self.driver.find_element(By.XPATH, self.WATCHLIST_SECTION_XPATH))
+        self.log("관심목록 섹션 클릭 완료")
+        await self.waiter.wait_for_locator((By.XPATH, self.WATCHLIST_ROW_XPATH), 5)
+
+    async def _wait_for_snapshot(self) -> Optional[PageSnapshot]:
+        """관심목록 행이 나타날 때까지 page_source 스냅샷 대기"""
+        deadline_value = time.monotonic() + self.SNAPSHOT_TIMEOUT
+        page_source_value = self.waiter.consume_page_source()
+        while True:
+            snapshot_value = parse_page_source(page_source_value or await self.driver.page_source())
+            page_source_value = None
+            if snapshot_value is not None and snapshot_value.watchlist_rows():
+                return snapshot_value
+            if time.monotonic() >= deadline_value:
+                return None
+            await asyncio.sleep(self.SNAPSHOT_POLL_INTERVAL)
+
+    async def scroll_to_next_page(self) -> bool:
+        """행 경계 기준으로 한 페이지 스크롤 - 더 스크롤할 수 없다고 확인되면 False"""
+        page_value = self.scroller.page_distance(self._last_snapshot, self.WATCHLIST_ROW_XPATH) \
+            if self._last_snapshot is not None else None
+        if page_value is None:
+            await self.swipe(0.6, 0.2)
+            await self.waiter.wait_until_stable(2)
+            return True
+
+        (left_value, top_value, width_value, height_value), distance_value = page_value
+        try:
+            can_scroll_more_value = bool(await self.driver.execute_script("mobile: scrollGesture", {
+                'left': left_value, 'top': top_value, 'width': width_value, 'height': height_value,
+                'direction': 'down', 'percent': min(distance_value / height_value, 1.0),
+            }))
+        except AsyncWebDriverError:
+            screen_height_value = (await self.get_screen_size())["height"]
+            start_y_value = top_value + height_value - 1
+            await self.swipe(start_y_value / screen_height_value,
+                             max(top_value, start_y_value - distance_value) / screen_height_value, hold=True)
+            can_scroll_more_value = True
+        await self.waiter.wait_until_stable(3)
+        return can_scroll_more_value
+
+    async def get_liked_posts_from_profile(self, max_scrolls: Optional[int] = None) -> List[str]:
+        """관심목록의 모든 게시물 제목 수집 (종료 조건은 CarrotProfileReader와 동일)"""
+        collected_titles_value = []
+        seen_titles_value = TitleIndex()
+        end_detector_value = EndOfListDetector(max_scrolls=max_scrolls or EndOfListDetector.MAX_SCROLLS)
+        last_page_value = False
+        try:
+            await self.open_watchlist()
+            while True:
+                snapshot_value = await self._wait_for_snapshot()
+                self._last_snapshot = snapshot_value
+                current_titles = snapshot_value.extract_watchlist_titles() if snapshot_value is not None else []
+
+                reached_end_value = bool(current_titles) and current_titles[-1] is False
+                new_titles_found = 0
+                for title in current_titles:
+                    if title is not False and seen_titles_value.add(title):
+                        collected_titles_value.append(title)
+                        new_titles_found += 1
+                self.log(f"새로 발견된 제목: {new_titles_found}개 (전체 {len(collected_titles_value)}개)")
+
+                screen_hash_value = hashlib.blake2b(snapshot_value.page_source.encode("utf-8"), digest_size=16).hexdigest() \
+                    if snapshot_value is not None else None
+                end_detector_value.observe(new_titles_found, screen_hash_value)
+                if reached_end_value or last_page_value or end_detector_value.stalled:
+                    self.log("관심목록 끝 도달 - 수집 종료")
+                    break
+                if end_detector_value.capped:
+                    self.log(f"스크롤 상한 {end_detector_value.max_scrolls}회 도달 - 수집 중단")
+                    break
+
+                last_page_value = not await self.scroll_to_next_page()
+                end_detector_value.scrolled()
+
+        except Exception as e:
+            self.log(f"프로필 확인 중 오류: {e}")
+        return collected_titles_value
+
+    async def run(self, max_scrolls: Optional[int] = None) -> List[str]:
+        """메인 실행 함수 (세션은 호출한 쪽에서 종료)"""
+        await self.session.start()
+        try:
+            return await self.get_liked_posts_from_profile(max_scrolls)
+        finally:
+            self.session.metrics.dump()
+
+
+async def run_device_async(device: Dict, pool: AsyncConnectionPool, max_posts: int = 10,
+                           enable_scroll: bool = True, max_failures: Optional[int] = None,
+                           event_sink: Optional[JsonlEventSink] = None) -> Dict:
+    """디바이스 한 대에서 비동기 좋아요 봇 실행 (carrot_runner.run_device와 같은 형식)"""
+    session_value = AsyncAppiumSession.for_device(device, pool)
+    bot = AsyncCarrotLikeBot(session_value, known_titles=load_known_titles(device.get('index')),
+                             adaptive=device.get('adaptive', False),
+                             background_confirm=device.get('background_confirm', False))
+
+    started_value = time.monotonic()
+    try:
+        results_value = await bot.run(max_posts, enable_scroll, max_failures, event_sink)
+    finally:
+        await session_value.quit()
+    elapsed_value = time.monotonic() - started_value
+
+    return {
+        'udid': device['udid'],
+        'results': results_value,
+        'elapsed_seconds': elapsed_value,
+        'posts_per_minute': results_value['liked_count'] / elapsed_value * 60 if elapsed_value else 0.0,
+    }
+
+
+async def run_devices_async(inventory: List[Dict], max_posts: int = 10, enable_scroll: bool = True,
+                            max_failures: Optional[int] = None, event_sink: Optional[JsonlEventSink] = None) -> Dict:
+    """모든 디바이스를 한 이벤트 루프에서 동시에 실행 (서버별 keep-alive 연결 공유, 이벤트는 한 파일에 모음)"""
+    started_value = time.monotonic()
+    async with AsyncConnectionPool() as pool:
+        outcomes_value = await asyncio.gather(
+            *[run_device_async(device, pool, max_posts, enable_scroll, max_failures, event_sink) for device in inventory],
+            return_exceptions=True,
+        )
+
+    device_reports_value = []
+    for device, outcome in zip(inventory, outcomes_value):
+        if isinstance(outcome, Exception):
+            print(f"[{device['udid']}] 실행 실패: {outcome}")
+            outcome = {
+                'udid': device['udid'],
+                'results': {'liked_count': 0, 'liked_titles': [], 'failed_posts': [], 'processed_count': 0},
+                'elapsed_seconds': 0.0,
+                'posts_per_minute': 0.0,
+                'error': str(outcome),
+            }
+        device_reports_value.append(outcome)
+    return merge_results(device_reports_value, time.monotonic() - started_value)
+
+
+async def read_watchlists_async(inventory: List[Dict], max_scrolls: Optional[int] = None) -> Dict[str, List[str]]:
+    """모든 디바이스의 관심목록을 동시에 읽기 - {udid: 제목 목록}"""
+    async with AsyncConnectionPool() as pool:
+        async def read_device(device: Dict) -> List[str]:
+            session_value = AsyncAppiumSession.for_device(device, pool)
+            try:
+                reader_value = AsyncCarrotProfileReader(session_value, device.get('watchlist_deep_link'),
+                                                        device.get('watchlist_activity'))
+                return await reader_value.run(max_scrolls)
+            finally:
+                await session_value.quit()
+
+        outcomes_value = await asyncio.gather(*[read_device(device) for device in inventory], return_exceptions=True)
+
+    watchlists_value = {}
+    for device, outcome in zip(inventory, outcomes_value):
+        if isinstance(outcome, Exception):
+            print(f"[{device['udid']}] 관심목록 읽기 실패: {outcome}")
+            outcome = []
+        watchlists_value[device['udid']] = outcome
+    return watchlists_value
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="한 이벤트 루프에서 여러 디바이스 동시 실행")
+    parser.add_argument("inventory", help="디바이스 목록 JSON 파일 (carrot_runner와 같은 형식)")
+    parser.add_argument("--max-posts", type=int, default=10)
+    parser.add_argument("--no-scroll", action="store_true")
+    parser.add_argument("--watchlist", action="store_true", help="좋아요 대신 관심목록 읽기")
+    parser.add_argument("--events", help="게시물마다 이벤트를 기록할 JSONL 파일")
+    parser.add_argument("--max-failures", type=int, help="디바이스별 실패가 이 개수가 되면 해당 디바이스 조기 종료")
+    args = parser.parse_args()
+
+    inventory_value = load_inventory(args.inventory)
+    if args.watchlist:
+        watchlists_value = asyncio.run(read_watchlists_async(inventory_value))
+        for udid, titles in watchlists_value.items():
+            print(f"[{udid}] 관심목록 {len(titles)}개")
+        return watchlists_value
+
+    event_sink = JsonlEventSink(args.events) if args.events else None
+    try:
+        report = asyncio.run(run_devices_async(inventory_value, args.max_posts, not args.no_scroll,
+                                               args.max_failures, event_sink))
+    finally:
+        if event_sink is not None:
+            event_sink.close()
+    print_report(report)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+from carrot import verify_likes
+from carrot_like import CarrotLikeBot
+from carrot_metrics import CommandMetrics
+from carrot_read_like import CarrotProfileReader
+from carrot_replay import ReplayServer
+from carrot_session import PERFORMANCE_PROFILES, AppiumSession
+from typing import Callable, Dict, List, Optional
+import argparse
+import time
+
+
+def measure(metrics: CommandMetrics, func: Callable, repeat: int = 3) -> Dict:
+    """func를 repeat번 실행하여 화면당 명령 수와 소요 시간, 명령별 평균 지연 측정 (세션 메트릭의 증가분)"""
+    before_value = metrics.command_counts()
+    before_seconds_value = metrics.command_seconds()
+    durations_value = []
+    for _ in range(repeat):
+        started_value = time.perf_counter()
+        func()
+        durations_value.append(time.perf_counter() - started_value)
+
+    commands_value = {command: count - before_value.get(command, 0)
+                      for command, count in metrics.command_counts().items()
+                      if count != before_value.get(command, 0)}
+    seconds_value = metrics.command_seconds()
+    return {
+        'calls_per_screen': sum(commands_value.values()) / repeat,
+        'seconds_per_screen': sum(durations_value) / repeat,
+        'commands': commands_value,
+        'latency': {command: (seconds_value[command] - before_seconds_value.get(command, 0.0)) / count
+                    for command, count in commands_value.items()},
+    }
+
+
+def benchmark_title_extraction(reader: CarrotProfileReader, repeat: int = 3) -> Dict:
+    """현재 관심목록 화면에서 기존 방식과 스냅샷 방식 비교"""
+    return {
+        'textviews': measure(reader.session.metrics, reader.extract_titles_from_textviews, repeat),
+        'snapshot': measure(reader.session.metrics, reader.extract_titles_from_snapshot, repeat),
+    }
+
+
+def benchmark_profiles(reader: CarrotProfileReader, profiles: Optional[List[str]] = None, repeat: int = 3) -> Dict:
+    """현재 관심목록 화면에서 성능 프로필마다 같은 명령 흐름을 실행하여 명령별 지연 비교
+
+    흐름: 기존 방식 제목 추출 + 스냅샷 제목 추출 + UiSelector 검색. 'titles'가 프로필마다 다르면
+    그 프로필에서 XPath가 깨진 것
+    """
+    titles_value = {}
+
+    def scripted_flow() -> None:
+        titles_value['textviews'] = len(reader.extract_titles_from_textviews())
+        titles_value['snapshot'] = len(reader.extract_titles_from_snapshot())
+        reader.driver.find_elements(*reader.navigator.ready_locator)
+
+    original_profile_value = reader.session.profile
+    report_value = {}
+    try:
+        for profile in profiles or list(PERFORMANCE_PROFILES):
+            reader.session.apply_profile(profile)
+            report_value[profile] = measure(reader.session.metrics, scripted_flow, repeat)
+            report_value[profile]['titles'] = dict(titles_value)
+    finally:
+        reader.session.apply_profile(original_profile_value or "safe")
+    return report_value
+
+
+def benchmark_replay(record_path: str, target: str = "like", max_posts: int = 10,
+                     latency: Optional[float] = None, latency_scale: float = 1.0) -> Dict:
+    """기록 파일을 재생 서버로 띄워 run()/verify_likes()를 오프라인으로 측정"""
+    with ReplayServer(record_path, latency=latency, latency_scale=latency_scale) as server:
+        session_value = AppiumSession(server_url=server.url)
+        processed_value = 0
+        started_value = time.perf_counter()
+        try:
+            if target == "like":
+                processed_value = CarrotLikeBot(session=session_value).run(max_posts=max_posts)['processed_count']
+            elif target == "read":
+                CarrotProfileReader(session=session_value).run()
+            else:
+                verify_likes(session=session_value)
+        finally:
+            session_value.quit()
+        elapsed_value = time.perf_counter() - started_value
+
+    return {
+        'target': target,
+        'posts': processed_value,
+        'elapsed_seconds': elapsed_value,
+        'commands': server.state.served,
+        'missed_commands': server.state.missed,
+        'commands_per_post': server.state.served / processed_value if processed_value else None,
+        'seconds_per_post': elapsed_value / processed_value if processed_value else None,
+        'command_counts': server.state.commands,
+    }
+
+
+def print_replay_report(report: Dict) -> None:
+    """재생 벤치마크 결과 출력"""
+    print(f"\n=== 재생 벤치마크 결과 ({report['target']}) ===")
+    print(f"소요 시간: {report['elapsed_seconds']:.2f}초, 명령 {report['commands']}회 (기록 없음 {report['missed_commands']}회)")
+    if report['posts']:
+        print(f"게시물 {report['posts']}개: 게시물당 명령 {report['commands_per_post']:.1f}회, "
+              f"게시물당 {report['seconds_per_post']:.2f}초")
+    for command, count in sorted(report['command_counts'].items()):
+        print(f"  {command}: {count}")
+
+
+def print_report(report: Dict) -> None:
+    """벤치마크 결과 출력"""
+    print(f"\n=== 벤치마크 결과 ===")
+    for name, result in report.items():
+        print(f"[{name}] 화면당 명령 {result['calls_per_screen']:.1f}회, "
+              f"화면당 {result['seconds_per_screen']:.3f}초")
+        if 'titles' in result:
+            print(f"  추출한 제목 수: {result['titles']}")
+        for command, count in sorted(result['commands'].items()):
+            print(f"  {command}: {count}회, 평균 {result['latency'][command] * 1000:.0f}ms")
+
+
+def run_extract_benchmark() -> None:
+    """관심목록 첫 화면에서 제목 추출 방식 비교 (실제 디바이스)"""
+    reader = CarrotProfileReader()
+    try:
+        reader.session.start()
+        reader.open_watchlist()
+        print_report(benchmark_title_extraction(reader))
+    finally:
+        reader.session.quit()
+
+
+def run_profile_benchmark(profiles: Optional[List[str]] = None, repeat: int = 3) -> None:
+    """관심목록 첫 화면에서 성능 프로필별 명령 지연 비교 (실제 디바이스)"""
+    reader = CarrotProfileReader()
+    try:
+        reader.session.start()
+        reader.open_watchlist()
+        print_report(benchmark_profiles(reader, profiles, repeat))
+    finally:
+        reader.session.quit()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="당근마켓 봇 벤치마크")
+    subparsers = parser.add_subparsers(dest="mode")
+    subparsers.add_parser("extract", help="관심목록 제목 추출 방식 비교 (기본값, 실제 디바이스)")
+
+    profiles_parser = subparsers.add_parser("profiles", help="UiAutomator2 성능 프로필별 명령 지연 비교 (실제 디바이스)")
+    profiles_parser.add_argument("names", nargs="*", help=f"비교할 프로필 ({', '.join(PERFORMANCE_PROFILES)} - 생략 시 전체)")
+    profiles_parser.add_argument("--repeat", type=int, default=3)
+
+    replay_parser = subparsers.add_parser("replay", help="기록 파일 재생으로 오프라인 측정")
+    replay_parser.add_argument("path")
+    replay_parser.add_argument("--target", choices=["like", "read", "verify"], default="like")
+    replay_parser.add_argument("--max-posts", type=int, default=10)
+    replay_parser.add_argument("--latency", type=float, default=None, help="고정 지연(초), 생략 시 기록된 지연 사용")
+    replay_parser.add_argument("--latency-scale", type=float, default=1.0)
+
+    args = parser.parse_args()
+    if args.mode == "profiles":
+        unknown_value = [name for name in args.names if name not in PERFORMANCE_PROFILES]
+        if unknown_value:
+            parser.error(f"알 수 없는 성능 프로필: {', '.join(unknown_value)}")
+        run_profile_benchmark(args.names, args.repeat)
+    elif args.mode == "replay":
+        print_replay_report(benchmark_replay(args.path, args.target, args.max_posts, args.latency, args.latency_scale))
+    else:
+        run_extract_benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from typing import Callable, Dict, Optional, Tuple
+import time
+
+
+def toggle_state(get_attribute: Callable[[str], Optional[str]]) -> Optional[bool]:
+    """토글 버튼 상태 판별 - checkable이면 checked, 아니면 selected가 true일 때만 True (알 수 없으면 None)
+
+    get_attribute: 스냅샷 노드의 node.get 또는 요소의 element.get_attribute
+    """
+    if get_attribute("checkable") == "true":
+        return get_attribute("checked") == "true"
+    if get_attribute("selected") == "true":
+        return True
+    return None
+
+
+class ToastWatcher:
+    """좋아요 확인(버튼 상태 또는 토스트)을 백그라운드 스레드에서 기다리는 감시자
+
+    클릭 직후 watch()를 부르면 확인은 스레드에서 진행되고, 봇은 바로 피드로 돌아갈 수 있음.
+    토스트는 화면을 떠나도 잠시 남아 있으므로 뒤로 가는 동안에도 감지됨
+    """
+
+    # 폴링 간격 (ScreenSettleWaiter와 같은 backoff)
+    INITIAL_INTERVAL = 0.1
+    BACKOFF_FACTOR = 1.5
+    MAX_INTERVAL = 0.5
+
+    # 확인 경로
+    STATE = "state"
+    TOAST = "toast"
+
+    def __init__(self, driver_getter: Callable, toast_xpath: str):
+        """초기화 (driver_getter: 현재 driver를 반환하는 함수, toast_xpath: 성공 토스트 XPath -
+        UiAutomator2는 토스트를 XPath 검색으로만 찾을 수 있음)"""
+        self.driver_getter = driver_getter
+        self.toast_xpath = toast_xpath
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="toast-watcher")
+        self.stats = {'watched': 0, self.STATE: 0, self.TOAST: 0, 'missed': 0, 'seconds': 0.0}
+
+    @property
+    def driver(self):
+        return self.driver_getter()
+
+    def _button_selected(self, button_locator: Tuple[str, str]) -> bool:
+        """좋아요 버튼이 선택 상태로 바뀌었는지 (상세 화면을 이미 떠났으면 False)"""
+        elements_value = self.driver.find_elements(*button_locator)
+        if not elements_value:
+            return False
+        return toggle_state(elements_value[0].get_attribute) is True
+
+    def _toast_text(self) -> Optional[str]:
+        elements_value = self.driver.find_elements(By.XPATH, self.toast_xpath)
+        if not elements_value:
+            return None
+        return elements_value[0].get_attribute("text") or ""
+
+    def _watch(self, timeout: float, button_locator: Optional[Tuple[str, str]]) -> Dict:
+        started_value = time.monotonic()
+        deadline_value = started_value + timeout
+        interval_value = self.INITIAL_INTERVAL
+        result_value = {'confirmed': False, 'source': None, 'text': None}
+
+        while True:
+            try:
+                if button_locator is not None and self._button_selected(button_locator):
+                    result_value.update(confirmed=True, source=self.STATE)
+                    break
+                # 버튼 상태는 첫 확인에서만 봄 (대부분 바로 뒤로 가므로 이후엔 토스트만 남음)
+                button_locator = None
+                text_value = self._toast_text()
+                if text_value is not None:
+                    result_value.update(confirmed=True, source=self.TOAST, text=text_value)
+                    break
+            except WebDriverException:
+                pass
+            remaining_value = deadline_value - time.monotonic()
+            if remaining_value <= 0:
+                break
+            time.sleep(min(interval_value, remaining_value))
+            interval_value = min(interval_value * self.BACKOFF_FACTOR, self.MAX_INTERVAL)
+
+        result_value['seconds'] = time.monotonic() - started_value
+        self.stats['seconds'] += result_value['seconds']
+        self.stats[result_value['source'] or 'missed'] += 1
+        return result_value
+
+    def watch(self, timeout: float, button_locator: Optional[Tuple[str, str]] = None) -> Future:
+        """확인 대기 시작 - {'confirmed', 'source'(STATE/TOAST/None), 'text', 'seconds'}를 담을 Future 반환"""
+        self.stats['watched'] += 1
+        return self._executor.submit(self._watch, timeout, button_locator)
+
+    def close(self) -> None:
+        """진행 중인 확인이 끝날 때까지 기다린 뒤 스레드 종료"""
+        self._executor.shutdown(wait=True)
+
+    def print_report(self) -> None:
+        """확인 통계 출력"""
+        print(f"백그라운드 좋아요 확인 {self.stats['watched']}회: 버튼 상태 {self.stats[self.STATE]}회, "
+              f"토스트 {self.stats[self.TOAST]}회, 미확인 {self.stats['missed']}회 "
+              f"(확인에 걸린 시간 {self.stats['seconds']:.1f}초 - 피드 복귀와 병행)")
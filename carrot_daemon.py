@@ -0,0 +1,142 @@
+from carrot_session import PERFORMANCE_PROFILES, AppiumSession
+from selenium.common.exceptions import WebDriverException
+from typing import Dict, Optional
+import argparse
+import json
+import os
+import signal
+import time
+
+
+STATE_PATH = "carrot_session.json"
+
+
+def read_state(path: str = STATE_PATH) -> Optional[Dict]:
+    """데몬 상태 파일 읽기 (없거나 데몬 프로세스가 죽었으면 None)"""
+    try:
+        with open(path, encoding="utf-8") as state_file:
+            state_value = json.load(state_file)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        os.kill(state_value['pid'], 0)
+    except (KeyError, OSError):
+        return None
+    return state_value
+
+
+def client_session(state_path: str = STATE_PATH, device_name: str = AppiumSession.DEFAULT_DEVICE_NAME,
+                   server_url: str = AppiumSession.DEFAULT_SERVER_URL, profile: Optional[str] = None) -> AppiumSession:
+    """데몬이 유지하는 세션에 붙는 AppiumSession (데몬이 없으면 평소처럼 새 세션을 여는 AppiumSession)
+
+    profile을 지정하면 붙은 데몬 세션의 설정도 바뀜 (다음 클라이언트까지 유지)
+    """
+    state_value = read_state(state_path)
+    if state_value is None:
+        print("세션 데몬 없음 — 새 세션으로 시작")
+        return AppiumSession(device_name, server_url, profile=profile)
+    return AppiumSession(state_value['device_name'], state_value['server_url'],
+                         attach_session_id=state_value['session_id'], profile=profile)
+
+
+class SessionDaemon:
+    """UiAutomator2 세션을 계속 열어두고 세션 ID를 상태 파일에 기록하는 데몬"""
+
+    KEEPALIVE_INTERVAL = 30
+
+    def __init__(self, session: Optional[AppiumSession] = None, state_path: str = STATE_PATH,
+                 keepalive_interval: float = KEEPALIVE_INTERVAL):
+        """초기화"""
+        self.session = session or AppiumSession()
+        self.state_path = state_path
+        self.keepalive_interval = keepalive_interval
+        self._running = False
+
+    def _write_state(self) -> None:
+        """상태 파일 기록 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록 교체)"""
+        temp_path_value = self.state_path + ".tmp"
+        with open(temp_path_value, "w", encoding="utf-8") as state_file:
+            json.dump({
+                'pid': os.getpid(),
+                'session_id': self.session.driver.session_id,
+                'device_name': self.session.device_name,
+                'server_url': self.session.server_url,
+                'started': time.time(),
+            }, state_file, ensure_ascii=False)
+        os.replace(temp_path_value, self.state_path)
+        print(f"세션 {self.session.driver.session_id} 상태 저장: {self.state_path}")
+
+    def _remove_state(self) -> None:
+        try:
+            os.remove(self.state_path)
+        except OSError:
+            pass
+
+    def keepalive(self) -> None:
+        """세션이 살아 있는지 확인하고 죽었으면 새로 열어 상태 파일 갱신"""
+        try:
+            self.session.driver.current_activity
+        except WebDriverException as e:
+            print(f"세션 응답 없음 — 재시작: {e.msg}")
+            self.session.restart()
+            self._write_state()
+
+    def stop(self, *args) -> None:
+        """다음 확인 주기에 종료"""
+        self._running = False
+
+    def serve(self) -> None:
+        """세션을 열고 종료 신호를 받을 때까지 유지"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        self._running = True
+        try:
+            self.session.start()
+            self._write_state()
+            next_check_value = time.monotonic() + self.keepalive_interval
+            while self._running:
+                # 종료 신호에 빨리 반응하도록 짧게 나눠 잠
+                time.sleep(min(1.0, self.keepalive_interval))
+                if self._running and time.monotonic() >= next_check_value:
+                    self.keepalive()
+                    next_check_value = time.monotonic() + self.keepalive_interval
+        finally:
+            print("세션 데몬 종료 중...")
+            self._remove_state()
+            self.session.quit()
+
+
+def stop_daemon(state_path: str = STATE_PATH) -> bool:
+    """실행 중인 데몬에 종료 신호 보내기"""
+    state_value = read_state(state_path)
+    if state_value is None:
+        return False
+    os.kill(state_value['pid'], signal.SIGTERM)
+    return True
+
+
+def main():
+    """메인 함수 (serve: 세션 유지, status: 상태 확인, stop: 종료)"""
+    parser = argparse.ArgumentParser(description="UiAutomator2 세션을 유지하는 데몬")
+    parser.add_argument("command", choices=["serve", "status", "stop"])
+    parser.add_argument("--device", default=AppiumSession.DEFAULT_DEVICE_NAME)
+    parser.add_argument("--server-url", default=AppiumSession.DEFAULT_SERVER_URL)
+    parser.add_argument("--state", default=STATE_PATH, help="세션 상태 파일")
+    parser.add_argument("--keepalive", type=float, default=SessionDaemon.KEEPALIVE_INTERVAL, help="세션 확인 간격 (초)")
+    parser.add_argument("--profile", choices=list(PERFORMANCE_PROFILES), help="UiAutomator2 성능 프로필")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        SessionDaemon(AppiumSession(args.device, args.server_url, profile=args.profile), args.state, args.keepalive).serve()
+    elif args.command == "status":
+        state_value = read_state(args.state)
+        print(json.dumps(state_value, ensure_ascii=False) if state_value else "세션 데몬 없음")
+    elif stop_daemon(args.state):
+        print("세션 데몬에 종료 신호 전송")
+    else:
+        print("세션 데몬 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from typing import Dict, Iterator, Optional
+import json
+import os
+
+
+class JsonlEventSink:
+    """CarrotLikeBot.stream()의 게시물 이벤트를 한 줄씩 기록하는 JSONL 파일 (tail -f로 실시간 확인 가능)"""
+
+    DEFAULT_PATH = "carrot_like_events.jsonl"
+
+    def __init__(self, path: str = DEFAULT_PATH, append: bool = False):
+        """초기화 (append: 기존 파일 뒤에 이어 쓰기)"""
+        self.path = path
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+        self.count = 0
+
+    def write(self, event: Dict, device_name: Optional[str] = None) -> None:
+        """이벤트 하나 기록 (읽는 쪽에서 바로 볼 수 있도록 flush)"""
+        if device_name is not None:
+            event = dict(event, device=device_name)
+        self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        """파일 닫기"""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "JsonlEventSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_events(path: str) -> Iterator[Dict]:
+    """기록된 이벤트를 한 줄씩 읽기 (마지막 줄이 잘렸으면 무시)"""
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as events_file:
+        for line in events_file:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
@@ -0,0 +1,132 @@
+from carrot_snapshot import parse_page_source
+from carrot_titles import TitleIndex
+from collections import OrderedDict
+from selenium.common.exceptions import StaleElementReferenceException
+from typing import Callable, Iterable, List, Optional, Tuple
+
+
+def row_title(row) -> Optional[str]:
+    """피드 행 스냅샷 노드의 제목 - 행의 첫 번째 TextView text (content-desc는 "제목, 가격, 동네, 시간"을 쉼표로
+    이어 붙여 제목에 쉼표가 있으면 나눌 수 없으므로 쓰지 않음)"""
+    for text_view in row.iter("android.widget.TextView"):
+        if text_view.get("text"):
+            return text_view.get("text")
+    return None
+
+
+class FeedPost:
+    """피드 행 하나 - 클릭 시 element가 stale이면 같은 키의 행을 다시 찾아 클릭"""
+
+    def __init__(self, key: str, element, cursor: "FeedCursor"):
+        """초기화"""
+        self.key = key
+        self.element = element
+        self.cursor = cursor
+
+    def click(self) -> None:
+        try:
+            self.element.click()
+        except StaleElementReferenceException:
+            # 뒤로 가기 후 흔히 생김 - 스냅샷 한 번으로 같은 키의 행을 찾아 좌표로 탭 (가능하면)
+            if self.cursor.tap_row(self.key):
+                return
+            self.element = self.cursor.find_element(self.key)
+            if self.element is None:
+                raise
+            self.element.click()
+
+
+class FeedCursor:
+    """content-desc를 키로 처리한 게시물을 기억하며 스크롤 위치마다 행 목록을 한 번만 가져오는 커서"""
+
+    SEEN_LIMIT = 2000
+
+    def __init__(self, driver_getter: Callable, row_xpath: str, fetch_elements: Callable[[], List],
+                 known_titles: Optional[Iterable[str]] = None, seen_limit: int = SEEN_LIMIT, tapper=None):
+        """초기화 (known_titles: 이미 관심목록에 있는 제목 - 열지 않고 건너뜀, tapper: stale 행을 좌표로 탭할
+        CoordinateTapper)"""
+        self.driver_getter = driver_getter
+        self.tapper = tapper
+        self.row_xpath = row_xpath
+        self.fetch_elements = fetch_elements
+        self.known_titles = TitleIndex(known_titles or ())
+        self.seen_limit = seen_limit
+        self._seen = OrderedDict()
+        self._pending: List[FeedPost] = []
+        self.skipped_known = 0
+
+    def _rows(self, elements: List) -> List[Tuple[str, Optional[str]]]:
+        """행 (키, 제목) 목록 - page_source 한 번으로 읽고, 개수가 맞지 않으면 행마다 속성 조회 (제목은 None)"""
+        snapshot_value = parse_page_source(self.driver_getter().page_source)
+        if snapshot_value is not None:
+            rows_value = [(row.get("content-desc"), row_title(row)) for row in snapshot_value.xpath(self.row_xpath)]
+            if len(rows_value) == len(elements):
+                return rows_value
+        return [(element.get_attribute("content-desc"), None) for element in elements]
+
+    def is_known(self, key: str, title: Optional[str]) -> bool:
+        """이미 관심목록에 있는 게시물이면 처리한 것으로 기록하고 True (제목을 모르면 열어서 확인)"""
+        if title is None or title not in self.known_titles:
+            return False
+        self.skipped_known += 1
+        self.mark_seen(key)
+        print(f"이미 관심목록에 있는 게시물 건너뜀: {title}")
+        return True
+
+    def refresh(self) -> int:
+        """현재 스크롤 위치의 행을 읽어 아직 처리하지 않은 게시물만 대기열에 넣음 - 새 게시물 수 반환"""
+        elements_value = self.fetch_elements()
+        rows_value = self._rows(elements_value) if elements_value else []
+
+        self._pending = []
+        for (key, title), element in zip(rows_value, elements_value):
+            if not key or key in self._seen or self.is_known(key, title):
+                continue
+            self._pending.append(FeedPost(key, element, self))
+        return len(self._pending)
+
+    def next_post(self) -> Optional[FeedPost]:
+        """다음 처리할 게시물 (현재 위치에 남은 게시물이 없으면 None)"""
+        while self._pending:
+            post_value = self._pending.pop(0)
+            if post_value.key not in self._seen:
+                return post_value
+        return None
+
+    def mark_seen(self, key: str) -> None:
+        """처리한 게시물 기록 (오래된 것부터 SEEN_LIMIT개까지만 유지)"""
+        self._seen[key] = True
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.seen_limit:
+            self._seen.popitem(last=False)
+
+    def unmark_seen(self, key: str) -> None:
+        """처리하지 않은 게시물로 되돌림 - 다음 refresh()에서 다시 대기열에 들어감"""
+        self._seen.pop(key, None)
+
+    def add_known_title(self, title: str) -> None:
+        """관심목록에 추가된 제목 등록"""
+        self.known_titles.add(title)
+
+    def tap_row(self, key: str) -> bool:
+        """현재 화면 스냅샷에서 같은 키의 행을 찾아 좌표로 탭 (tapper가 없거나 행이 없으면 False)"""
+        if self.tapper is None:
+            return False
+        snapshot_value = parse_page_source(self.driver_getter().page_source)
+        if snapshot_value is None:
+            return False
+        for row in snapshot_value.xpath(self.row_xpath):
+            if row.get("content-desc") == key:
+                return self.tapper.tap_node(row)
+        return False
+
+    def find_element(self, key: str):
+        """같은 키의 행 element 다시 찾기"""
+        elements_value = self.fetch_elements()
+        for (row_key, _), element in zip(self._rows(elements_value), elements_value):
+            if row_key == key:
+                return element
+        return None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._seen
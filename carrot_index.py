@@ -0,0 +1,81 @@
+from typing import Iterable, Iterator, List, Optional
+import sqlite3
+import time
+
+
+class WatchlistIndex:
+    """이전에 본 관심목록 제목을 저장하는 로컬 SQLite 색인"""
+
+    DEFAULT_PATH = "watchlist_index.sqlite3"
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """초기화"""
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS watchlist ("
+            " title TEXT PRIMARY KEY,"
+            " first_seen REAL NOT NULL,"
+            " last_seen REAL NOT NULL)"
+        )
+        self.connection.commit()
+
+    def __contains__(self, title: str) -> bool:
+        return self.contains(title)
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM watchlist").fetchone()[0]
+
+    def contains(self, title: str) -> bool:
+        """이미 색인된 제목인지 확인"""
+        row_value = self.connection.execute(
+            "SELECT 1 FROM watchlist WHERE title = ?", (title,)
+        ).fetchone()
+        return row_value is not None
+
+    def upsert(self, titles: Iterable[str], seen_at: Optional[float] = None) -> int:
+        """제목들을 기록 (새 제목은 first_seen, 기존 제목은 last_seen만 갱신) - 새로 추가된 개수 반환"""
+        seen_at_value = seen_at if seen_at is not None else time.time()
+        before_value = len(self)
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO watchlist (title, first_seen, last_seen) VALUES (?, ?, ?) "
+                "ON CONFLICT(title) DO UPDATE SET last_seen = excluded.last_seen",
+                ((title, seen_at_value, seen_at_value) for title in titles),
+            )
+        return len(self) - before_value
+
+    def prune(self, seen_before: float) -> int:
+        """seen_before 이후로 보이지 않은 제목 삭제 (전체 읽기 후 관심 해제된 항목 정리)"""
+        with self.connection:
+            cursor_value = self.connection.execute(
+                "DELETE FROM watchlist WHERE last_seen < ?", (seen_before,)
+            )
+        return cursor_value.rowcount
+
+    def titles(self) -> List[str]:
+        """색인된 제목 목록 (최근에 본 순)"""
+        return list(self.iter_titles())
+
+    def iter_titles(self) -> Iterator[str]:
+        """색인된 제목을 커서로 하나씩 읽기 (큰 색인을 메모리에 올리지 않음)"""
+        for row in self.connection.execute("SELECT title FROM watchlist ORDER BY last_seen DESC, first_seen DESC"):
+            yield row[0]
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        self.connection.close()
+
+    def __enter__(self) -> "WatchlistIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_known_titles(path: Optional[str]) -> Optional[List[str]]:
+    """색인 파일의 제목 목록 (좋아요 봇 known_titles용 - 경로가 없으면 None)"""
+    if not path:
+        return None
+    with WatchlistIndex(path) as index:
+        return index.titles()
@@ -0,0 +1,72 @@
+from typing import Dict, List, Optional
+import json
+import os
+import time
+
+
+class RunJournal:
+    """처리한 게시물을 한 줄씩 기록하는 추가 전용 JSONL 저널 (중단 후 이어서 실행용)"""
+
+    DEFAULT_PATH = "carrot_like_journal.jsonl"
+
+    # 게시물 처리 결과
+    LIKED = "liked"
+    KEPT = "kept"
+    FAILED = "failed"
+    ERROR = "error"
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """초기화"""
+        self.path = path
+        self._file = None
+
+    def _open(self):
+        if self._file is None:
+            # crash로 마지막 줄이 잘린 경우 새 줄에서 이어 씀 (여러 바이트 문자 중간에서 잘렸을 수 있으므로 바이트로 확인)
+            ends_with_newline_value = True
+            if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+                with open(self.path, "rb") as journal_file:
+                    journal_file.seek(-1, os.SEEK_END)
+                    ends_with_newline_value = journal_file.read(1) == b"\n"
+            self._file = open(self.path, "a", encoding="utf-8")
+            if not ends_with_newline_value:
+                self._file.write("\n")
+        return self._file
+
+    def reset(self) -> None:
+        """새 실행 시작 - 이전 기록 삭제"""
+        self.close()
+        with open(self.path, "w", encoding="utf-8"):
+            pass
+
+    def append(self, key: str, title: Optional[str], outcome: str) -> None:
+        """게시물 하나의 처리 결과 기록 (crash에 대비해 바로 디스크에 씀)"""
+        journal_file = self._open()
+        journal_file.write(json.dumps({
+            'key': key,
+            'title': title,
+            'outcome': outcome,
+            'time': time.time(),
+        }, ensure_ascii=False) + "\n")
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+
+    def load(self) -> List[Dict]:
+        """기록된 항목 읽기 (마지막 줄이 잘렸으면 무시 - 여러 바이트 문자 중간에서 잘린 줄 포함)"""
+        if not os.path.exists(self.path):
+            return []
+
+        entries_value = []
+        with open(self.path, "rb") as journal_file:
+            for line in journal_file:
+                try:
+                    entries_value.append(json.loads(line.decode("utf-8")))
+                except ValueError:  # UnicodeDecodeError 포함
+                    continue
+        return entries_value
+
+    def close(self) -> None:
+        """파일 닫기"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
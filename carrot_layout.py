@@ -0,0 +1,82 @@
+from appium.webdriver.common.appiumby import AppiumBy
+from carrot_confirm import toggle_state
+from carrot_snapshot import PageSnapshot, parse_bounds
+from carrot_tap import layout_signature
+from selenium.webdriver.common.by import By
+from typing import Dict, Tuple
+
+
+class DetailLayoutClassifier:
+    """게시물 상세 화면 레이아웃 변형을 스냅샷 한 번으로 판별하고 변형별 locator를 기억"""
+
+    def __init__(self, compose_view_base: str, detail_button_text: str):
+        """초기화"""
+        self.compose_view_base = compose_view_base
+        self.detail_button_text = detail_button_text
+        self.title_base_xpath = f'{compose_view_base}/android.view.View[1]'
+        self._like_locators: Dict[Tuple[bool, bool], Tuple[str, str]] = {}
+
+    def like_button_xpath(self, has_detail_button: bool) -> str:
+        """좋아요 버튼 XPath (자세히 보기 버튼이 있으면 한 칸 아래)"""
+        if has_detail_button:
+            return f'{self.compose_view_base}/android.view.View[5]/android.view.View[1]'
+        return f'{self.compose_view_base}/android.view.View[4]/android.view.View[1]'
+
+    def detail_button_locator(self) -> Tuple[str, str]:
+        """자세히 보기 버튼을 한 번에 찾는 UiSelector"""
+        return AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().text("{self.detail_button_text}")'
+
+    def _title_node(self, snapshot: PageSnapshot, title_in_view3: bool):
+        if title_in_view3:
+            nodes_value = snapshot.xpath(f'{self.title_base_xpath}/android.view.View[3]/*')
+        else:
+            nodes_value = snapshot.xpath(f'({self.title_base_xpath}/android.view.View[4]/*)[1]')
+        return nodes_value[0] if nodes_value else None
+
+    def _derive_like_locator(self, snapshot: PageSnapshot, has_detail_button: bool) -> Tuple[str, str]:
+        """좋아요 버튼 노드의 속성으로 깊은 XPath보다 빠른 locator 선택"""
+        xpath_value = self.like_button_xpath(has_detail_button)
+        nodes_value = snapshot.xpath(xpath_value)
+        if not nodes_value:
+            return By.XPATH, xpath_value
+
+        node_value = nodes_value[0]
+        # 화면에서 유일한 경우에만 accessibility id / resource-id 사용
+        content_desc_value = node_value.get("content-desc")
+        if content_desc_value and len(snapshot.xpath('//*[@content-desc=$value]', value=content_desc_value)) == 1:
+            return AppiumBy.ACCESSIBILITY_ID, content_desc_value
+
+        resource_id_value = node_value.get("resource-id")
+        if resource_id_value and len(snapshot.xpath('//*[@resource-id=$value]', value=resource_id_value)) == 1:
+            return AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().resourceId("{resource_id_value}")'
+
+        return By.XPATH, xpath_value
+
+    def classify(self, snapshot: PageSnapshot) -> Dict:
+        """레이아웃 변형, 제목, 좋아요 버튼 locator/상태/경계 판별 (추가 Appium 호출 없음)"""
+        has_detail_button_value = bool(snapshot.xpath('//*[@text=$value]', value=self.detail_button_text))
+        title_in_view3_value = len(snapshot.xpath(f'{self.title_base_xpath}/android.view.View[3]/*')) == 1
+        variant_value = (has_detail_button_value, title_in_view3_value)
+
+        if variant_value not in self._like_locators:
+            self._like_locators[variant_value] = self._derive_like_locator(snapshot, has_detail_button_value)
+
+        title_node_value = self._title_node(snapshot, title_in_view3_value)
+        like_nodes_value = snapshot.xpath(self.like_button_xpath(has_detail_button_value))
+        like_node_value = like_nodes_value[0] if like_nodes_value else None
+        return {
+            'variant': variant_value,
+            'title': title_node_value.get("text") if title_node_value is not None else None,
+            'like_locator': self._like_locators[variant_value],
+            'fallback_like_xpath': self.like_button_xpath(has_detail_button_value),
+            # 좋아요 버튼의 현재 상태 (True: 이미 관심 추가됨, None: 화면에 상태가 드러나지 않음)
+            'like_state': toggle_state(like_node_value.get) if like_node_value is not None else None,
+            # 좌표 탭용 좋아요 버튼 경계와 레이아웃 해시 (CoordinateTapper.tap_cached)
+            'like_bounds': parse_bounds(like_node_value.get("bounds")) if like_node_value is not None else None,
+            'like_signature': layout_signature(like_node_value),
+        }
+
+    def forget(self, variant: Tuple[bool, bool]) -> None:
+        """기억한 locator가 더 이상 맞지 않을 때 삭제"""
+        self._like_locators.pop(variant, None)
+
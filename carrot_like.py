@@ -1,15 +1,27 @@
-from appium import webdriver
-from appium.options.android import UiAutomator2Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.common.actions.action_builder import ActionBuilder
-from selenium.webdriver.common.actions.pointer_input import PointerInput
-from selenium.webdriver.common.actions import interaction
-from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from concurrent.futures import Future
+import argparse
 import time
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
+
+from carrot_confirm import ToastWatcher
+from carrot_daemon import client_session
+from carrot_events import JsonlEventSink
+from carrot_feed import FeedCursor, FeedPost
+from carrot_journal import RunJournal
+from carrot_layout import DetailLayoutClassifier
+from carrot_pacing import PacingController
+from carrot_read_like import CarrotProfileReader
+from carrot_recovery import RecoveryManager
+from carrot_scroll import ScrollEngine
+from carrot_session import PERFORMANCE_PROFILES, AppiumSession
+from carrot_snapshot import PageSnapshot, parse_page_source
+from carrot_tap import CoordinateTapper
+from carrot_titles import normalize_title
+from carrot_wait import ScreenSettleWaiter
 
 
 class CarrotLikeBot:
@@ -27,80 +39,71 @@ class CarrotLikeBot:
     SCROLL_DELAY = 1
     PAGE_LOAD_DELAY = 2
     
-    def __init__(self, device_name: str = "R3CN20HAC4A"):
-        """초기화"""
+    # 새 게시물 없이 연속으로 갱신할 수 있는 최대 횟수
+    EMPTY_REFRESH_LIMIT = 2
+    
+    def __init__(self, device_name: str = AppiumSession.DEFAULT_DEVICE_NAME, session: Optional[AppiumSession] = None,
+                 known_titles: Optional[List[str]] = None, journal: Optional[RunJournal] = None,
+                 adaptive: bool = False, background_confirm: bool = False, verify_batch: Optional[int] = None):
+        """초기화 (session: 다른 봇과 공유할 Appium 세션, known_titles: 열지 않고 건너뛸 관심목록 제목,
+        journal: 처리 결과를 기록할 RunJournal, adaptive: PacingController로 대기/타임아웃 값 자동 조절,
+        background_confirm: 좋아요 확인을 기다리지 않고 피드로 돌아가며 ToastWatcher로 확인,
+        verify_batch: 새 좋아요가 이 개수만큼 쌓일 때마다(그리고 실행 끝에) 관심목록 앞부분에서 반영 여부 확인)"""
         self.device_name = device_name
-        self.driver = None
+        self._owns_session = session is None
+        self.session = session or AppiumSession(device_name)
+        self.waiter = ScreenSettleWaiter(lambda: self.driver)
+        self.scroller = ScrollEngine(lambda: self.driver, self.waiter.wait_until_stable)
+        self.recovery = RecoveryManager(self.session, self.waiter.wait_until_stable)
+        self.tapper = CoordinateTapper(lambda: self.driver, self.scroller.screen_size)
+        self.layout = DetailLayoutClassifier(self.COMPOSE_VIEW_BASE, self.DETAIL_BUTTON_TEXT)
+        self.journal = journal
+        self.feed = FeedCursor(lambda: self.driver, self.POST_LIST_XPATH, self._get_posts_elements, known_titles,
+                               tapper=self.tapper)
         self.stats = {
             'liked_posts_titles': [],
             'liked_posts_count': 0,
-            'failed_posts': []
-        }
-        self._setup_capabilities()
-
-    def _setup_capabilities(self) -> None:
-        """Appium capabilities 설정"""
-        self.desired_caps = {
-            "platformName": "Android",
-            "appium:deviceName": self.device_name,
-            "appium:automationName": "UiAutomator2",
-            "appium:appPackage": "com.towneers.www",
-            "appium:appActivity": ".launcher.LauncherActivity",
-            "appium:noReset": True,
-            "appium:dontStopAppOnReset": False,
-            "appium:newCommandTimeout": 0,
-            "appium:commandTimeouts": 600000,
-            "appium:keepAliveTimeout": 0,
-            "appium:autoGrantPermissions": True,
-            "appium:sessionOverride": True,
-            "appium:clearSystemFiles": False,
-            "appium:enforceAppInstall": False,
+            'failed_posts': [],
+            'processed_posts_count': 0
         }
-        self.options = UiAutomator2Options().load_capabilities(self.desired_caps)
+        self._post_retries = 0
+        self._post_crashes = 0
+        self._toast_missed = False
+        # 새 세션으로 복구해 피드 대기열의 element를 더 쓸 수 없음
+        self._session_replaced = False
+        # crash 복구 후 실패해 한 번 더 열기로 한 게시물 키
+        self._crash_requeued = set()
+        self.pacing = PacingController.for_bot(self) if adaptive else None
+        self.background_confirm = background_confirm
+        self.toast_watcher = None
+        self.verify_batch = verify_batch
+        # 좋아요한 제목 → 관심목록 반영 여부 (None: 아직 확인 안 함)
+        self.verification: Dict[str, Optional[bool]] = {}
+        self._verifier = None
+
+    @property
+    def driver(self):
+        """공유 세션의 현재 driver"""
+        return self.session.driver
 
     def start_driver(self) -> None:
         """Appium driver 시작/재시작"""
-        try:
-            if self.driver:
-                print("Appium 세션 재시작 중...")
-                self.driver.quit()
-        except:
-            pass
-        
-        time.sleep(self.PAGE_LOAD_DELAY)
-        self.driver = webdriver.Remote(command_executor="http://127.0.0.1:4723", options=self.options)
-        print("Appium session 시작/재시작 완료")
+        if self.session.driver is None:
+            self.session.start()
+        else:
+            self.session.restart()
 
     def get_screen_size(self) -> Dict[str, int]:
-        """화면 크기 가져오기"""
-        try:
-            return self.driver.get_window_size()
-        except:
-            return {"width": 1080, "height": 2340}
+        """화면 크기 가져오기 (세션마다 한 번만 조회)"""
+        return self.scroller.screen_size()
 
     def _perform_scroll(self, start_ratio: float, end_ratio: float, direction: str) -> None:
         """스크롤 수행 공통 로직"""
         try:
-            screen_size_value = self.get_screen_size()
-            width_value = screen_size_value["width"]
-            height_value = screen_size_value["height"]
-            
-            start_x_value = width_value // 2
-            start_y_value = int(height_value * start_ratio)
-            end_x_value = width_value // 2
-            end_y_value = int(height_value * end_ratio)
-            
+            start_x_value, start_y_value, end_x_value, end_y_value = self._with_recovery(
+                lambda: self.scroller.swipe(start_ratio, end_ratio, self.SCROLL_DELAY)
+            )
             print(f"{direction} 스크롤: ({start_x_value}, {start_y_value}) → ({end_x_value}, {end_y_value})")
-            
-            actions = ActionChains(self.driver)
-            actions.w3c_actions = ActionBuilder(self.driver, mouse=PointerInput(interaction.POINTER_TOUCH, "touch"))
-            actions.w3c_actions.pointer_action.move_to_location(start_x_value, start_y_value)
-            actions.w3c_actions.pointer_action.pointer_down()
-            actions.w3c_actions.pointer_action.move_to_location(end_x_value, end_y_value)
-            actions.w3c_actions.pointer_action.release()
-            actions.perform()
-            
-            time.sleep(self.SCROLL_DELAY)
             print(f"{direction} 스크롤 완료")
             
         except Exception as e:
@@ -114,36 +117,73 @@ class CarrotLikeBot:
         """화면을 위로 스크롤 (25% → 75%)"""
         self._perform_scroll(start_ratio, end_ratio, "위로")
 
+    def _recover(self, error: Exception) -> None:
+        """RecoveryManager로 단계별 복구 (복구할 수 없는 오류는 다시 발생) - stale이 아니면 crash로 집계"""
+        if self.recovery.classify(error) not in (None, RecoveryManager.STALE):
+            self._post_crashes += 1
+        if self.recovery.recover(error) not in (RecoveryManager.REFIND, RecoveryManager.PROBE):
+            self._session_replaced = True
+
+    def _with_recovery(self, action: Callable, retries: int = 2, retry_action: Optional[Callable] = None):
+        """action 실행 후 결과 반환 - crash/세션 유실은 단계별 복구 후 retry_action(없으면 action)으로 다시 시도
+        (복구할 수 없는 오류는 그대로 발생)"""
+        for attempt in range(retries + 1):
+            try:
+                return action() if attempt == 0 or retry_action is None else retry_action()
+            except Exception as e:
+                if attempt == retries or self.recovery.classify(e) is None:
+                    raise
+                print(f"WebDriver 명령 실패 — 복구 시도 ({attempt+1}/{retries})")
+                self._post_retries += 1
+                self._recover(e)
+
+    def _open_post(self, post: FeedPost) -> None:
+        """게시물 열기 - 복구 후에는 클릭이 반영됐을 수 있으므로 피드로 돌아가 같은 키의 행을 다시 찾아 클릭"""
+        def reopen():
+            self.session.return_to((By.XPATH, self.POST_LIST_XPATH))
+            post.element = self.feed.find_element(post.key)
+            if post.element is None:
+                raise NoSuchElementException(f"피드에서 게시물을 다시 찾지 못함: {post.key}")
+            post.element.click()
+
+        self._with_recovery(post.click, retry_action=reopen)
+
+    def _back_to_feed(self) -> None:
+        """뒤로 가서 피드 대기 - 복구 후에는 back이 반영됐을 수 있으므로 피드가 보일 때까지만 뒤로 감"""
+        self._with_recovery(lambda: self.driver.back(),
+                            retry_action=lambda: self.session.return_to((By.XPATH, self.POST_LIST_XPATH)))
+        self._wait_for_feed()
+
     def safe_find_elements(self, by: By, value: str, retries: int = 2) -> List:
-        """Instrumentation crash 복구 로직이 포함된 find_elements 래퍼"""
+        """UiAutomator2 crash/세션 유실 복구 로직이 포함된 find_elements 래퍼"""
         for attempt in range(retries + 1):
             try:
                 return self.driver.find_elements(by, value)
-            except WebDriverException as e:
-                if "instrumentation process is not running" in str(e):
-                    print(f"UiAutomator2 crash 감지 — 세션 재시작 시도 ({attempt+1}/{retries})")
-                    self.start_driver()
-                else:
+            except Exception as e:
+                if attempt == retries:
                     raise
-        raise RuntimeError("❌ 세션 복구 실패: instrumentation 재시작 불가")
+                print(f"find_elements 실패 — 복구 시도 ({attempt+1}/{retries})")
+                self._recover(e)
 
-    def safe_click(self, xpath_value: str) -> None:
-        """특정 XPath 클릭 시도 (instrumentation crash 감지 및 복구 포함)"""
-        try:
-            element_value = WebDriverWait(self.driver, self.DEFAULT_TIMEOUT).until(
-                EC.presence_of_element_located((By.XPATH, xpath_value))
-            )
-            element_value.click()
-        except WebDriverException as e:
-            if "instrumentation process is not running" in str(e):
-                print("UiAutomator2 crash 감지 — 세션 재시작 중...")
-                self.start_driver()
-                element_value = WebDriverWait(self.driver, self.DEFAULT_TIMEOUT * 2).until(
-                    EC.presence_of_element_located((By.XPATH, xpath_value))
+    def safe_click(self, locator_value: str, by: str = By.XPATH, retries: int = 2):
+        """특정 locator 클릭 시도 후 클릭한 요소 반환 (stale 요소는 다시 찾고, crash는 단계별 복구 후 재시도)"""
+        timeout_value = self.DEFAULT_TIMEOUT
+        for attempt in range(retries + 1):
+            try:
+                element_value = WebDriverWait(self.driver, timeout_value).until(
+                    EC.presence_of_element_located((by, locator_value))
                 )
                 element_value.click()
-            else:
+                return element_value
+            except TimeoutException:
                 raise
+            except Exception as e:
+                if attempt == retries:
+                    raise
+                self._post_retries += 1
+                self._recover(e)
+                # 복구 직후에는 화면이 늦게 뜰 수 있으므로 더 기다림
+                timeout_value = self.DEFAULT_TIMEOUT * 2
 
     def _get_title_xpath(self, base_xpath_value: str) -> str:
         """제목 XPath 결정 로직"""
@@ -155,36 +195,40 @@ class CarrotLikeBot:
         else:
             return f'({base_xpath_value}/android.view.View[4]/*)[1]'
 
-    def get_post_title(self, index: int) -> str:
-        """게시물 제목 가져오기"""
-        base_xpath_value = f'{self.COMPOSE_VIEW_BASE}/android.view.View[1]'
-        
+    def _read_post_title(self, base_xpath_value: str) -> Optional[str]:
+        """제목 요소를 찾아 text 반환 (crash/세션 유실 오류는 그대로 발생)"""
         try:
             title_xpath_value = self._get_title_xpath(base_xpath_value)
             title_element_value = WebDriverWait(self.driver, self.DEFAULT_TIMEOUT).until(
                 EC.presence_of_element_located((By.XPATH, title_xpath_value))
             )
-            return title_element_value.get_attribute("text") or f"제목 불명 #{index+1}"
+            return title_element_value.get_attribute("text")
             
-        except Exception as e:
+        except TimeoutException as e:
             print(f"제목 추출 실패: {e}")
-            try:
-                fallback_xpath_value = f'({base_xpath_value}/android.view.View[4]/*)[1]'
-                title_element_value = WebDriverWait(self.driver, 3).until(
-                    EC.presence_of_element_located((By.XPATH, fallback_xpath_value))
-                )
-                title_text_value = title_element_value.get_attribute("text")
-                print(f"폴백으로 추출된 제목: {title_text_value}")
-                return title_text_value or f"제목 불명 #{index+1}"
-            except:
-                return f"제목 불명 #{index+1}"
+            fallback_xpath_value = f'({base_xpath_value}/android.view.View[4]/*)[1]'
+            title_element_value = WebDriverWait(self.driver, 3).until(
+                EC.presence_of_element_located((By.XPATH, fallback_xpath_value))
+            )
+            title_text_value = title_element_value.get_attribute("text")
+            print(f"폴백으로 추출된 제목: {title_text_value}")
+            return title_text_value
+
+    def get_post_title(self, index: int) -> Optional[str]:
+        """게시물 제목 가져오기 - crash는 복구 후 다시 읽고, 제목을 찾지 못하면 None"""
+        base_xpath_value = f'{self.COMPOSE_VIEW_BASE}/android.view.View[1]'
+        try:
+            return self._with_recovery(lambda: self._read_post_title(base_xpath_value)) or None
+        except WebDriverException as e:
+            if self.recovery.classify(e) is not None:
+                raise
+            print(f"게시물 {index+1} 제목을 찾지 못함: {e}")
+            return None
 
     def _detect_detail_button(self) -> bool:
-        """자세히 보기 버튼 감지"""
+        """자세히 보기 버튼 감지 (UiSelector 한 번으로 확인)"""
         try:
-            detail_elements_value = self.driver.find_elements(By.XPATH, ".//android.widget.TextView")
-            return any(element.get_attribute("text") == self.DETAIL_BUTTON_TEXT 
-                      for element in detail_elements_value)
+            return len(self.driver.find_elements(*self.layout.detail_button_locator())) > 0
         except:
             return False
 
@@ -205,23 +249,56 @@ class CarrotLikeBot:
         except:
             return False
 
-    def click_like_button(self) -> bool:
-        """좋아요 버튼 클릭 및 관심 추가 확인"""
-        like_xpath_value = self._get_like_button_xpath()
-        
+    def _capture_snapshot(self) -> Optional[PageSnapshot]:
+        """현재 화면 스냅샷 (화면 안정화 확인에 쓴 page_source가 있으면 재사용)"""
+        try:
+            return parse_page_source(self.waiter.consume_page_source()
+                                     or self._with_recovery(lambda: self.driver.page_source))
+        except WebDriverException:
+            return None
+
+    def _click_like_locator(self, layout: Optional[Dict]) -> Tuple[str, str]:
+        """좋아요 버튼 클릭 후 사용한 locator 반환 (같은 레이아웃이면 기억한 좌표로 탭, 기억한 locator가 실패하면
+        XPath로 폴백)"""
+        if layout is not None and self.tapper.tap_cached(layout['variant'], layout['like_signature'], layout['like_bounds']):
+            return layout['like_locator']
+        if layout is None:
+            like_locator_value = (By.XPATH, self._get_like_button_xpath())
+            self.safe_click(like_locator_value[1], like_locator_value[0])
+            return like_locator_value
+
+        by_value, locator_value = layout['like_locator']
+        try:
+            self.safe_click(locator_value, by_value)
+            return by_value, locator_value
+        except TimeoutException:
+            if by_value == By.XPATH:
+                raise
+            print(f"기억한 좋아요 버튼 locator 실패 — XPath로 재시도")
+            self.layout.forget(layout['variant'])
+            self.safe_click(layout['fallback_like_xpath'])
+            return By.XPATH, layout['fallback_like_xpath']
+
+    def click_like_button(self, layout: Optional[Dict] = None) -> bool:
+        """좋아요 버튼 클릭 및 관심 추가 확인 (layout: DetailLayoutClassifier.classify 결과)"""
         # 첫 번째 클릭
-        self.safe_click(like_xpath_value)
+        like_by_value, like_locator_value = self._click_like_locator(layout)
         
         if self._check_toast_message():
             print("관심 추가 성공 감지됨")
             return True
         
         print("관심 추가 문구 감지 실패 — 재시도 중...")
+        self._toast_missed = True
+        if layout is not None:
+            # 좌표 탭이 빗나갔을 수 있으므로 다음 게시물은 locator로 클릭하며 다시 기억
+            self.tapper.forget(layout['variant'])
         
         # 재시도
+        self._post_retries += 1
         try:
             print("관심 추가를 위해 다시 클릭...")
-            self.safe_click(like_xpath_value)
+            self.safe_click(like_locator_value, like_by_value)
             time.sleep(1)
             
             if self._check_toast_message():
@@ -234,73 +311,185 @@ class CarrotLikeBot:
             print("재클릭 실패")
             return False
 
-    def process_post(self, post_element, index: int) -> None:
-        """개별 게시물 처리"""
+    def start_like_confirmation(self, layout: Optional[Dict]) -> Optional[Future]:
+        """좋아요 버튼 클릭 후 확인은 ToastWatcher에 넘기고 Future 반환 (이미 관심 추가된 게시물이면
+        클릭하지 않고 None - 다시 누르면 관심 해제됨). layout['like_state']를 알 때만 사용"""
+        if layout['like_state']:
+            print("이미 관심 추가된 게시물 — 클릭하지 않음")
+            return None
+        like_locator_value = self._click_like_locator(layout)
+        return self.toast_watcher.watch(self.TOAST_TIMEOUT, like_locator_value)
+
+    def _record_like(self, post_title: str, is_new_like: bool) -> str:
+        """좋아요 결과를 stats에 반영하고 RunJournal 결과 반환"""
+        if is_new_like:
+            self.stats['liked_posts_count'] += 1
+            self.stats['liked_posts_titles'].append(post_title)
+            if self.verify_batch is not None:
+                self.verification[post_title] = None
+            print(f"새로운 관심 추가 성공! (총 {self.stats['liked_posts_count']}개)")
+            return RunJournal.LIKED
+        print(f"관심 상태 유지됨 (카운트 안함)")
+        return RunJournal.KEPT
+
+    def process_post(self, post_element, index: int) -> Dict:
+        """개별 게시물 처리 - 제목, 처리 결과(RunJournal.LIKED/KEPT/FAILED/ERROR), 재시도 횟수,
+        crash 복구 횟수, 토스트 감지 실패 여부, 백그라운드 확인 결과(confirmation), 단계별 소요 시간
+        (open/like/back, 백그라운드 확인이면 confirm: 피드로 돌아온 뒤 확인을 더 기다린 시간) 반환"""
+        post_title_value = None
+        outcome_value = RunJournal.ERROR
+        timings_value = {}
+        pending_value = None
+        confirmation_value = None
+        self._post_retries = 0
+        self._post_crashes = 0
+        self._toast_missed = False
+        phase_started_value = time.monotonic()
         try:
             print(f"\n--- 게시물 {index+1} 처리 중 ---")
-            post_element.click()
-            time.sleep(self.PAGE_LOAD_DELAY)
+            self.stats['processed_posts_count'] += 1
+            self._open_post(post_element)
+            self.waiter.wait_until_stable(self.PAGE_LOAD_DELAY)
+            timings_value['open'] = time.monotonic() - phase_started_value
+            phase_started_value = time.monotonic()
             
-            post_title_value = self.get_post_title(index)
+            # 스냅샷 한 번으로 레이아웃 변형과 제목 판별 (실패 시 기존 방식)
+            snapshot_value = self._capture_snapshot()
+            layout_value = self.layout.classify(snapshot_value) if snapshot_value is not None else None
+            if layout_value is not None and layout_value['title']:
+                post_title_value = layout_value['title']
+            else:
+                post_title_value = self.get_post_title(index)
+            if post_title_value is None:
+                # 자리표시 제목으로 좋아요를 기록하지 않음
+                raise RuntimeError("제목을 읽지 못해 좋아요하지 않음")
             
-            # 제목에서 "거래완료"나 "예약중" 텍스트 제거
-            if "거래완료" in post_title_value:
-                post_title_value = post_title_value.replace("거래완료", "").strip()
-                print(f"'거래완료' 텍스트 제거됨")
-            if "예약중" in post_title_value:
-                post_title_value = post_title_value.replace("예약중", "").strip()
-                print(f"'예약중' 텍스트 제거됨")
+            # 제목에서 "거래완료"나 "예약중" 텍스트 제거 및 공백 정리
+            normalized_title_value = normalize_title(post_title_value)
+            if normalized_title_value != post_title_value:
+                print(f"제목 정규화: '{post_title_value}' → '{normalized_title_value}'")
+                post_title_value = normalized_title_value
             
             print(f"게시물 제목: {post_title_value}")
             
             try:
-                is_new_like_value = self.click_like_button()
-                
-                if is_new_like_value:
-                    self.stats['liked_posts_count'] += 1
-                    self.stats['liked_posts_titles'].append(post_title_value)
-                    print(f"새로운 관심 추가 성공! (총 {self.stats['liked_posts_count']}개)")
+                # 백그라운드 확인은 버튼 상태를 알 때만 (모르면 이미 관심 추가된 게시물을 눌러 해제했을 수 있으므로
+                # 토스트 확인과 재클릭까지 기다림)
+                if self.toast_watcher is not None and layout_value is not None and layout_value['like_state'] is not None:
+                    # 확인은 스레드에서 진행하고 바로 피드로 돌아감 (결과는 돌아온 뒤 반영)
+                    pending_value = self.start_like_confirmation(layout_value)
+                    if pending_value is None:
+                        outcome_value = self._record_like(post_title_value, False)
                 else:
-                    print(f"관심 상태 유지됨 (카운트 안함)")
+                    outcome_value = self._record_like(post_title_value, self.click_like_button(layout_value))
                 
             except Exception as like_error:
                 self.stats['failed_posts'].append(post_title_value)
                 print(f"관심 추가 실패: {post_title_value} - {like_error}")
+                outcome_value = RunJournal.FAILED
+            timings_value['like'] = time.monotonic() - phase_started_value
+            phase_started_value = time.monotonic()
             
-            self.driver.back()
-            time.sleep(self.PAGE_LOAD_DELAY)
+            self._back_to_feed()
+            timings_value['back'] = time.monotonic() - phase_started_value
+
+            if pending_value is not None:
+                phase_started_value = time.monotonic()
+                confirmation_value = pending_value.result()
+                timings_value['confirm'] = time.monotonic() - phase_started_value
+                if confirmation_value['confirmed']:
+                    print(f"관심 추가 확인됨 ({confirmation_value['source']}, {confirmation_value['seconds']:.1f}초)")
+                    outcome_value = self._record_like(post_title_value, True)
+                else:
+                    print("관심 추가 확인 실패 (토스트/버튼 상태 없음)")
+                    self._toast_missed = True
+                    self.tapper.forget(layout_value['variant'])
+                    # 관심 추가되지 않은 버튼을 눌렀으므로 확인되지 않으면 유지가 아니라 실패
+                    self.stats['failed_posts'].append(post_title_value)
+                    outcome_value = RunJournal.FAILED
             
         except Exception as post_error:
             print(f"게시물 {index+1} 처리 중 오류: {post_error}")
             try:
-                self.driver.back()
-                time.sleep(self.PAGE_LOAD_DELAY)
-            except:
-                pass
+                # 게시물을 열기 전에 실패했을 수 있으므로 피드가 보일 때까지만 뒤로 감
+                self._with_recovery(lambda: self.session.return_to((By.XPATH, self.POST_LIST_XPATH)))
+                self._wait_for_feed()
+            except Exception as back_error:
+                print(f"피드로 돌아가지 못함: {back_error}")
+
+        return {'title': post_title_value, 'outcome': outcome_value, 'retries': self._post_retries,
+                'crashes': self._post_crashes, 'toast_missed': self._toast_missed,
+                'confirmation': confirmation_value, 'timings': timings_value}
+
+    def _restore_from_journal(self) -> None:
+        """저널을 읽어 stats와 처리한 게시물 목록 복원 (관심목록에 들어간 게시물은 제목도 등록 - content-desc의
+        시간/관심 수가 바뀌어 키가 달라져도 다시 열지 않음)"""
+        entries_value = self.journal.load()
+        self.feed.seen_limit = max(self.feed.seen_limit, len(entries_value))
+        for entry in entries_value:
+            self.feed.mark_seen(entry['key'])
+            if entry['outcome'] in (RunJournal.LIKED, RunJournal.KEPT) and entry['title']:
+                self.feed.add_known_title(entry['title'])
+            self.stats['processed_posts_count'] += 1
+            if entry['outcome'] == RunJournal.LIKED:
+                self.stats['liked_posts_count'] += 1
+                self.stats['liked_posts_titles'].append(entry['title'])
+            elif entry['outcome'] == RunJournal.FAILED:
+                self.stats['failed_posts'].append(entry['title'])
+        print(f"저널에서 {len(entries_value)}개 게시물 복원 (좋아요 {self.stats['liked_posts_count']}개)")
+
+    def _pending_verification(self) -> List[str]:
+        return [title for title, verified in self.verification.items() if verified is None]
+
+    def verify_inline(self) -> None:
+        """아직 확인하지 않은 좋아요가 관심목록 맨 위에 반영됐는지 확인하고 피드로 돌아감
+
+        전체 관심목록을 읽는 대신 CarrotProfileReader.find_missing_in_head로 확인할 개수만큼만 읽음.
+        확인 중 오류가 나면 해당 제목은 다음 확인에서 다시 시도
+        """
+        pending_value = self._pending_verification()
+        if not pending_value:
+            return
+        print(f"\n=== 좋아요 {len(pending_value)}개 관심목록 반영 확인 ===")
+        if self._verifier is None:
+            self._verifier = CarrotProfileReader(session=self.session)
+        try:
+            missing_value = set(self._verifier.find_missing_in_head(pending_value))
+        except Exception as e:
+            print(f"관심목록 확인 실패 - 다음 확인에서 다시 시도: {e}")
+        else:
+            for title in pending_value:
+                self.verification[title] = title not in missing_value
+            if missing_value:
+                print(f"관심목록에 반영되지 않은 제목: {sorted(missing_value)}")
+
+        if not self.session.return_to((By.XPATH, self.POST_LIST_XPATH)):
+            print("피드 화면으로 돌아가지 못함")
+        self.feed.refresh()
+
+    def _wait_for_feed(self) -> None:
+        """피드 게시물 목록이 나타날 때까지 대기 (최대 PAGE_LOAD_DELAY)"""
+        self.waiter.wait_for_locator((By.XPATH, self.POST_LIST_XPATH), self.PAGE_LOAD_DELAY)
 
     def _get_posts_elements(self) -> List:
         """현재 화면의 게시물 요소들 가져오기"""
         return self.safe_find_elements(By.XPATH, self.POST_LIST_XPATH)
 
-    def _handle_scroll_if_needed(self, current_index_value: int, post_pages_value: List, enable_scroll: bool) -> Tuple[bool, int, List]:
-        """스크롤이 필요한 경우 처리"""
-        if current_index_value >= len(post_pages_value):
-            if enable_scroll:
-                print(f"더 많은 게시물을 보기 위해 페이지 갱신")
-                self.scroll_up()
-                time.sleep(self.PAGE_LOAD_DELAY)
-                current_index_value = 0
-                
-                post_pages_value = self._get_posts_elements()
-                
-                if current_index_value >= len(post_pages_value):
-                    print("더 이상 로드할 게시물이 없습니다.")
-                    return False, current_index_value, post_pages_value
-            else:
-                print("스크롤이 비활성화되어 있어 더 이상 진행할 수 없습니다.")
-                return False, current_index_value, post_pages_value
-        
-        return True, current_index_value, post_pages_value
+    def _advance_feed(self, enable_scroll: bool) -> bool:
+        """현재 위치의 게시물을 모두 처리했을 때 피드를 갱신하고 새 게시물이 있는지 반환"""
+        if not enable_scroll:
+            print("스크롤이 비활성화되어 있어 더 이상 진행할 수 없습니다.")
+            return False
+
+        for _ in range(self.EMPTY_REFRESH_LIMIT):
+            print(f"더 많은 게시물을 보기 위해 페이지 갱신")
+            self.scroll_up()
+            self._wait_for_feed()
+            if self.feed.refresh() > 0:
+                return True
+
+        print("더 이상 로드할 게시물이 없습니다.")
+        return False
 
     def print_results(self) -> None:
         """결과 출력"""
@@ -315,37 +504,136 @@ class CarrotLikeBot:
             for i, title in enumerate(self.stats['failed_posts'], 1):
                 print(f"  {i}. {title}")
 
+        self.waiter.print_report()
+        self.recovery.print_report()
+        self.tapper.print_report()
+        if self.toast_watcher is not None:
+            self.toast_watcher.print_report()
+        if self.pacing is not None:
+            self.pacing.print_report()
+        if self.verify_batch is not None:
+            verified_count_value = sum(1 for verified in self.verification.values() if verified)
+            print(f"관심목록 반영 확인: {verified_count_value}/{len(self.verification)}개")
+        self.session.metrics.print_summary()
+
     def get_results(self) -> Dict:
-        """결과 데이터 반환"""
-        return {
+        """결과 데이터 반환 (속도 자동 조절 중이면 'pacing': PacingController.get_report(), 즉시 검증 중이면
+        'verified_titles'/'unverified_titles': 관심목록 반영이 확인된/확인되지 않은 좋아요 제목 포함)"""
+        results_value = {
             'liked_count': self.stats['liked_posts_count'],
             'liked_titles': self.stats['liked_posts_titles'],
-            'failed_posts': self.stats['failed_posts']
+            'failed_posts': self.stats['failed_posts'],
+            'processed_count': self.stats['processed_posts_count']
         }
+        if self.pacing is not None:
+            results_value['pacing'] = self.pacing.get_report()
+        if self.recovery.incidents:
+            results_value['recovery'] = self.recovery.get_report()
+        if self.verify_batch is not None:
+            results_value['verified_titles'] = [title for title, verified in self.verification.items() if verified]
+            results_value['unverified_titles'] = [title for title, verified in self.verification.items() if not verified]
+        return results_value
+
+    def stream(self, max_posts: int = 10, enable_scroll: bool = True, resume: bool = False,
+               max_failures: Optional[int] = None) -> Iterator[Dict]:
+        """게시물을 하나 처리할 때마다 이벤트를 내보내는 제너레이터
 
-    def run(self, max_posts: int = 10, enable_scroll: bool = True) -> Dict:
-        """메인 실행 함수"""
+        이벤트: index, key, title, outcome, retries, crashes, toast_missed, timings, seconds, time
+        (속도 자동 조절 중이면 조절 후 값 pacing 포함). verify_batch를 지정했으면 게시물 사이와 마지막에
+        verify_inline()으로 관심목록 반영을 확인.
+        실패(FAILED/ERROR)가 max_failures개가 되면 max_posts 전에 멈춤. 소비하는 쪽에서 중간에 멈춰도
+        (break, close()) 저널과 세션은 정리됨
+        """
+        failures_value = 0
         try:
-            self.start_driver()
+            if self.journal is not None:
+                if resume:
+                    self._restore_from_journal()
+                else:
+                    self.journal.reset()
+
+            self.session.start()
+            if self.session.attached:
+                # 데몬 세션은 이전 실행이 남긴 화면에 있을 수 있으므로 피드로 돌아감
+                self.session.return_to((By.XPATH, self.POST_LIST_XPATH))
             
-            processed_count_value = 0
-            current_index_value = 0
+            processed_count_value = self.stats['processed_posts_count']
+            if self.background_confirm:
+                self.toast_watcher = ToastWatcher(lambda: self.driver, self.TOAST_SUCCESS_XPATH)
+            if self.pacing is not None:
+                self.pacing.apply(self)
+                self.pacing.start()
+            self.feed.refresh()
+            print(f"\n=== 게시물들 처리 시작 ===")
             
             while self.stats['liked_posts_count'] < max_posts:
-                post_pages_value = self._get_posts_elements()
-                print(f"\n=== 게시물들 처리 시작 ===")
-
-                can_continue, current_index_value, post_pages_value = self._handle_scroll_if_needed(
-                    current_index_value, post_pages_value, enable_scroll
-                )
-                
-                if not can_continue:
-                    break
+                post_value = self.feed.next_post()
+                if post_value is None:
+                    if not self._advance_feed(enable_scroll):
+                        break
+                    continue
                 
-                if current_index_value < len(post_pages_value):
-                    self.process_post(post_pages_value[current_index_value], processed_count_value)
-                    processed_count_value += 1
-                    current_index_value += 1
+                # 같은 게시물을 다시 열지 않도록 처리 전에 기록
+                self.feed.mark_seen(post_value.key)
+                started_value = time.monotonic()
+                post_result_value = self.process_post(post_value, processed_count_value)
+                seconds_value = time.monotonic() - started_value
+
+                # crash를 복구한 뒤 실패한 게시물은 기록하지 않고 한 번 더 열 수 있도록 되돌림
+                requeue_value = post_result_value['outcome'] == RunJournal.ERROR and post_result_value['crashes'] > 0 \
+                    and post_value.key not in self._crash_requeued
+                if requeue_value:
+                    print(f"crash 복구 후 실패한 게시물은 다시 처리: {post_value.key.splitlines()[0]}")
+                    self._crash_requeued.add(post_value.key)
+                    self.feed.unmark_seen(post_value.key)
+                    self.stats['processed_posts_count'] -= 1
+                if self._session_replaced or requeue_value:
+                    # 새 세션에서는 대기열의 element를 쓸 수 없으므로 현재 화면의 행을 다시 가져옴
+                    self._session_replaced = False
+                    self.feed.refresh()
+                if requeue_value:
+                    continue
+                if self.journal is not None:
+                    self.journal.append(post_value.key, post_result_value['title'], post_result_value['outcome'])
+                if self.pacing is not None:
+                    post_result_value['pacing'] = self.pacing.observe(
+                        seconds_value, post_result_value['crashes'], post_result_value['toast_missed'])
+                    self.pacing.apply(self)
+
+                yield dict(post_result_value, index=processed_count_value, key=post_value.key,
+                           seconds=seconds_value, time=time.time())
+                processed_count_value += 1
+
+                if post_result_value['outcome'] in (RunJournal.FAILED, RunJournal.ERROR):
+                    failures_value += 1
+                    if max_failures is not None and failures_value >= max_failures:
+                        print(f"실패 {failures_value}개 도달 - 조기 종료")
+                        break
+
+                if self.verify_batch is not None and len(self._pending_verification()) >= self.verify_batch \
+                        and self.stats['liked_posts_count'] < max_posts:
+                    self.verify_inline()
+
+            if self.verify_batch is not None:
+                self.verify_inline()
+
+        finally:
+            print("종료 중...")
+            if self.toast_watcher is not None:
+                self.toast_watcher.close()
+            if self.journal is not None:
+                self.journal.close()
+            self.session.metrics.dump()
+            if self._owns_session:
+                self.session.quit()
+
+    def run(self, max_posts: int = 10, enable_scroll: bool = True, resume: bool = False,
+            max_failures: Optional[int] = None, event_sink: Optional[JsonlEventSink] = None) -> Dict:
+        """메인 실행 함수 (resume: 저널에 기록된 게시물은 건너뛰고 이어서 실행, event_sink: 게시물 이벤트 기록)"""
+        try:
+            for event in self.stream(max_posts, enable_scroll, resume, max_failures):
+                if event_sink is not None:
+                    event_sink.write(event)
 
             self.print_results()
             return self.get_results()
@@ -354,19 +642,31 @@ class CarrotLikeBot:
             print(f"실행 중 오류 발생: {e}")
             return self.get_results()
 
-        finally:
-            print("종료 중...")
-            try:
-                if self.driver:
-                    self.driver.quit()
-            except:
-                pass
-
 
 def main():
-    """메인 함수"""
-    bot = CarrotLikeBot()
-    results = bot.run(max_posts=10, enable_scroll=True)
+    """메인 함수 (--resume: 직전 실행의 저널을 이어서 처리, --attach: 세션 데몬의 세션 사용)"""
+    parser = argparse.ArgumentParser(description="당근마켓 좋아요 봇")
+    parser.add_argument("--resume", action="store_true", help="저널에 기록된 게시물을 건너뛰고 이어서 실행")
+    parser.add_argument("--events", help="게시물마다 이벤트를 기록할 JSONL 파일")
+    parser.add_argument("--max-failures", type=int, help="실패가 이 개수가 되면 조기 종료")
+    parser.add_argument("--attach", action="store_true", help="carrot_daemon.py가 유지하는 세션에 붙어서 실행")
+    parser.add_argument("--profile", choices=list(PERFORMANCE_PROFILES), help="UiAutomator2 성능 프로필 (기본: 서버 기본값)")
+    parser.add_argument("--adaptive", action="store_true", help="지연/crash/토스트 감지 실패를 보고 대기 시간 자동 조절")
+    parser.add_argument("--background-confirm", action="store_true", help="좋아요 확인을 기다리지 않고 피드로 돌아가며 확인")
+    parser.add_argument("--verify-batch", type=int, help="새 좋아요가 이 개수만큼 쌓일 때마다 관심목록 앞부분에서 반영 확인")
+    args = parser.parse_args()
+
+    session = client_session(profile=args.profile) if args.attach else AppiumSession(profile=args.profile)
+    bot = CarrotLikeBot(session=session, journal=RunJournal(), adaptive=args.adaptive,
+                        background_confirm=args.background_confirm, verify_batch=args.verify_batch)
+    event_sink = JsonlEventSink(args.events) if args.events else None
+    try:
+        results = bot.run(max_posts=10, enable_scroll=True, resume=args.resume,
+                          max_failures=args.max_failures, event_sink=event_sink)
+    finally:
+        if event_sink is not None:
+            event_sink.close()
+        session.quit()  # 데몬 세션이면 연결만 끊음
     
     # 전역 변수에 결과 저장 (기존 코드와 호환성)
     globals().update({
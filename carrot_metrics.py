@@ -0,0 +1,165 @@
+from typing import Dict, Optional, Tuple
+import bisect
+import json
+import re
+import sys
+import threading
+import time
+
+
+class CommandMetrics:
+    """WebDriver 명령마다 횟수와 지연을 호출한 단계(메서드)별로 기록"""
+
+    # 지연 히스토그램 구간 (초)
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    # 여러 디바이스를 동시에 돌려도 서로 덮어쓰지 않도록 디바이스 이름(udid)을 붙임
+    JSON_PATH = "carrot_metrics_{device}.json"
+    PROMETHEUS_PATH = "carrot_metrics_{device}.prom"
+
+    # 단계로 보지 않는 공통 헬퍼 (호출한 쪽 메서드로 집계)
+    GENERIC_FUNCTIONS = {
+        "safe_click", "safe_find_elements", "_with_recovery", "driver", "_poll", "is_stable", "is_ready",
+        "_hierarchy_hash", "_locator_present", "_current_activity", "measure", "main",
+        # carrot_async.AsyncAppiumDriver 명령 메서드
+        "_command", "find_elements", "find_element", "click", "attribute", "page_source", "back",
+        "current_activity", "execute_script", "window_size", "perform_actions", "_wait_for_element",
+        "update_settings", "_apply_profile",
+    }
+
+    def __init__(self, device_name: str = ""):
+        """초기화"""
+        self.device_name = device_name
+        self.samples: Dict[Tuple[str, str], Dict] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, driver) -> None:
+        """driver.execute를 감싸 모든 명령(요소 명령 포함)을 측정"""
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            step_value = self._caller_step()
+            started_value = time.perf_counter()
+            try:
+                response_value = original_execute(driver_command, params)
+            except Exception:
+                self.record(step_value, driver_command, time.perf_counter() - started_value, error=True)
+                raise
+            self.record(step_value, driver_command, time.perf_counter() - started_value)
+            return response_value
+
+        driver.execute = execute
+
+    def _caller_step(self) -> str:
+        """호출 스택에서 봇 모듈의 가장 가까운 메서드 이름 찾기"""
+        frame = sys._getframe(2)
+        while frame is not None:
+            module_value = frame.f_globals.get("__name__", "")
+            name_value = frame.f_code.co_name
+            if (module_value.startswith("carrot") or module_value == "__main__") \
+                    and not name_value.startswith("<") and name_value not in self.GENERIC_FUNCTIONS:
+                return name_value
+            frame = frame.f_back
+        return "unknown"
+
+    def record(self, step: str, command: str, seconds: float, error: bool = False) -> None:
+        """명령 한 번의 지연 기록"""
+        with self._lock:
+            sample_value = self.samples.get((step, command))
+            if sample_value is None:
+                sample_value = {'count': 0, 'errors': 0, 'sum': 0.0, 'max': 0.0,
+                                'buckets': [0] * (len(self.BUCKETS) + 1)}
+                self.samples[(step, command)] = sample_value
+            sample_value['count'] += 1
+            sample_value['sum'] += seconds
+            sample_value['max'] = max(sample_value['max'], seconds)
+            sample_value['buckets'][bisect.bisect_left(self.BUCKETS, seconds)] += 1
+            if error:
+                sample_value['errors'] += 1
+
+    def total_count(self) -> int:
+        """지금까지 측정한 전체 명령 수"""
+        with self._lock:
+            return sum(sample['count'] for sample in self.samples.values())
+
+    def command_counts(self) -> Dict[str, int]:
+        """명령 종류별 횟수"""
+        counts_value = {}
+        with self._lock:
+            for (_, command), sample in self.samples.items():
+                counts_value[command] = counts_value.get(command, 0) + sample['count']
+        return counts_value
+
+    def command_seconds(self) -> Dict[str, float]:
+        """명령 종류별 누적 소요 시간"""
+        seconds_value = {}
+        with self._lock:
+            for (_, command), sample in self.samples.items():
+                seconds_value[command] = seconds_value.get(command, 0.0) + sample['sum']
+        return seconds_value
+
+    def summary(self) -> Dict:
+        """단계별/명령별 요약 (JSON 덤프용)"""
+        steps_value = {}
+        with self._lock:
+            for (step, command), sample in sorted(self.samples.items()):
+                step_value = steps_value.setdefault(step, {'count': 0, 'seconds': 0.0, 'commands': {}})
+                step_value['count'] += sample['count']
+                step_value['seconds'] += sample['sum']
+                step_value['commands'][command] = {
+                    'count': sample['count'],
+                    'errors': sample['errors'],
+                    'seconds': sample['sum'],
+                    'mean_seconds': sample['sum'] / sample['count'],
+                    'max_seconds': sample['max'],
+                    'buckets': dict(zip([str(bound) for bound in self.BUCKETS] + ["+Inf"], sample['buckets'])),
+                }
+        return {
+            'device': self.device_name,
+            'total_commands': sum(step['count'] for step in steps_value.values()),
+            'total_seconds': sum(step['seconds'] for step in steps_value.values()),
+            'steps': steps_value,
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition 형식"""
+        lines_value = [
+            "# HELP carrot_webdriver_command_seconds WebDriver command latency by calling step",
+            "# TYPE carrot_webdriver_command_seconds histogram",
+        ]
+        errors_value = []
+        with self._lock:
+            for (step, command), sample in sorted(self.samples.items()):
+                labels_value = f'device="{self.device_name}",step="{step}",command="{command}"'
+                cumulative_value = 0
+                for bound, count in zip(list(self.BUCKETS) + ["+Inf"], sample['buckets']):
+                    cumulative_value += count
+                    lines_value.append(f'carrot_webdriver_command_seconds_bucket{{{labels_value},le="{bound}"}} {cumulative_value}')
+                lines_value.append(f"carrot_webdriver_command_seconds_sum{{{labels_value}}} {sample['sum']:.6f}")
+                lines_value.append(f"carrot_webdriver_command_seconds_count{{{labels_value}}} {sample['count']}")
+                errors_value.append(f"carrot_webdriver_command_errors_total{{{labels_value}}} {sample['errors']}")
+
+        lines_value += [
+            "# HELP carrot_webdriver_command_errors_total WebDriver commands that raised",
+            "# TYPE carrot_webdriver_command_errors_total counter",
+        ] + errors_value
+        return "\n".join(lines_value) + "\n"
+
+    def dump(self, json_path: Optional[str] = None, prometheus_path: Optional[str] = None) -> None:
+        """JSON 요약과 Prometheus 메트릭 파일 저장 (경로를 생략하면 디바이스별 기본 경로)"""
+        # 네트워크 adb udid(예: 192.168.0.10:5555)도 파일 이름에 쓸 수 있게 바꿈
+        device_value = re.sub(r"[^\w.-]", "_", self.device_name) or "default"
+        json_path = json_path or self.JSON_PATH.format(device=device_value)
+        prometheus_path = prometheus_path or self.PROMETHEUS_PATH.format(device=device_value)
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            json.dump(self.summary(), json_file, ensure_ascii=False, indent=2)
+        with open(prometheus_path, "w", encoding="utf-8") as prometheus_file:
+            prometheus_file.write(self.to_prometheus())
+        print(f"명령 메트릭 저장: {json_path}, {prometheus_path}")
+
+    def print_summary(self, limit: int = 10) -> None:
+        """소요 시간이 큰 단계 순으로 출력"""
+        summary_value = self.summary()
+        print(f"WebDriver 명령 {summary_value['total_commands']}회, {summary_value['total_seconds']:.1f}초")
+        steps_value = sorted(summary_value['steps'].items(), key=lambda item: item[1]['seconds'], reverse=True)
+        for step, step_summary in steps_value[:limit]:
+            print(f"  {step}: {step_summary['count']}회, {step_summary['seconds']:.2f}초")
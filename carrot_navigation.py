@@ -0,0 +1,123 @@
+from carrot_wait import ScreenSettleWaiter
+from selenium.common.exceptions import WebDriverException
+from typing import Callable, Dict, Optional, Tuple
+import json
+import time
+
+
+class WatchlistNavigator:
+    """관심목록 화면으로 바로 이동 (딥링크 → startActivity → 탭 경로 순서로 시도하고 쓴 경로 기록)
+
+    직접 이동할 activity는 지정하지 않아도 탭 경로로 관심목록을 연 뒤 현재 activity가 시작 화면과 다르면
+    상태 파일에 기억해 두고 다음 실행부터 startActivity로 사용
+    """
+
+    DEEP_LINK = "deep_link"
+    ACTIVITY = "activity"
+    TAP = "tap"
+
+    STATE_PATH = "carrot_navigation.json"
+    # 직접 이동 후 관심목록 행을 기다리는 시간 (초과하면 다음 경로로)
+    DIRECT_TIMEOUT = 3
+
+    def __init__(self, driver_getter: Callable, waiter: ScreenSettleWaiter, app_package: str,
+                 ready_locator: Tuple[str, str], tap_path: Callable[[], None],
+                 recover: Optional[Callable[[], None]] = None, deep_link_url: Optional[str] = None,
+                 activity: Optional[str] = None, state_path: Optional[str] = STATE_PATH):
+        """초기화 (tap_path: 기존 탭 경로 이동 함수, recover: 직접 이동 실패 후 탭 경로를 시작할 화면으로 돌아가는 함수,
+        activity: 관심목록 activity - 없으면 상태 파일에서 읽음, state_path: None이면 배운 activity를 저장하지 않음)"""
+        self.driver_getter = driver_getter
+        self.waiter = waiter
+        self.app_package = app_package
+        self.ready_locator = ready_locator
+        self.tap_path = tap_path
+        self.recover = recover
+        self.deep_link_url = deep_link_url
+        self.state_path = state_path
+        self._learned_activity = activity is None
+        self.activity = activity or self._load_state().get('activity')
+        self.last_path = None
+        self.last_seconds = None
+        self.paths: Dict[str, int] = {}
+
+    @property
+    def driver(self):
+        return self.driver_getter()
+
+    def _load_state(self) -> Dict:
+        if self.state_path is None:
+            return {}
+        try:
+            with open(self.state_path, encoding="utf-8") as state_file:
+                return json.load(state_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self) -> None:
+        if self.state_path is None:
+            return
+        with open(self.state_path, "w", encoding="utf-8") as state_file:
+            json.dump({'activity': self.activity}, state_file, ensure_ascii=False)
+
+    def _current_activity(self) -> Optional[str]:
+        try:
+            return self.driver.current_activity
+        except WebDriverException:
+            return None
+
+    def _open_deep_link(self) -> None:
+        self.driver.execute_script("mobile: deepLink", {'url': self.deep_link_url, 'package': self.app_package})
+
+    def _open_activity(self) -> None:
+        self.driver.execute_script("mobile: startActivity", {
+            'component': f"{self.app_package}/{self.activity}",
+            'stop': False,
+        })
+
+    def _try_direct(self, name: str, open_screen: Callable[[], None]) -> bool:
+        """직접 이동 한 가지 시도 - 관심목록 행이 DIRECT_TIMEOUT 안에 보이면 True"""
+        try:
+            open_screen()
+        except WebDriverException as e:
+            print(f"{name} 이동 실패: {e.msg}")
+            return False
+        self.waiter.wait_for_locator(self.ready_locator, self.DIRECT_TIMEOUT)
+        if not self.waiter.last_ready:
+            print(f"{name} 이동 후 관심목록이 보이지 않음")
+        return self.waiter.last_ready
+
+    def _learn_activity(self, start_activity: Optional[str]) -> None:
+        """탭 경로로 연 관심목록이 별도 activity이면 다음 실행을 위해 기억"""
+        activity_value = self._current_activity()
+        if activity_value and activity_value != start_activity and activity_value != self.activity:
+            self.activity = activity_value
+            self._save_state()
+            print(f"관심목록 activity 기억: {activity_value}")
+
+    def open(self) -> str:
+        """관심목록 화면으로 이동 후 사용한 경로(DEEP_LINK/ACTIVITY/TAP) 반환"""
+        started_value = time.monotonic()
+        start_activity_value = self._current_activity() if self.state_path is not None else None
+        path_value = self.TAP
+        direct_tried_value = bool(self.deep_link_url or self.activity)
+
+        if self.deep_link_url and self._try_direct(self.DEEP_LINK, self._open_deep_link):
+            path_value = self.DEEP_LINK
+        elif self.activity and self._try_direct(self.ACTIVITY, self._open_activity):
+            path_value = self.ACTIVITY
+        else:
+            if self.activity and self._learned_activity:
+                # 기억한 activity가 더 이상 관심목록이 아님 - 잊고 탭 경로에서 다시 배움
+                self.activity = None
+                self._save_state()
+            if direct_tried_value and self.recover is not None:
+                self.recover()
+            self.tap_path()
+            if self.state_path is not None:
+                self._learn_activity(start_activity_value)
+
+        self.last_path = path_value
+        self.last_seconds = time.monotonic() - started_value
+        self.paths[path_value] = self.paths.get(path_value, 0) + 1
+        print(f"관심목록 이동 경로: {path_value} ({self.last_seconds:.1f}초)")
+        return path_value
@@ -0,0 +1,164 @@
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+
+class PacingController:
+    """게시물 처리 결과를 보고 봇의 대기/타임아웃 값을 AIMD 방식으로 조절
+
+    문제없이 처리한 게시물마다 값을 조금씩(STEP) 줄이고, 느려짐 신호가 오면 곱(FACTOR)으로 늘림:
+    - crash (instrumentation 재시작): 모든 값 증가, COOLDOWN_POSTS개 동안 줄이지 않음
+    - 토스트 감지 실패: TOAST_TIMEOUT 증가
+    - 명령 지연 급증 (평균이 기준의 LATENCY_SPIKE배 이상): 화면 대기 값 증가
+    값은 BOUNDS 범위 안에서만 움직이고, apply()로 봇 인스턴스 속성에 반영 (클래스 상수는 그대로)
+    """
+
+    # 이름: (최소, 최대)
+    BOUNDS = {
+        'DEFAULT_TIMEOUT': (2.0, 10.0),
+        'TOAST_TIMEOUT': (0.5, 4.0),
+        'PAGE_LOAD_DELAY': (0.5, 5.0),
+        'SCROLL_DELAY': (0.3, 3.0),
+    }
+    # 게시물 한 개가 문제없이 끝날 때마다 줄이는 양 (초)
+    STEP = {
+        'DEFAULT_TIMEOUT': 0.25,
+        'TOAST_TIMEOUT': 0.1,
+        'PAGE_LOAD_DELAY': 0.1,
+        'SCROLL_DELAY': 0.05,
+    }
+    FACTOR = 2.0
+    COOLDOWN_POSTS = 3
+    LATENCY_SPIKE = 2.0
+    # 명령 평균 지연 기준선 (지수 이동 평균 가중치)
+    LATENCY_SMOOTHING = 0.2
+    # posts/min 계산에 쓰는 최근 게시물 수
+    WINDOW = 10
+
+    # 느려짐 신호
+    CRASH = "crash"
+    TOAST_MISS = "toast_miss"
+    LATENCY = "latency"
+
+    # 신호마다 늘리는 값
+    SIGNAL_TARGETS = {
+        CRASH: tuple(BOUNDS),
+        TOAST_MISS: ('TOAST_TIMEOUT',),
+        LATENCY: ('DEFAULT_TIMEOUT', 'PAGE_LOAD_DELAY', 'SCROLL_DELAY'),
+    }
+
+    def __init__(self, initial: Dict[str, float], metrics=None, bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+                 log: Callable[[str], None] = print):
+        """초기화 (initial: 시작 값 - 보통 봇의 클래스 상수, metrics: 명령 지연을 읽을 CommandMetrics,
+        bounds: BOUNDS 대신 쓸 범위, log: 조절 내역 출력 함수)"""
+        self.bounds = dict(self.BOUNDS, **(bounds or {}))
+        self.values = {name: self._clamp(name, initial[name]) for name in self.bounds}
+        self.metrics = metrics
+        self.log = log
+        self.cooldown = 0
+        self.latency_baseline = None
+        self._metrics_mark = None
+        self._post_seconds = deque(maxlen=self.WINDOW)
+        self.stats = {'posts': 0, 'decreases': 0, self.CRASH: 0, self.TOAST_MISS: 0, self.LATENCY: 0}
+
+    @classmethod
+    def for_bot(cls, bot, **kwargs) -> "PacingController":
+        """봇의 현재 상수 값에서 시작하는 컨트롤러 (metrics는 봇 세션의 CommandMetrics)"""
+        kwargs.setdefault('metrics', bot.session.metrics)
+        return cls({name: getattr(bot, name) for name in cls.BOUNDS}, **kwargs)
+
+    def _clamp(self, name: str, value: float) -> float:
+        low_value, high_value = self.bounds[name]
+        return min(max(value, low_value), high_value)
+
+    def apply(self, target) -> None:
+        """현재 값을 target(봇) 인스턴스 속성으로 설정"""
+        for name, value in self.values.items():
+            setattr(target, name, value)
+
+    def _command_latency(self) -> Optional[float]:
+        """마지막 관찰 이후 WebDriver 명령 평균 지연 (명령이 없었으면 None)"""
+        if self.metrics is None:
+            return None
+        mark_value = (self.metrics.total_count(), sum(self.metrics.command_seconds().values()))
+        previous_value, self._metrics_mark = self._metrics_mark, mark_value
+        if previous_value is None or mark_value[0] <= previous_value[0]:
+            return None
+        return (mark_value[1] - previous_value[1]) / (mark_value[0] - previous_value[0])
+
+    def _latency_spiked(self) -> bool:
+        latency_value = self._command_latency()
+        if latency_value is None:
+            return False
+        if self.latency_baseline is None:
+            self.latency_baseline = latency_value
+            return False
+        spiked_value = latency_value >= self.latency_baseline * self.LATENCY_SPIKE
+        if not spiked_value:
+            # 급증한 값은 기준선에 넣지 않음 (느린 구간이 기준이 되지 않도록)
+            self.latency_baseline += (latency_value - self.latency_baseline) * self.LATENCY_SMOOTHING
+        return spiked_value
+
+    def _increase(self, signal: str) -> None:
+        self.stats[signal] += 1
+        for name in self.SIGNAL_TARGETS[signal]:
+            self.values[name] = self._clamp(name, self.values[name] * self.FACTOR)
+
+    def _decrease(self) -> None:
+        self.stats['decreases'] += 1
+        for name in self.values:
+            self.values[name] = self._clamp(name, self.values[name] - self.STEP[name])
+
+    def start(self) -> None:
+        """측정 시작점 기록 (실행 시작 시 한 번)"""
+        self._command_latency()
+
+    def observe(self, seconds: float, crashes: int = 0, toast_missed: bool = False) -> Dict[str, float]:
+        """게시물 하나의 결과 반영 후 새 값 반환 (seconds: 게시물 처리 시간, crashes: 세션 재시작 횟수)"""
+        self.stats['posts'] += 1
+        self._post_seconds.append(seconds)
+
+        signals_value = []
+        if crashes:
+            signals_value.append(self.CRASH)
+            self.cooldown = self.COOLDOWN_POSTS
+        if toast_missed:
+            signals_value.append(self.TOAST_MISS)
+        if self._latency_spiked():
+            signals_value.append(self.LATENCY)
+
+        if signals_value:
+            for signal in signals_value:
+                self._increase(signal)
+            self.log(f"속도 조절: {', '.join(signals_value)} → {self.describe()}")
+        elif self.cooldown > 0:
+            self.cooldown -= 1
+        else:
+            self._decrease()
+        return dict(self.values)
+
+    def posts_per_minute(self) -> Optional[float]:
+        """최근 WINDOW개 게시물 기준 분당 처리 수"""
+        if not self._post_seconds:
+            return None
+        return 60.0 * len(self._post_seconds) / sum(self._post_seconds)
+
+    def describe(self) -> str:
+        return ", ".join(f"{name}={value:.2f}" for name, value in self.values.items())
+
+    def get_report(self) -> Dict:
+        """현재 값, 신호 횟수, 분당 처리 수"""
+        return {
+            'values': dict(self.values),
+            'posts_per_minute': self.posts_per_minute(),
+            'latency_baseline': self.latency_baseline,
+            'stats': dict(self.stats),
+        }
+
+    def print_report(self) -> None:
+        """조절 결과 출력"""
+        rate_value = self.posts_per_minute()
+        rate_text_value = f"{rate_value:.1f}개/분" if rate_value is not None else "측정 없음"
+        print(f"속도 조절 결과: {rate_text_value} (최근 {len(self._post_seconds)}개 기준)")
+        print(f"  최종 값: {self.describe()}")
+        print(f"  crash {self.stats[self.CRASH]}회, 토스트 감지 실패 {self.stats[self.TOAST_MISS]}회, "
+              f"지연 급증 {self.stats[self.LATENCY]}회, 감소 {self.stats['decreases']}회")
@@ -1,91 +1,104 @@
-from appium import webdriver
-from appium.options.android import UiAutomator2Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.actions.action_builder import ActionBuilder
-from selenium.webdriver.common.actions.pointer_input import PointerInput
-from selenium.webdriver.common.actions import interaction
-from selenium.webdriver.common.action_chains import ActionChains
+import argparse
+import hashlib
 import time
 
+from carrot_daemon import client_session
+from carrot_navigation import WatchlistNavigator
+from carrot_scroll import EndOfListDetector, ScrollEngine
+from carrot_session import PERFORMANCE_PROFILES, AppiumSession
+from carrot_snapshot import PageSnapshot, parse_page_source
+from carrot_sink import TitleSink
+from carrot_titles import RollingTitleFilter, TitleIndex, normalize_title
+from carrot_wait import ScreenSettleWaiter
+
 
 class CarrotProfileReader:
     """당근마켓 관심목록 읽기 전용 봇"""
+
+    WATCHLIST_ROW_XPATH = PageSnapshot.WATCHLIST_ROW_XPATH
+    NAVIGATION_PROFILE_XPATH = "(//android.widget.ImageView[@resource-id=\"com.towneers.www:id/navigation_bar_item_icon_view\"])[5]"
+    SNAPSHOT_TIMEOUT = 10
+    SNAPSHOT_POLL_INTERVAL = 0.5
+    KNOWN_RUN_THRESHOLD = 5
     
-    def __init__(self):
-        """초기화"""
-        self.desired_caps = {
-            "platformName": "Android",
-            "appium:deviceName": "R3CN20HAC4A",
-            "appium:automationName": "UiAutomator2",
-            "appium:appPackage": "com.towneers.www",
-            "appium:appActivity": ".launcher.LauncherActivity",
-            "appium:noReset": True,
-            "appium:newCommandTimeout": 0,
-            "appium:autoGrantPermissions": True,
-        }
-        
-        self.options = UiAutomator2Options().load_capabilities(self.desired_caps)
-        self.driver = None
+    def __init__(self, snapshot_mode=True, device_name=AppiumSession.DEFAULT_DEVICE_NAME, session=None, index=None,
+                 watchlist_deep_link=None, watchlist_activity=None):
+        """초기화 (snapshot_mode: page_source 한 번으로 화면 파싱, session: 공유 Appium 세션, index: WatchlistIndex,
+        watchlist_deep_link/watchlist_activity: 관심목록으로 바로 이동할 딥링크 URL/activity)"""
+        self.snapshot_mode = snapshot_mode
+        self.index = index
+        self._owns_session = session is None
+        self.session = session or AppiumSession(device_name)
+        self.waiter = ScreenSettleWaiter(lambda: self.driver)
+        self.scroller = ScrollEngine(lambda: self.driver, self.waiter.wait_until_stable)
+        self.navigator = WatchlistNavigator(
+            lambda: self.driver, self.waiter, self.session.desired_caps["appium:appPackage"],
+            (By.XPATH, self.WATCHLIST_ROW_XPATH), self.open_watchlist_by_tap,
+            recover=lambda: self.session.return_to((By.XPATH, self.NAVIGATION_PROFILE_XPATH)),
+            deep_link_url=watchlist_deep_link, activity=watchlist_activity,
+        )
+        self._last_snapshot = None
+        self._streaming = False
+
+    @property
+    def driver(self):
+        """공유 세션의 현재 driver"""
+        return self.session.driver
 
     def start_driver(self):
         """Appium driver 시작/재시작"""
-        try:
-            if self.driver:
-                print("Appium 세션 재시작 중...")
-                self.driver.quit()
-        except:
-            pass
-        
-        time.sleep(2)
-        self.driver = webdriver.Remote(command_executor="http://127.0.0.1:4723", options=self.options)
-        print("Appium session 시작/재시작 완료")
+        if self.session.driver is None:
+            self.session.start()
+        else:
+            self.session.restart()
 
     def get_screen_size(self):
-        """화면 크기 가져오기"""
-        try:
-            return self.driver.get_window_size()
-        except:
-            return {"width": 1080, "height": 2340}
+        """화면 크기 가져오기 (세션마다 한 번만 조회)"""
+        return self.scroller.screen_size()
 
     def scroll_down(self, start_ratio=0.75, end_ratio=0.25):
         """화면을 아래로 스크롤 (75% → 25%)"""
         try:
-            screen_size_value = self.get_screen_size()
-            width_value = screen_size_value["width"]
-            height_value = screen_size_value["height"]
-            
-            start_x_value = width_value // 2
-            start_y_value = int(height_value * start_ratio)
-            end_x_value = width_value // 2
-            end_y_value = int(height_value * end_ratio)
-            
+            start_x_value, start_y_value, end_x_value, end_y_value = self.scroller.swipe(start_ratio, end_ratio, 1)
             print(f"아래로 스크롤: ({start_x_value}, {start_y_value}) → ({end_x_value}, {end_y_value})")
-            
-            actions = ActionChains(self.driver)
-            actions.w3c_actions = ActionBuilder(self.driver, mouse=PointerInput(interaction.POINTER_TOUCH, "touch"))
-            actions.w3c_actions.pointer_action.move_to_location(start_x_value, start_y_value)
-            actions.w3c_actions.pointer_action.pointer_down()
-            actions.w3c_actions.pointer_action.move_to_location(end_x_value, end_y_value)
-            actions.w3c_actions.pointer_action.release()
-            actions.perform()
-            
-            time.sleep(1)
             print("아래로 스크롤 완료")
             
         except Exception as e:
             print(f"아래로 스크롤 중 오류: {e}")
 
+    def scroll_to_next_page(self):
+        """마지막으로 읽은 스냅샷의 행 경계 기준으로 한 페이지 스크롤 (계산할 수 없으면 고정 비율 스와이프)
+
+        더 스크롤할 수 없다고 확인되면 False 반환
+        """
+        try:
+            can_scroll_more_value = self.scroller.scroll_page(self._last_snapshot, self.WATCHLIST_ROW_XPATH, settle_delay=3)
+            if can_scroll_more_value is not None:
+                print("다음 페이지로 스크롤 완료")
+                return can_scroll_more_value
+        except Exception as e:
+            print(f"페이지 스크롤 중 오류: {e}")
+
+        self.scroll_down(start_ratio=0.6, end_ratio=0.2)
+        self.waiter.wait_until_stable(2)
+        return True
+
+    def _screen_hash(self):
+        """마지막 스냅샷의 계층구조 해시 (스냅샷 모드가 아니면 None)"""
+        if not self.snapshot_mode or self._last_snapshot is None:
+            return None
+        return hashlib.blake2b(self._last_snapshot.page_source.encode("utf-8"), digest_size=16).hexdigest()
+
     def extract_titles_from_textviews(self):
         """XPath로 TextView들에서 text 속성 추출"""
         try:
             # 1. 동일한 depth의 모든 element들을 받아오기 (WebDriverWait 사용)
             wait = WebDriverWait(self.driver, 10)
             elements = wait.until(
-                EC.presence_of_all_elements_located(
-                    (By.XPATH, "//android.view.View[@resource-id='root']/android.view.View/android.view.View/android.view.View[2]/android.view.View/android.view.View")
-                )
+                EC.presence_of_all_elements_located((By.XPATH, self.WATCHLIST_ROW_XPATH))
             )
             print(f"발견된 element 개수: {len(elements)}")  # 디버깅용
             titles = []
@@ -108,7 +121,8 @@ class CarrotProfileReader:
                         text = text.strip()
                         # 3. titles에 추가
                         titles.append(text)
-                        print(f"제목 발견: {text}")
+                        if not self._streaming:
+                            print(f"제목 발견: {text}")
                 except:
                     # 해당 element에 TextView가 없으면 건너뛰기
                     continue
@@ -119,72 +133,168 @@ class CarrotProfileReader:
             print(f"TextView에서 제목 추출 실패: {e}")
             return []
 
-    def get_liked_posts_from_profile(self):
-        """프로필로 이동하여 관심목록의 모든 게시물 제목 수집"""
+    def _wait_for_snapshot(self, timeout=None):
+        """관심목록 행이 나타날 때까지 page_source 스냅샷 대기"""
+        deadline_value = time.monotonic() + (timeout or self.SNAPSHOT_TIMEOUT)
+        # 화면 안정화 확인에 쓴 page_source가 있으면 첫 번째로 재사용
+        page_source_value = self.waiter.consume_page_source()
+        while True:
+            snapshot_value = parse_page_source(page_source_value or self.driver.page_source)
+            page_source_value = None
+            if snapshot_value is not None and snapshot_value.watchlist_rows():
+                return snapshot_value
+            if time.monotonic() >= deadline_value:
+                return None
+            time.sleep(self.SNAPSHOT_POLL_INTERVAL)
+
+    def extract_titles_from_snapshot(self):
+        """page_source 스냅샷 한 번으로 제목 추출 (extract_titles_from_textviews와 동일한 반환 형식)"""
         try:
-            print("프로필 화면으로 이동 중...")
-            
-            # 1. 네비게이션 바 5번째 아이템 클릭 (프로필)
-            nav_element_value = self.driver.find_element(
-                By.XPATH, 
-                "(//android.widget.ImageView[@resource-id=\"com.towneers.www:id/navigation_bar_item_icon_view\"])[5]"
-            )
-            nav_element_value.click()
-            time.sleep(2)
-            print("프로필 화면으로 이동 완료")
+            snapshot_value = self._wait_for_snapshot()
+            self._last_snapshot = snapshot_value
+            if snapshot_value is None:
+                print("관심목록 element를 찾지 못했습니다")
+                return []
+
+            print(f"발견된 element 개수: {len(snapshot_value.watchlist_rows())}")  # 디버깅용
+            titles = snapshot_value.extract_watchlist_titles()
+            for title in titles:
+                if title is False:
+                    print("'관심 있을 만한' 섹션의 '상품' 발견 - 검색 중단")
+                elif not self._streaming:
+                    print(f"제목 발견: {title}")
+            return titles
+
+        except Exception as e:
+            print(f"스냅샷에서 제목 추출 실패: {e}")
+            return []
+
+    def extract_titles(self):
+        """현재 모드에 맞는 제목 추출"""
+        if self.snapshot_mode:
+            return self.extract_titles_from_snapshot()
+        return self.extract_titles_from_textviews()
+
+    def open_watchlist(self):
+        """관심목록 화면으로 이동 (딥링크/activity로 바로 이동, 안 되면 탭 경로) - 사용한 경로 반환"""
+        return self.navigator.open()
 
-            self.scroll_down(start_ratio=0.3, end_ratio=0.2)
+    def open_watchlist_by_tap(self):
+        """프로필 화면을 거쳐 관심목록 화면으로 이동"""
+        print("프로필 화면으로 이동 중...")
             
-            # 2. 관심목록 섹션 클릭
-            interest_section_value = self.driver.find_element(
-                By.XPATH, 
-                "//android.widget.TextView[@text='관심목록']"
-            )
-            interest_section_value.click()
-            print("관심목록 섹션 클릭 완료")
-            time.sleep(5) 
+        # 1. 네비게이션 바 5번째 아이템 클릭 (프로필)
+        nav_element_value = self.driver.find_element(By.XPATH, self.NAVIGATION_PROFILE_XPATH)
+        nav_element_value.click()
+        self.waiter.wait_until_stable(2)
+        print("프로필 화면으로 이동 완료")
+
+        self.scroll_down(start_ratio=0.3, end_ratio=0.2)
+        
+        # 2. 관심목록 섹션 클릭
+        interest_section_value = self.driver.find_element(
+            By.XPATH, 
+            "//android.widget.TextView[@text='관심목록']"
+        )
+        interest_section_value.click()
+        print("관심목록 섹션 클릭 완료")
+        self.waiter.wait_for_locator((By.XPATH, self.WATCHLIST_ROW_XPATH), 5)
+
+    def get_liked_posts_from_profile(self, incremental=False, max_scrolls=None, sink=None):
+        """프로필로 이동하여 관심목록의 모든 게시물 제목 수집
 
+        incremental이 True이면 이미 색인된 제목이 KNOWN_RUN_THRESHOLD개 연속으로 나올 때 스크롤을 멈추고
+        나머지는 색인에서 채움. "관심 있을 만한" 섹션이 보이지 않아도 같은 화면/새 제목 없음이 반복되거나
+        max_scrolls에 도달하면 종료. sink(TitleSink)를 넘기면 제목을 화면마다 sink에 쓰고 빈 목록 반환
+        (메모리는 목록 크기와 거의 무관)
+        """
+        self._streaming = sink is not None
+        try:
+            self.open_watchlist()
+            run_started_value = time.time()
+            incremental = incremental and self.index is not None
             
             # 3. 관심목록에서 모든 아이템 제목 수집
             collected_titles_value = []
+            collected_count_value = 0
+            # 정규화된 제목 기준 중복 제거 (스트리밍이면 최근 제목 + 지문만 기억)
+            seen_titles_value = RollingTitleFilter() if self._streaming else TitleIndex()
+            known_run_value = 0
+            end_detector_value = EndOfListDetector(max_scrolls=max_scrolls or EndOfListDetector.MAX_SCROLLS)
+            last_page_value = False
             
             while True:
                 # 현재 화면에서 제목 추출
                 print("현재 화면에서 제목 추출 중...")
-                current_titles = self.extract_titles_from_textviews()
-                if len(collected_titles_value) == 0:
-                    pass
-                else:
-                    current_titles.pop(0)
+                # 앞 화면과 겹치는 행은 아래 중복 제거로 걸러짐 (첫 제목을 무조건 버리면 앞 화면 맨 아래에서
+                # 제목이 보이지 않던 행을 잃음)
+                current_titles = self.extract_titles()
                 
                 # 마지막 값이 False면 중단 신호
-                if current_titles and current_titles[-1] is False:
+                reached_end_value = bool(current_titles) and current_titles[-1] is False
+                if reached_end_value:
                     # 마지막 False 제거
                     current_titles.pop()
-                    # 나머지 제목들 추가
-                    new_titles_found = 0
-                    for title in current_titles:
-                        if title not in collected_titles_value:
-                            collected_titles_value.append(title)
-                            new_titles_found += 1
+                
+                # 새로운 제목들만 추가
+                new_titles_value = [title for title in current_titles if seen_titles_value.add(title)]
+                if incremental:
+                    for title in new_titles_value:
+                        known_run_value = known_run_value + 1 if title in self.index else 0
+                if self._streaming:
+                    for title in new_titles_value:
+                        sink.write(title)
+                    sink.flush()
+                    if self.index is not None:
+                        self.index.upsert(new_titles_value, seen_at=run_started_value)
+                else:
+                    collected_titles_value += new_titles_value
+                new_titles_found = len(new_titles_value)
+                collected_count_value += new_titles_found
+
+                if reached_end_value:
                     print(f"마지막으로 새로 발견된 제목: {new_titles_found}개")
                     print("'관심 있을 만한' 섹션 도달 - 관심목록 수집 종료")
                     break
                 
-                # 새로운 제목들만 추가
-                new_titles_found = 0
-                for title in current_titles:
-                    if title not in collected_titles_value:
-                        collected_titles_value.append(title)
-                        new_titles_found += 1
-                
                 print(f"새로 발견된 제목: {new_titles_found}개")
-                print(f"전체 수집된 제목: {len(collected_titles_value)}개")
+                print(f"전체 수집된 제목: {collected_count_value}개")
+
+                end_detector_value.observe(new_titles_found, self._screen_hash())
+                if last_page_value:
+                    reached_end_value = True
+                    print("목록 끝 도달 (더 스크롤할 수 없음) - 관심목록 수집 종료")
+                    break
+                if end_detector_value.stalled:
+                    # 끝까지 읽었다는 보장이 없으므로 색인을 정리하지 않고 나머지는 색인에서 채움
+                    print("같은 화면/새 제목 없음 반복 - 관심목록 수집 중단 (끝까지 읽지 못했을 수 있음)")
+                    break
+                if end_detector_value.capped:
+                    print(f"스크롤 상한 {end_detector_value.max_scrolls}회 도달 - 관심목록 수집 중단")
+                    break
+
+                if incremental and known_run_value >= self.KNOWN_RUN_THRESHOLD:
+                    print(f"이미 색인된 제목 {known_run_value}개 연속 - 증분 수집 종료")
+                    break
                 
                 # 스크롤하여 더 많은 항목 로드
                 print("다음 항목을 위해 아래로 스크롤...")
-                self.scroll_down(start_ratio=0.6, end_ratio=0.2)
-                time.sleep(2)
+                last_page_value = not self.scroll_to_next_page()
+                end_detector_value.scrolled()
+
+            if self.index is not None and self._streaming:
+                if reached_end_value:
+                    self._prune_index(run_started_value)
+                else:
+                    for title in self.index.iter_titles():
+                        if seen_titles_value.add(title):
+                            sink.write(title)
+            elif self.index is not None:
+                self._update_index(collected_titles_value, run_started_value, reached_end_value)
+                if not reached_end_value:
+                    # 스크롤하지 않은 나머지는 이전 실행의 색인으로 채움
+                    collected_titles_value += [title for title in self.index.titles()
+                                               if seen_titles_value.add(title)]
         
             return collected_titles_value
             
@@ -192,29 +302,104 @@ class CarrotProfileReader:
             print(f"프로필 확인 중 오류: {e}")
             return []
 
-    def print_liked_list(self, liked_list):
-        """관심목록 출력"""
+    def find_missing_in_head(self, titles, fuzzy_cutoff=None):
+        """관심목록 맨 위부터 titles가 모두 보일 때까지만 읽고 보이지 않은 제목 반환 (관심목록 화면으로 이동 포함)
+
+        새로 관심 추가한 게시물은 관심목록 맨 위에 쌓이므로 len(titles)개 행에 한 화면을 더 읽어도 없으면
+        반영되지 않은 것으로 봄. 전체 목록을 읽는 get_liked_posts_from_profile 대신 좋아요 직후 검증용
+        """
+        titles = list(titles)
+        expected_index_value = TitleIndex(titles, fuzzy_cutoff)
+        found_keys_value = set()
+        seen_titles_value = TitleIndex()
+        read_rows_value = 0
+        screens_value = 0
+        row_limit_value = None
+        end_detector_value = EndOfListDetector()
+        last_page_value = False
+
+        self._streaming = True  # 제목마다 출력하지 않음
+        try:
+            self.open_watchlist()
+            while True:
+                current_titles = self.extract_titles()
+                screens_value += 1
+                reached_end_value = bool(current_titles) and current_titles[-1] is False
+                new_titles_value = [title for title in current_titles if title is not False and seen_titles_value.add(title)]
+                for title in new_titles_value:
+                    matched_value = expected_index_value.match(title)
+                    if matched_value is not None:
+                        found_keys_value.add(normalize_title(matched_value))
+                read_rows_value += len(new_titles_value)
+                if row_limit_value is None:
+                    row_limit_value = len(expected_index_value) + len(new_titles_value)
+
+                if len(found_keys_value) == len(expected_index_value) or reached_end_value:
+                    break
+                if read_rows_value >= row_limit_value:
+                    break
+                end_detector_value.observe(len(new_titles_value), self._screen_hash())
+                if last_page_value or end_detector_value.stalled:
+                    break
+                last_page_value = not self.scroll_to_next_page()
+                end_detector_value.scrolled()
+        finally:
+            self._streaming = False
+
+        print(f"관심목록 앞부분 {screens_value}화면 ({read_rows_value}개 행) 확인: "
+              f"{len(found_keys_value)}/{len(expected_index_value)}개 반영됨")
+        return [title for title in titles if normalize_title(title) not in found_keys_value]
+
+    def _update_index(self, titles, run_started, reached_end):
+        """수집한 제목을 색인에 기록 (끝까지 읽은 경우 사라진 제목 정리)"""
+        new_count_value = self.index.upsert(titles, seen_at=run_started)
+        print(f"색인에 새로 추가된 제목: {new_count_value}개")
+        if reached_end:
+            self._prune_index(run_started)
+
+    def _prune_index(self, run_started):
+        """이번 실행에서 보이지 않은 제목을 색인에서 삭제"""
+        removed_count_value = self.index.prune(seen_before=run_started)
+        if removed_count_value:
+            print(f"관심목록에서 사라진 제목 {removed_count_value}개를 색인에서 삭제")
+
+    def print_liked_list(self, liked_list, sink=None):
+        """관심목록 출력 (sink에 기록했으면 개수와 파일만)"""
         print(f"\n=== 관심목록 결과 ===")
-        print(f"총 관심목록 개수: {len(liked_list)}")
-        print(f"관심목록 항목들:")
+        if sink is not None:
+            print(f"총 관심목록 개수: {sink.count} ({sink.path}에 기록)")
+        else:
+            print(f"총 관심목록 개수: {len(liked_list)}")
+            print(f"관심목록 항목들:")
         
-        if liked_list:
+        if sink is not None:
+            pass  # 목록이 클 수 있으므로 항목은 출력하지 않음
+        elif liked_list:
             for i, title in enumerate(liked_list, 1):
                 print(f"  {i}. {title}")
         else:
             print("  (관심목록이 비어있습니다)")
 
-    def run(self):
-        """메인 실행 함수 - 관심목록만 가져오기"""
+        if self.navigator.last_path is not None:
+            print(f"관심목록 이동 경로: {self.navigator.last_path} ({self.navigator.last_seconds:.1f}초)")
+        self.waiter.print_report()
+        self.session.metrics.print_summary()
+
+    def run(self, incremental=False, max_scrolls=None, sink=None):
+        """메인 실행 함수 - 관심목록만 가져오기 (incremental: 색인 기반 증분 수집, max_scrolls: 스크롤 상한,
+        sink: 제목을 기록할 TitleSink - 지정하면 빈 목록 반환)"""
         try:
-            self.start_driver()
+            self.session.start()
+            if self.session.attached:
+                # 데몬 세션은 이전 실행이 남긴 화면에 있을 수 있으므로 네비게이션 바가 보이는 화면으로 돌아감
+                self.session.return_to((By.XPATH, self.NAVIGATION_PROFILE_XPATH))
             
             # 관심목록에서 모든 게시물 수집
             print("관심목록 수집을 시작합니다...")
-            liked_list = self.get_liked_posts_from_profile()
+            liked_list = self.get_liked_posts_from_profile(incremental, max_scrolls, sink)
             
             # 결과 출력
-            self.print_liked_list(liked_list)
+            self.print_liked_list(liked_list, sink)
             
             return liked_list
 
@@ -224,22 +409,35 @@ class CarrotProfileReader:
 
         finally:
             print("종료 중...")
-            try:
-                if self.driver:
-                    self.driver.quit()
-            except:
-                pass
+            self.session.metrics.dump()
+            if self._owns_session:
+                self.session.quit()
 
 
 def main():
-    """메인 함수"""
-    reader = CarrotProfileReader()
-    liked_list = reader.run()
+    """메인 함수 (--attach: 세션 데몬의 세션 사용)"""
+    parser = argparse.ArgumentParser(description="당근마켓 관심목록 리더")
+    parser.add_argument("--attach", action="store_true", help="carrot_daemon.py가 유지하는 세션에 붙어서 실행")
+    parser.add_argument("--deep-link", help="관심목록 딥링크 URL")
+    parser.add_argument("--activity", help="관심목록 activity (예: .watchlist.WatchlistActivity)")
+    parser.add_argument("--stream", metavar="PATH", help="제목을 메모리에 모으지 않고 JSONL 파일에 바로 기록")
+    parser.add_argument("--profile", choices=list(PERFORMANCE_PROFILES), help="UiAutomator2 성능 프로필 (기본: 서버 기본값)")
+    args = parser.parse_args()
+
+    session = client_session(profile=args.profile) if args.attach else AppiumSession(profile=args.profile)
+    reader = CarrotProfileReader(session=session, watchlist_deep_link=args.deep_link, watchlist_activity=args.activity)
+    sink = TitleSink(args.stream) if args.stream else None
+    try:
+        liked_list = reader.run(sink=sink)
+    finally:
+        if sink is not None:
+            sink.close()
+        session.quit()  # 데몬 세션이면 연결만 끊음
     
     # 전역 변수에 결과 저장
     globals()['liked_list_from_profile'] = liked_list
     
-    print(f"\n수집 완료! 총 {len(liked_list)}개의 관심목록 항목을 찾았습니다.")
+    print(f"\n수집 완료! 총 {sink.count if sink is not None else len(liked_list)}개의 관심목록 항목을 찾았습니다.")
     
     return liked_list
 
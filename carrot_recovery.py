@@ -0,0 +1,200 @@
+from carrot_session import AppiumSession
+from selenium.common.exceptions import InvalidSessionIdException, StaleElementReferenceException, WebDriverException
+from typing import Callable, Dict, List, Optional
+import time
+import urllib3.exceptions
+
+
+class RecoveryFailed(RuntimeError):
+    """모든 복구 단계가 실패함"""
+
+
+class RecoveryManager:
+    """WebDriver 오류를 종류별로 나누고 가장 싼 복구부터 시도하는 단계별 복구
+
+    - STALE: 세션은 멀쩡함 - 호출한 쪽에서 요소를 다시 찾기만 하면 됨
+    - INSTRUMENTATION: UiAutomator2 서버 crash - 잠깐 기다렸다 확인(PROBE) → 화면을 유지한 새 세션(WARM)
+      → 앱을 다시 띄우는 새 세션(FULL)
+    - SESSION_GONE: 세션이 사라짐 - WARM → FULL
+    - SERVER_DOWN: Appium 서버 응답 없음 - 서버가 돌아올 때까지 기다린 뒤 화면을 유지한 새 세션(WAIT_SERVER) → FULL
+
+    복구 전 activity를 기억했다가 복구 후 다르면 그 activity로 되돌리고, 사고마다 복구 시간을 기록
+    """
+
+    # 오류 종류
+    STALE = "stale"
+    INSTRUMENTATION = "instrumentation"
+    SESSION_GONE = "session_gone"
+    SERVER_DOWN = "server_down"
+
+    # 복구 단계
+    REFIND = "refind"
+    PROBE = "probe"
+    WAIT_SERVER = "wait_server"
+    WARM = "warm"
+    FULL = "full"
+
+    TIERS = {
+        STALE: (REFIND,),
+        INSTRUMENTATION: (PROBE, WARM, FULL),
+        SESSION_GONE: (WARM, FULL),
+        SERVER_DOWN: (WAIT_SERVER, FULL),
+    }
+
+    # 응답 메시지로만 구분할 수 있는 오류 (Appium이 unknown error로 보내는 경우)
+    INSTRUMENTATION_MESSAGES = ("instrumentation process is not running", "UiAutomator2 server", "cannot be proxied")
+    SESSION_GONE_MESSAGES = ("A session is either terminated or not started", "invalid session id")
+
+    PROBE_DELAY = 0.5
+    SERVER_WAIT = 30
+    SERVER_POLL_INTERVAL = 1
+    RESTORE_SETTLE = 2
+
+    def __init__(self, session: AppiumSession, settle: Optional[Callable[[float], float]] = None,
+                 log: Callable[[str], None] = print):
+        """초기화 (settle: activity를 되돌린 뒤 화면 안정 대기 함수, 예: ScreenSettleWaiter.wait_until_stable,
+        log: 복구 내역 출력 함수)"""
+        self.session = session
+        self.settle = settle
+        self.log = log
+        self.incidents: List[Dict] = []
+
+    @property
+    def driver(self):
+        return self.session.driver
+
+    @classmethod
+    def classify(cls, error: Exception) -> Optional[str]:
+        """오류 종류 (복구할 수 없는 오류면 None)"""
+        if isinstance(error, StaleElementReferenceException):
+            return cls.STALE
+        if isinstance(error, InvalidSessionIdException):
+            return cls.SESSION_GONE
+        if isinstance(error, (urllib3.exceptions.HTTPError, ConnectionError)):
+            return cls.SERVER_DOWN
+        if isinstance(error, WebDriverException):
+            message_value = str(error)
+            if any(message in message_value for message in cls.INSTRUMENTATION_MESSAGES):
+                return cls.INSTRUMENTATION
+            if any(message in message_value for message in cls.SESSION_GONE_MESSAGES):
+                return cls.SESSION_GONE
+        return None
+
+    def _current_activity(self) -> Optional[str]:
+        """현재 activity (adb로 조회하므로 UiAutomator2 서버가 죽어도 세션만 있으면 동작)"""
+        try:
+            return self.driver.current_activity if self.driver is not None else None
+        except Exception:
+            return None
+
+    def _probe(self) -> bool:
+        """UiAutomator2 서버를 거치는 가벼운 명령으로 세션이 살아났는지 확인"""
+        try:
+            self.driver.get_window_size()
+            return True
+        except Exception:
+            return False
+
+    def _wait_for_server(self) -> bool:
+        deadline_value = time.monotonic() + self.SERVER_WAIT
+        while not self.session.server_ready():
+            if time.monotonic() >= deadline_value:
+                return False
+            time.sleep(self.SERVER_POLL_INTERVAL)
+        return True
+
+    def _run_tier(self, tier: str) -> bool:
+        """복구 단계 하나 실행 - 세션이 다시 명령을 받으면 True"""
+        try:
+            if tier == self.REFIND:
+                return True
+            if tier == self.PROBE:
+                time.sleep(self.PROBE_DELAY)
+                return self._probe()
+            if tier == self.WAIT_SERVER:
+                if not self._wait_for_server():
+                    return False
+                self.session.warm_restart()
+            elif tier == self.WARM:
+                self.session.warm_restart()
+            else:
+                self.session.restart()
+        except Exception as e:
+            self.log(f"복구 단계 {tier} 실패: {e}")
+            return False
+        return self._probe()
+
+    def _restore_activity(self, activity: Optional[str]) -> bool:
+        """복구 전 activity로 되돌리기 - 이미 같은 화면이면 아무것도 하지 않음"""
+        if activity is None or self._current_activity() == activity:
+            return True
+        try:
+            self.driver.execute_script("mobile: startActivity", {
+                'component': f"{self.session.desired_caps['appium:appPackage']}/{activity}",
+                'stop': False,
+            })
+        except WebDriverException as e:
+            self.log(f"이전 화면({activity}) 복원 실패: {e.msg}")
+            return False
+        if self.settle is not None:
+            self.settle(self.RESTORE_SETTLE)
+        return True
+
+    def recover(self, error: Exception) -> str:
+        """오류를 분류하고 단계별로 복구 - 사용한 단계 반환 (복구할 수 없는 오류는 그대로 다시 발생,
+        모든 단계가 실패하면 RecoveryFailed)"""
+        kind_value = self.classify(error)
+        if kind_value is None:
+            raise error
+
+        activity_value = self._current_activity() if kind_value != self.STALE else None
+        incident_value = self._open_incident(kind_value, activity_value)
+
+        for tier in self.TIERS[kind_value]:
+            if kind_value != self.STALE:
+                self.log(f"{kind_value} 감지 — 복구 단계 {tier} 시도")
+            if self._run_tier(tier):
+                incident_value.update(tier=tier, recovered=True)
+                break
+
+        if incident_value['recovered'] and kind_value != self.STALE:
+            incident_value['restored'] = self._restore_activity(activity_value)
+        return self._close_incident(incident_value, error)
+
+    def _open_incident(self, kind: str, activity: Optional[str]) -> Dict:
+        """사고 기록 시작"""
+        incident_value = {'kind': kind, 'tier': None, 'recovered': False, 'restored': None,
+                          'activity': activity, 'time': time.time(), 'started': time.monotonic()}
+        self.incidents.append(incident_value)
+        return incident_value
+
+    def _close_incident(self, incident: Dict, error: Exception) -> str:
+        """복구 시간을 기록하고 사용한 단계 반환 (모든 단계가 실패했으면 RecoveryFailed)"""
+        incident['seconds'] = time.monotonic() - incident.pop('started')
+        if not incident['recovered']:
+            raise RecoveryFailed(f"❌ 세션 복구 실패 ({incident['kind']}): {error}") from error
+        if incident['kind'] != self.STALE:
+            self.log(f"{incident['kind']} 복구 완료: {incident['tier']} 단계, {incident['seconds']:.1f}초")
+        return incident['tier']
+
+    def get_report(self) -> Dict:
+        """오류 종류별 사고 수, 복구 단계별 횟수, 평균 복구 시간"""
+        report_value = {}
+        for incident in self.incidents:
+            kind_report_value = report_value.setdefault(incident['kind'], {'count': 0, 'failed': 0, 'seconds': 0.0, 'tiers': {}})
+            kind_report_value['count'] += 1
+            kind_report_value['seconds'] += incident.get('seconds', 0.0)
+            if incident['recovered']:
+                kind_report_value['tiers'][incident['tier']] = kind_report_value['tiers'].get(incident['tier'], 0) + 1
+            else:
+                kind_report_value['failed'] += 1
+        for kind_report_value in report_value.values():
+            kind_report_value['mean_seconds'] = kind_report_value['seconds'] / kind_report_value['count']
+        return report_value
+
+    def print_report(self) -> None:
+        """복구 통계 출력 (사고가 없으면 출력하지 않음)"""
+        for kind, kind_report in self.get_report().items():
+            tiers_value = ", ".join(f"{tier} {count}회" for tier, count in kind_report['tiers'].items())
+            print(f"복구 {kind}: {kind_report['count']}회 (평균 {kind_report['mean_seconds']:.1f}초, "
+                  f"실패 {kind_report['failed']}회) - {tiers_value or '성공한 단계 없음'}")
@@ -0,0 +1,248 @@
+from appium.webdriver.appium_connection import AppiumConnection
+from appium.webdriver.client_config import AppiumClientConfig
+from carrot_session import AppiumSession
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import argparse
+import json
+import threading
+import time
+
+
+# 화면 상태를 바꾸는 명령 (재생 시 이 명령을 건너뛰어 앞쪽 응답을 쓰면 안 됨)
+MUTATING_SUFFIXES = ("/click", "/actions", "/back", "/execute/sync", "/value", "/clear", "/appium/settings")
+
+
+def is_mutating(method: str, path: str) -> bool:
+    """화면 상태를 바꾸는 요청인지"""
+    if method == "DELETE":
+        return True
+    return method == "POST" and path.endswith(MUTATING_SUFFIXES)
+
+
+class RecordingConnection(AppiumConnection):
+    """실제 Appium 서버와의 HTTP 교환을 JSONL로 기록하는 연결"""
+
+    def __init__(self, server_url: str, path: str):
+        """초기화"""
+        super().__init__(client_config=AppiumClientConfig(remote_server_addr=server_url))
+        self.record_path = path
+        self._lock = threading.Lock()
+        self._record_file = open(path, "a", encoding="utf-8")
+
+    def _request(self, method, url, body=None) -> dict:
+        started_value = time.perf_counter()
+        response_value = super()._request(method, url, body=body)
+        duration_value = time.perf_counter() - started_value
+
+        exchange_value = {
+            'method': method,
+            'path': urlparse(url).path,
+            'body': body if method in ("POST", "PUT") else None,
+            'response': response_value,
+            'duration': duration_value,
+        }
+        with self._lock:
+            self._record_file.write(json.dumps(exchange_value, ensure_ascii=False) + "\n")
+            self._record_file.flush()
+        return response_value
+
+    def close(self) -> None:
+        self._record_file.close()
+        super().close()
+
+
+class RecordingSession(AppiumSession):
+    """모든 WebDriver 교환을 기록하는 AppiumSession"""
+
+    def __init__(self, record_path: str, device_name: str = AppiumSession.DEFAULT_DEVICE_NAME,
+                 server_url: str = AppiumSession.DEFAULT_SERVER_URL):
+        """초기화"""
+        super().__init__(device_name, server_url)
+        self.record_path = record_path
+
+    def _command_executor(self):
+        return RecordingConnection(self.server_url, self.record_path)
+
+
+def load_exchanges(path: str) -> List[Dict]:
+    """기록 파일 읽기"""
+    with open(path, encoding="utf-8") as record_file:
+        return [json.loads(line) for line in record_file if line.strip()]
+
+
+class ReplayState:
+    """기록된 교환을 순서대로 찾아 돌려주는 재생 상태"""
+
+    def __init__(self, exchanges: List[Dict], latency: Optional[float] = None, latency_scale: float = 1.0):
+        """초기화 (latency: 고정 지연(초), None이면 기록된 지연 × latency_scale)"""
+        self.exchanges = exchanges
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.cursor = 0
+        self.served = 0
+        self.missed = 0
+        self.commands = {}
+        self._last_served: Dict[Tuple, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _find(self, key: Tuple) -> Optional[int]:
+        method_value, path_value = key[0], key[1]
+        mutating_value = is_mutating(method_value, path_value)
+        for position in range(self.cursor, len(self.exchanges)):
+            exchange_value = self.exchanges[position]
+            if (exchange_value['method'], exchange_value['path'], exchange_value['body']) == key:
+                return position
+            # 읽기 요청은 화면을 바꾼 명령 너머의 응답을 쓰지 않음 (폴링 횟수 차이 허용)
+            if not mutating_value and is_mutating(exchange_value['method'], exchange_value['path']):
+                break
+        return None
+
+    def next_response(self, method: str, path: str, body: Optional[str]) -> Tuple[Optional[Dict], float]:
+        """요청에 맞는 기록된 응답과 지연 시간"""
+        key_value = (method, path, body if method in ("POST", "PUT") else None)
+        with self._lock:
+            position_value = self._find(key_value)
+            if position_value is not None:
+                exchange_value = self.exchanges[position_value]
+                self.cursor = position_value + 1
+                self._last_served[key_value] = exchange_value
+            else:
+                # 기록보다 더 많이 폴링한 경우 같은 요청의 직전 응답을 반복
+                exchange_value = self._last_served.get(key_value)
+
+            if exchange_value is None:
+                self.missed += 1
+                return None, 0.0
+
+            self.served += 1
+            command_key = f"{method} {path.rsplit('/', 1)[-1] or path}"
+            self.commands[command_key] = self.commands.get(command_key, 0) + 1
+
+        if self.latency is not None:
+            return exchange_value['response'], self.latency
+        return exchange_value['response'], exchange_value.get('duration', 0.0) * self.latency_scale
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """기록된 응답을 돌려주는 Appium 대역 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self) -> None:
+        length_value = int(self.headers.get("Content-Length") or 0)
+        body_value = self.rfile.read(length_value).decode("utf-8") if length_value else None
+        path_value = urlparse(self.path).path
+
+        response_value, delay_value = self.server.state.next_response(self.command, path_value, body_value)
+        if delay_value:
+            time.sleep(delay_value)
+
+        if response_value is None:
+            status_value = 404
+            payload_value = json.dumps({'value': {
+                'error': 'unknown command',
+                'message': f'replay: no recorded exchange for {self.command} {path_value}',
+                'stacktrace': '',
+            }})
+        elif isinstance(response_value.get('status'), int) and response_value['status'] >= 400:
+            # selenium은 4xx/5xx 응답 본문을 그대로 value로 저장하므로 본문을 원래대로 돌려줌
+            status_value = response_value['status']
+            payload_value = response_value['value']
+        else:
+            status_value = 200
+            payload_value = json.dumps(response_value, ensure_ascii=False)
+
+        encoded_value = payload_value.encode("utf-8")
+        self.send_response(status_value)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(encoded_value)))
+        self.end_headers()
+        self.wfile.write(encoded_value)
+
+    do_GET = _reply
+    do_POST = _reply
+    do_DELETE = _reply
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class ReplayServer:
+    """기록 파일을 재생하는 로컬 Appium 대역 서버"""
+
+    def __init__(self, record_path: str, port: int = 0, latency: Optional[float] = None, latency_scale: float = 1.0):
+        """초기화 (port=0이면 빈 포트 자동 선택)"""
+        self.state = ReplayState(load_exchanges(record_path), latency, latency_scale)
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), ReplayHandler)
+        self.httpd.state = self.state
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def record(target: str, record_path: str, max_posts: int = 10) -> None:
+    """실제 디바이스에서 실행하며 교환 기록 (target: like, read, verify)"""
+    from carrot import verify_likes
+    from carrot_like import CarrotLikeBot
+    from carrot_read_like import CarrotProfileReader
+
+    with RecordingSession(record_path) as session:
+        if target == "like":
+            CarrotLikeBot(session=session).run(max_posts=max_posts)
+        elif target == "read":
+            CarrotProfileReader(session=session).run()
+        else:
+            verify_likes(session=session)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Appium 교환 기록/재생")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    record_parser = subparsers.add_parser("record", help="실제 디바이스 실행을 기록")
+    record_parser.add_argument("target", choices=["like", "read", "verify"])
+    record_parser.add_argument("path")
+    record_parser.add_argument("--max-posts", type=int, default=10)
+
+    serve_parser = subparsers.add_parser("serve", help="기록 파일을 Appium 대역 서버로 재생")
+    serve_parser.add_argument("path")
+    serve_parser.add_argument("--port", type=int, default=4724)
+    serve_parser.add_argument("--latency", type=float, default=None, help="고정 지연(초), 생략 시 기록된 지연 사용")
+    serve_parser.add_argument("--latency-scale", type=float, default=1.0)
+
+    args = parser.parse_args()
+    if args.mode == "record":
+        record(args.target, args.path, args.max_posts)
+    else:
+        server = ReplayServer(args.path, args.port, args.latency, args.latency_scale)
+        print(f"재생 서버 실행 중: {server.url} (교환 {len(server.state.exchanges)}개)")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+from carrot_index import load_known_titles
+from carrot_like import CarrotLikeBot
+from carrot_session import AppiumSession
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import argparse
+import json
+import time
+
+
+def load_inventory(path: str) -> List[Dict]:
+    """디바이스 목록 JSON 읽기
+
+    형식: [{"udid": "R3CN20HAC4A", "server_url": "http://127.0.0.1:4723", "system_port": 8200, "profile": "fast"}, ...]
+    (profile은 생략 가능 - carrot_session.PERFORMANCE_PROFILES 이름, "adaptive": true면 대기 시간 자동 조절,
+    "background_confirm": true면 좋아요 확인을 피드로 돌아가는 동안 진행, "index"는 관심목록 색인 파일 경로 -
+    색인에 있는 제목은 열지 않고 건너뜀, "watchlist_deep_link"/"watchlist_activity"는 carrot_async --watchlist가
+    관심목록으로 바로 이동할 딥링크 URL/activity)
+    """
+    with open(path, encoding="utf-8") as inventory_file:
+        return json.load(inventory_file)
+
+
+def run_device(device: Dict, max_posts: int = 10, enable_scroll: bool = True) -> Dict:
+    """디바이스 한 대에서 좋아요 봇 실행"""
+    session_value = AppiumSession.for_device(
+        device['udid'],
+        device.get('server_url', AppiumSession.DEFAULT_SERVER_URL),
+        device.get('system_port'),
+        device.get('profile'),
+    )
+    bot = CarrotLikeBot(device['udid'], session=session_value, known_titles=load_known_titles(device.get('index')),
+                        adaptive=device.get('adaptive', False),
+                        background_confirm=device.get('background_confirm', False))
+
+    started_value = time.monotonic()
+    try:
+        results_value = bot.run(max_posts=max_posts, enable_scroll=enable_scroll)
+    finally:
+        session_value.quit()
+    elapsed_value = time.monotonic() - started_value
+
+    return {
+        'udid': device['udid'],
+        'results': results_value,
+        'elapsed_seconds': elapsed_value,
+        'posts_per_minute': results_value['liked_count'] / elapsed_value * 60 if elapsed_value else 0.0,
+    }
+
+
+def merge_results(device_reports: List[Dict], elapsed_seconds: float) -> Dict:
+    """디바이스별 get_results()를 하나의 리포트로 합치기"""
+    liked_titles_value = []
+    failed_posts_value = []
+    processed_count_value = 0
+    for report in device_reports:
+        liked_titles_value.extend(report['results']['liked_titles'])
+        failed_posts_value.extend(report['results']['failed_posts'])
+        processed_count_value += report['results'].get('processed_count', 0)
+
+    return {
+        'liked_count': len(liked_titles_value),
+        'liked_titles': liked_titles_value,
+        'failed_posts': failed_posts_value,
+        'processed_count': processed_count_value,
+        'elapsed_seconds': elapsed_seconds,
+        'posts_per_minute': len(liked_titles_value) / elapsed_seconds * 60 if elapsed_seconds else 0.0,
+        'devices': device_reports,
+    }
+
+
+def run_devices(inventory: List[Dict], max_posts: int = 10, enable_scroll: bool = True,
+                max_workers: Optional[int] = None) -> Dict:
+    """디바이스마다 봇 하나씩 병렬 실행 (Appium 호출은 I/O 대기라 스레드 풀 사용)"""
+    started_value = time.monotonic()
+    if not inventory:
+        print("디바이스 목록이 비어 있음 - 실행할 디바이스 없음")
+        return merge_results([], 0.0)
+    with ThreadPoolExecutor(max_workers=max_workers or len(inventory)) as executor:
+        futures_value = [executor.submit(run_device, device, max_posts, enable_scroll) for device in inventory]
+        device_reports_value = []
+        for device, future in zip(inventory, futures_value):
+            try:
+                device_reports_value.append(future.result())
+            except Exception as e:
+                print(f"[{device['udid']}] 실행 실패: {e}")
+                device_reports_value.append({
+                    'udid': device['udid'],
+                    'results': {'liked_count': 0, 'liked_titles': [], 'failed_posts': [], 'processed_count': 0},
+                    'elapsed_seconds': 0.0,
+                    'posts_per_minute': 0.0,
+                    'error': str(e),
+                })
+
+    return merge_results(device_reports_value, time.monotonic() - started_value)
+
+
+def print_report(report: Dict) -> None:
+    """통합 결과 출력"""
+    print(f"\n=== 멀티 디바이스 결과 ===")
+    for device_report in report['devices']:
+        print(f"[{device_report['udid']}] 좋아요 {device_report['results']['liked_count']}개, "
+              f"{device_report['elapsed_seconds']:.1f}초, 분당 {device_report['posts_per_minute']:.2f}개")
+    print(f"전체: 좋아요 {report['liked_count']}개, 실패 {len(report['failed_posts'])}개, "
+          f"{report['elapsed_seconds']:.1f}초, 분당 {report['posts_per_minute']:.2f}개")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="여러 디바이스에서 좋아요 봇 동시 실행")
+    parser.add_argument("inventory", help="디바이스 목록 JSON 파일")
+    parser.add_argument("--max-posts", type=int, default=10)
+    parser.add_argument("--no-scroll", action="store_true")
+    args = parser.parse_args()
+
+    report = run_devices(load_inventory(args.inventory), args.max_posts, not args.no_scroll)
+    print_report(report)
+    return report
+
+
+if __name__ == "__main__":
+    main()
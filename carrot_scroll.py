@@ -0,0 +1,188 @@
+from carrot_snapshot import PageSnapshot, parse_bounds
+from selenium.common.exceptions import UnknownMethodException, WebDriverException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.actions import interaction
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.pointer_input import PointerInput
+from typing import Callable, Dict, Optional, Tuple
+
+
+class ScrollEngine:
+    """화면 크기를 캐시하고, 행 경계 기준으로 정확히 한 페이지씩 스크롤하는 엔진"""
+
+    DEFAULT_SCREEN_SIZE = {"width": 1080, "height": 2340}
+    # 스크롤이 한 행을 건너뛰지 않도록 조금 덜 스크롤 (px)
+    SAFETY_MARGIN = 20
+    # 이보다 짧은 거리는 행 경계 계산 실패로 보고 비율 스와이프 사용 (px)
+    MIN_PAGE_DISTANCE = 100
+    # 서버가 gesture 명령 자체를 모를 때의 응답 메시지 (Appium이 unknown command/unknown error로 보내는 경우)
+    UNSUPPORTED_MESSAGES = ("unknown command", "unknown mobile command", "unknown method", "not supported",
+                            "not implemented", "unsupported operation")
+
+    def __init__(self, driver_getter: Callable, settle: Optional[Callable[[float], float]] = None):
+        """초기화 (settle: 스크롤 후 화면 안정 대기 함수, 예: ScreenSettleWaiter.wait_until_stable)"""
+        self.driver_getter = driver_getter
+        self.settle = settle
+        self.gestures_supported = True
+        self._screen_size = None
+        self._screen_driver = None
+        self.stats = {'swipes': 0, 'gestures': 0, 'page_scrolls': 0}
+
+    @property
+    def driver(self):
+        return self.driver_getter()
+
+    def screen_size(self) -> Dict[str, int]:
+        """화면 크기 (세션마다 한 번만 조회)"""
+        if self._screen_size is None or self._screen_driver is not self.driver:
+            try:
+                self._screen_size = self.driver.get_window_size()
+            except Exception:
+                return dict(self.DEFAULT_SCREEN_SIZE)
+            self._screen_driver = self.driver
+        return self._screen_size
+
+    def _settle(self, delay: float) -> None:
+        if self.settle is not None and delay:
+            self.settle(delay)
+
+    def _w3c_swipe(self, x: int, start_y: int, end_y: int, hold: bool = False) -> None:
+        """W3C 터치 스와이프 (hold: 놓기 전에 멈춰서 관성 스크롤 방지)"""
+        actions = ActionChains(self.driver)
+        actions.w3c_actions = ActionBuilder(self.driver, mouse=PointerInput(interaction.POINTER_TOUCH, "touch"))
+        actions.w3c_actions.pointer_action.move_to_location(x, start_y)
+        actions.w3c_actions.pointer_action.pointer_down()
+        actions.w3c_actions.pointer_action.move_to_location(x, end_y)
+        if hold:
+            actions.w3c_actions.pointer_action.pause(0.2)
+        actions.w3c_actions.pointer_action.release()
+        actions.perform()
+        self.stats['swipes'] += 1
+
+    def swipe(self, start_ratio: float, end_ratio: float, settle_delay: float = 1) -> Tuple[int, int, int, int]:
+        """화면 높이 비율로 세로 스와이프 후 안정 대기 - 사용한 좌표 반환"""
+        screen_size_value = self.screen_size()
+        x_value = screen_size_value["width"] // 2
+        start_y_value = int(screen_size_value["height"] * start_ratio)
+        end_y_value = int(screen_size_value["height"] * end_ratio)
+
+        self._w3c_swipe(x_value, start_y_value, end_y_value)
+        self._settle(settle_delay)
+        return x_value, start_y_value, x_value, end_y_value
+
+    @classmethod
+    def is_unsupported(cls, error: WebDriverException) -> bool:
+        """서버가 명령을 지원하지 않아서 난 오류인지 확인 (crash/세션 종료 등 일시적인 오류는 False)"""
+        if isinstance(error, UnknownMethodException):
+            return True
+        message_value = (error.msg or str(error)).lower()
+        return any(message in message_value for message in cls.UNSUPPORTED_MESSAGES)
+
+    def _gesture(self, name: str, args: Dict) -> Optional[bool]:
+        """mobile: 스크롤 gesture 실행 (지원하지 않으면 None)
+
+        미지원 응답일 때만 이후 gesture를 끄고, 그 밖의 오류는 호출한 쪽에서 복구하도록 다시 발생
+        """
+        if not self.gestures_supported:
+            return None
+        try:
+            result_value = self.driver.execute_script(f"mobile: {name}", args)
+        except WebDriverException as e:
+            if not self.is_unsupported(e):
+                raise
+            print(f"{name} 미지원 — W3C 스와이프 사용: {e.msg}")
+            self.gestures_supported = False
+            return None
+        self.stats['gestures'] += 1
+        return bool(result_value)
+
+    def page_distance(self, snapshot: PageSnapshot, row_xpath: str) -> Optional[Tuple[Tuple[int, int, int, int], int]]:
+        """다음 페이지까지의 스크롤 거리 계산 - (목록 영역, 거리) 또는 None
+
+        잘려 보이는 첫 행(높이가 가장 큰 행보다 작고 목록 아래 끝에 닿은 행)의 위쪽이 목록 위쪽에 오도록 스크롤
+        """
+        rows_value = [(row, parse_bounds(row.get("bounds"))) for row in snapshot.xpath(row_xpath)]
+        rows_value = [(row, bounds) for row, bounds in rows_value if bounds is not None]
+        if not rows_value:
+            return None
+
+        area_value = parse_bounds(rows_value[0][0].getparent().get("bounds"))
+        if area_value is None:
+            return None
+        left_value, top_value, right_value, bottom_value = area_value
+
+        full_height_value = max(bounds[3] - bounds[1] for _, bounds in rows_value)
+        target_top_value = rows_value[-1][1][3]  # 모든 행이 다 보이면 마지막 행 아래까지
+        for _, bounds in rows_value:
+            reaches_bottom_value = bounds[3] >= bottom_value - 1
+            if bounds[1] > top_value and reaches_bottom_value and bounds[3] - bounds[1] < full_height_value:
+                target_top_value = bounds[1]
+                break
+
+        distance_value = target_top_value - top_value - self.SAFETY_MARGIN
+        if distance_value < self.MIN_PAGE_DISTANCE:
+            return None
+        return (left_value, top_value, right_value - left_value, bottom_value - top_value), distance_value
+
+    def scroll_page(self, snapshot: Optional[PageSnapshot], row_xpath: str, settle_delay: float = 1) -> Optional[bool]:
+        """행 경계 기준으로 한 페이지 아래로 스크롤 - 더 스크롤할 수 있는지 반환 (계산 불가 시 None)"""
+        if snapshot is None:
+            return None
+        page_value = self.page_distance(snapshot, row_xpath)
+        if page_value is None:
+            return None
+
+        (left_value, top_value, width_value, height_value), distance_value = page_value
+        self.stats['page_scrolls'] += 1
+        can_scroll_more_value = self._gesture("scrollGesture", {
+            'left': left_value, 'top': top_value, 'width': width_value, 'height': height_value,
+            'direction': 'down', 'percent': min(distance_value / height_value, 1.0),
+        })
+        if can_scroll_more_value is None:
+            # 목록 아래쪽에서 시작해 거리만큼 끌고 멈췄다 놓기 (관성 없이 정확한 거리)
+            x_value = left_value + width_value // 2
+            start_y_value = top_value + height_value - 1
+            self._w3c_swipe(x_value, start_y_value, max(top_value, start_y_value - distance_value), hold=True)
+            can_scroll_more_value = True
+
+        self._settle(settle_delay)
+        return can_scroll_more_value
+
+
+class EndOfListDetector:
+    """스크롤해도 화면이 그대로이거나 새 항목이 없으면 목록 끝으로 판단"""
+
+    STALL_LIMIT = 2
+    MAX_SCROLLS = 200
+
+    def __init__(self, stall_limit: int = STALL_LIMIT, max_scrolls: int = MAX_SCROLLS):
+        """초기화 (stall_limit: 연속 정체 허용 횟수, max_scrolls: 스크롤 상한)"""
+        self.stall_limit = stall_limit
+        self.max_scrolls = max_scrolls
+        self.scrolls = 0
+        self.stalls = 0
+        self._previous_hash = None
+
+    def observe(self, new_items: int, screen_hash: Optional[str] = None) -> None:
+        """현재 화면 결과 반영 (같은 화면이거나 새 항목이 없으면 정체로 계산)"""
+        same_screen_value = screen_hash is not None and screen_hash == self._previous_hash
+        self._previous_hash = screen_hash
+
+        if same_screen_value or new_items == 0:
+            self.stalls += 1
+        else:
+            self.stalls = 0
+
+    def scrolled(self) -> None:
+        """스크롤 한 번 기록"""
+        self.scrolls += 1
+
+    @property
+    def stalled(self) -> bool:
+        """연속 정체 횟수 초과 - 목록 끝"""
+        return self.stalls >= self.stall_limit
+
+    @property
+    def capped(self) -> bool:
+        """스크롤 상한 도달 - 끝까지 읽지 못하고 중단"""
+        return self.scrolls >= self.max_scrolls
@@ -0,0 +1,234 @@
+from appium import webdriver
+from appium.options.android import UiAutomator2Options
+from carrot_metrics import CommandMetrics
+from selenium.common.exceptions import WebDriverException
+from typing import Dict, Optional, Tuple
+import time
+import urllib.request
+
+
+# UiAutomator2 서버 설정 프로필 (driver.update_settings로 세션 시작 시 적용)
+PERFORMANCE_PROFILES = {
+    # UiAutomator2 기본값 - 앱이 idle이 될 때까지 기다린 뒤 명령 실행
+    "safe": {
+        "waitForIdleTimeout": 10000,
+        "waitForSelectorTimeout": 10000,
+        "ignoreUnimportantViews": False,
+        "enableMultiWindows": False,
+        "snapshotMaxDepth": 70,
+    },
+    # idle 대기 최소화 (봇이 직접 화면 안정화를 기다리므로), 얕은 계층구조 스냅샷
+    "fast": {
+        "waitForIdleTimeout": 100,
+        "waitForSelectorTimeout": 0,
+        "ignoreUnimportantViews": False,
+        "enableMultiWindows": False,
+        "snapshotMaxDepth": 50,
+    },
+    # fast + 중요하지 않은 뷰 생략 (계층구조가 작아지지만 위치 기반 XPath 인덱스가 바뀔 수 있어 벤치마크로 확인 필요)
+    "compact": {
+        "waitForIdleTimeout": 100,
+        "waitForSelectorTimeout": 0,
+        "ignoreUnimportantViews": True,
+        "enableMultiWindows": False,
+        "snapshotMaxDepth": 50,
+    },
+}
+
+
+class AttachedRemote(webdriver.Remote):
+    """이미 열려 있는 세션 ID에 붙는 driver (newSession 명령을 보내지 않음)"""
+
+    def __init__(self, session_id: str, command_executor, options):
+        """초기화"""
+        self._attach_session_id = session_id
+        super().__init__(command_executor=command_executor, options=options)
+
+    def start_session(self, capabilities, browser_profile=None) -> None:
+        self.session_id = self._attach_session_id
+        self.caps = {}
+
+
+class AppiumSession:
+    """여러 봇이 함께 쓰는 UiAutomator2 세션 (시작/재시작/종료를 한 곳에서 관리)"""
+
+    DEFAULT_DEVICE_NAME = "R3CN20HAC4A"
+    DEFAULT_SERVER_URL = "http://127.0.0.1:4723"
+    RESTART_DELAY = 2
+    # 붙은 세션을 봇이 기대하는 화면으로 되돌릴 때 최대 뒤로 가기 횟수
+    BACK_LIMIT = 4
+    # 앱을 멈추거나 다시 띄우지 않고 새 세션을 여는 capabilities (UiAutomator2 서버만 새로 시작, 현재 화면 유지)
+    WARM_RESTART_CAPABILITIES = {
+        "appium:skipServerInstallation": True,
+        "appium:skipDeviceInitialization": True,
+        "appium:dontStopAppOnReset": True,
+        "appium:autoLaunch": False,
+        # 이전 세션을 서버가 지우면 앱이 종료되므로 남겨둠 (quit() 때 정리)
+        "appium:sessionOverride": False,
+    }
+
+    def __init__(self, device_name: str = DEFAULT_DEVICE_NAME, server_url: str = DEFAULT_SERVER_URL,
+                 extra_capabilities: Optional[Dict] = None, attach_session_id: Optional[str] = None,
+                 profile: Optional[str] = None):
+        """초기화 (attach_session_id: 새 세션 대신 붙을 기존 세션 ID - carrot_daemon이 유지하는 세션,
+        profile: 세션 시작 시 적용할 PERFORMANCE_PROFILES 이름 - None이면 서버 설정을 건드리지 않음)"""
+        if profile is not None and profile not in PERFORMANCE_PROFILES:
+            raise ValueError(f"알 수 없는 성능 프로필: {profile} ({', '.join(PERFORMANCE_PROFILES)})")
+        self.device_name = device_name
+        self.server_url = server_url
+        self.attach_session_id = attach_session_id
+        self.profile = profile
+        self.attached = False
+        self.driver = None
+        self.start_count = 0
+        self.metrics = CommandMetrics(device_name)
+        self._abandoned_drivers = []
+        self._setup_capabilities(extra_capabilities or {})
+
+    @classmethod
+    def for_device(cls, udid: str, server_url: str = DEFAULT_SERVER_URL,
+                   system_port: Optional[int] = None, profile: Optional[str] = None) -> "AppiumSession":
+        """여러 디바이스를 동시에 돌릴 때 쓰는 디바이스별 세션 (udid, systemPort 지정)"""
+        # sessionOverride가 켜져 있으면 같은 서버의 다른 디바이스 세션이 끊기므로 끔
+        extra_capabilities_value = {"appium:udid": udid, "appium:sessionOverride": False}
+        if system_port is not None:
+            extra_capabilities_value["appium:systemPort"] = system_port
+        return cls(udid, server_url, extra_capabilities_value, profile=profile)
+
+    def _setup_capabilities(self, extra_capabilities: Dict) -> None:
+        """Appium capabilities 설정"""
+        self.desired_caps = {
+            "platformName": "Android",
+            "appium:deviceName": self.device_name,
+            "appium:automationName": "UiAutomator2",
+            "appium:appPackage": "com.towneers.www",
+            "appium:appActivity": ".launcher.LauncherActivity",
+            "appium:noReset": True,
+            "appium:dontStopAppOnReset": False,
+            "appium:newCommandTimeout": 0,
+            "appium:commandTimeouts": 600000,
+            "appium:keepAliveTimeout": 0,
+            "appium:autoGrantPermissions": True,
+            "appium:sessionOverride": True,
+            "appium:clearSystemFiles": False,
+            "appium:enforceAppInstall": False,
+        }
+        self.desired_caps.update(extra_capabilities)
+        self.options = UiAutomator2Options().load_capabilities(self.desired_caps)
+
+    def _command_executor(self):
+        """webdriver.Remote에 넘길 command_executor (하위 클래스에서 HTTP 계층 교체용)"""
+        return self.server_url
+
+    def _create_driver(self, options: Optional[UiAutomator2Options] = None) -> None:
+        self.driver = webdriver.Remote(command_executor=self._command_executor(), options=options or self.options)
+        self.metrics.attach(self.driver)
+        self.start_count += 1
+        self._apply_profile()
+
+    def _apply_profile(self) -> None:
+        if self.profile is not None:
+            self.driver.update_settings(PERFORMANCE_PROFILES[self.profile])
+            print(f"UiAutomator2 성능 프로필 적용: {self.profile}")
+
+    def apply_profile(self, profile: str) -> None:
+        """실행 중인 세션의 성능 프로필 변경 (이후 재시작에도 유지)"""
+        if profile not in PERFORMANCE_PROFILES:
+            raise ValueError(f"알 수 없는 성능 프로필: {profile} ({', '.join(PERFORMANCE_PROFILES)})")
+        self.profile = profile
+        if self.driver is not None:
+            self._apply_profile()
+
+    def _attach_driver(self) -> bool:
+        """attach_session_id 세션에 붙기 (세션이 살아 있지 않으면 False)"""
+        driver_value = AttachedRemote(self.attach_session_id, self._command_executor(), self.options)
+        try:
+            driver_value.current_activity
+        except WebDriverException as e:
+            print(f"기존 세션 {self.attach_session_id}에 붙지 못함 — 새 세션 시작: {e.msg}")
+            return False
+        self.metrics.attach(driver_value)
+        self.driver = driver_value
+        self.attached = True
+        self._apply_profile()
+        return True
+
+    def start(self):
+        """세션이 없을 때만 새로 시작 (이미 있으면 그대로 재사용, attach_session_id가 있으면 그 세션에 붙음)"""
+        if self.driver is None:
+            if self.attach_session_id and self._attach_driver():
+                print(f"기존 Appium session {self.attach_session_id}에 연결 완료")
+                return self.driver
+            self._create_driver()
+            print("Appium session 시작 완료")
+        return self.driver
+
+    def return_to(self, locator: Tuple[str, str]) -> bool:
+        """붙은 세션에서 locator가 보일 때까지 뒤로 가기 (이전 실행이 다른 화면에 남겨둔 경우)"""
+        for _ in range(self.BACK_LIMIT + 1):
+            if self.driver.find_elements(*locator):
+                return True
+            self.driver.back()
+        return False
+
+    def restart(self):
+        """crash 등으로 세션을 재시작"""
+        try:
+            if self.driver:
+                print("Appium 세션 재시작 중...")
+                self.driver.quit()
+        except:
+            pass
+
+        self.driver = None
+        self.attached = False
+        time.sleep(self.RESTART_DELAY)
+        self._create_driver()
+        print("Appium session 시작/재시작 완료")
+        return self.driver
+
+    def warm_restart(self):
+        """앱을 종료하지 않고 새 세션 시작 - UiAutomator2 서버만 다시 띄우고 현재 화면 유지
+
+        이전 세션을 지우면 앱이 종료되므로 quit() 때까지 남겨둠
+        """
+        if self.driver is not None and not self.attached:
+            self._abandoned_drivers.append(self.driver)
+        self.driver = None
+        self.attached = False
+        self._create_driver(UiAutomator2Options().load_capabilities(
+            dict(self.desired_caps, **self.WARM_RESTART_CAPABILITIES)))
+        print("Appium session 재시작 완료 (화면 유지)")
+        return self.driver
+
+    def server_ready(self, timeout: float = 2) -> bool:
+        """Appium 서버가 /status에 응답하는지"""
+        try:
+            with urllib.request.urlopen(f"{self.server_url.rstrip('/')}/status", timeout=timeout) as response:
+                return response.status == 200
+        except (OSError, ValueError):
+            return False
+
+    def quit(self) -> None:
+        """세션 종료 (붙은 세션은 다른 프로세스 것이므로 연결만 끊음, warm_restart로 남겨둔 세션도 정리)"""
+        try:
+            if self.driver and not self.attached:
+                self.driver.quit()
+        except:
+            pass
+        for driver in self._abandoned_drivers:
+            try:
+                driver.quit()
+            except:
+                pass
+        self._abandoned_drivers = []
+        self.driver = None
+        self.attached = False
+
+    def __enter__(self) -> "AppiumSession":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        print("공유 세션 종료 중...")
+        self.quit()
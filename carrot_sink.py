@@ -0,0 +1,47 @@
+from typing import Iterator
+import json
+import os
+
+
+class TitleSink:
+    """수집한 관심목록 제목을 바로 디스크에 쓰는 JSONL 파일 (목록 전체를 메모리에 두지 않음)"""
+
+    DEFAULT_PATH = "carrot_watchlist.jsonl"
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """초기화 (기존 파일은 새로 씀)"""
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+        self.count = 0
+
+    def write(self, title: str) -> None:
+        """제목 하나 기록"""
+        self._file.write(json.dumps({'title': title}, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def flush(self) -> None:
+        """화면 하나를 다 쓴 뒤 디스크로 내보내기"""
+        self._file.flush()
+
+    def close(self) -> None:
+        """파일 닫기"""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "TitleSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def iter_sink_titles(path: str = TitleSink.DEFAULT_PATH) -> Iterator[str]:
+    """TitleSink 파일의 제목을 한 줄씩 읽기 (마지막 줄이 잘렸으면 무시)"""
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as sink_file:
+        for line in sink_file:
+            try:
+                yield json.loads(line)['title']
+            except (ValueError, KeyError):
+                continue
@@ -0,0 +1,73 @@
+from lxml import etree
+from typing import List, Optional, Tuple, Union
+import re
+
+
+class PageSnapshot:
+    """driver.page_source 한 번으로 얻은 화면 계층구조 스냅샷"""
+
+    # 관심목록 XPath (CarrotProfileReader와 동일한 경로)
+    WATCHLIST_ROW_XPATH = "//android.view.View[@resource-id='root']/android.view.View/android.view.View/android.view.View[2]/android.view.View/android.view.View"
+    SECTION_END_TEXTS = ("관심 있을 만한 ", " 상품")
+
+    # 미리 컴파일된 XPath
+    _WATCHLIST_ROWS = etree.XPath(WATCHLIST_ROW_XPATH)
+    _ROW_TEXTVIEWS = etree.XPath(".//android.widget.TextView")
+
+    def __init__(self, page_source: str):
+        """초기화"""
+        self.page_source = page_source
+        self.root = etree.fromstring(page_source.encode("utf-8"))
+
+    @classmethod
+    def capture(cls, driver) -> "PageSnapshot":
+        """현재 화면의 page_source를 한 번 가져와 스냅샷 생성"""
+        return cls(driver.page_source)
+
+    def xpath(self, xpath_value: str, **variables) -> List:
+        """스냅샷에서 XPath 평가 (variables는 $이름으로 참조)"""
+        return self.root.xpath(xpath_value, **variables)
+
+    def watchlist_rows(self) -> List:
+        """관심목록 행 노드들"""
+        return self._WATCHLIST_ROWS(self.root)
+
+    def extract_watchlist_titles(self) -> List[Union[str, bool]]:
+        """관심목록 제목 추출 (종료 섹션 발견 시 마지막에 False 추가)"""
+        titles = []
+        for row in self.watchlist_rows():
+            textviews = self._ROW_TEXTVIEWS(row)
+            if not textviews:
+                continue
+
+            text = textviews[0].get("text")
+            if text == self.SECTION_END_TEXTS[0] and len(textviews) > 1:
+                if textviews[1].get("text") == self.SECTION_END_TEXTS[1]:
+                    titles.append(False)  # 종료 신호로 False 추가
+                    break
+
+            if text and text.strip():
+                titles.append(text.strip())
+
+        return titles
+
+
+_BOUNDS_PATTERN = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+
+def parse_bounds(bounds: Optional[str]) -> Optional[Tuple[int, int, int, int]]:
+    """UiAutomator2 bounds 속성 "[x1,y1][x2,y2]" 파싱"""
+    match_value = _BOUNDS_PATTERN.fullmatch(bounds or "")
+    if match_value is None:
+        return None
+    return tuple(int(group) for group in match_value.groups())
+
+
+def parse_page_source(page_source: Optional[str]) -> Optional[PageSnapshot]:
+    """page_source 문자열 파싱 (실패 시 None)"""
+    if not page_source:
+        return None
+    try:
+        return PageSnapshot(page_source)
+    except etree.XMLSyntaxError:
+        return None
@@ -0,0 +1,915 @@
+from carrot_titles import normalize_title
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from lxml import etree
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import tracemalloc
+import uuid
+
+
+# 합성 제목/행에 쓰는 단어들
+TITLE_WORDS = ("미개봉", "급처", "상태 좋은", "거의 새것", "정품", "이사 정리", "한 번 사용한", "박스 포함")
+ITEM_WORDS = ("아이폰 13", "에어팟 프로", "캠핑 의자", "전기포트", "원목 책상", "유아 카시트", "닌텐도 스위치",
+              "로봇청소기", "자전거", "겨울 패딩", "커피머신", "모니터 27인치", "전동 킥보드", "가습기")
+LOCATIONS = ("역삼동", "서초동", "망원동", "상도동", "연남동", "정자동", "중동", "송도동")
+STATUS_WORDS = ("거래완료", "예약중")
+
+W3C_ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class SyntheticError(Exception):
+    """W3C 오류 응답으로 바뀌는 예외"""
+
+    def __init__(self, error: str, message: str, status: int = 404):
+        """초기화 (error: W3C 오류 이름, status: HTTP 상태 코드)"""
+        super().__init__(message)
+        self.error = error
+        self.message = message
+        self.status = status
+        self.command = None
+
+
+def _bounds_text(bounds: Tuple[int, int, int, int]) -> str:
+    left_value, top_value, right_value, bottom_value = bounds
+    return f"[{left_value},{top_value}][{right_value},{bottom_value}]"
+
+
+def _bounds_of(node) -> Tuple[int, int, int, int]:
+    return tuple(int(value) for value in re.findall(r"-?\d+", node.get("bounds")))
+
+
+class SyntheticCarrot:
+    """당근마켓 앱 화면(피드, 게시물 상세, 프로필, 관심목록)을 UiAutomator2 page_source 형식으로 만드는 합성 앱
+
+    화면 크기와 상관없이 수만 개짜리 피드/관심목록을 만들 수 있고, 화면마다 보이는 행만 그리므로 목록 크기가
+    커져도 page_source 크기는 실제 디바이스와 같음. 레이아웃 변형("자세히 보기" 버튼, 제목 위치),
+    "거래완료"/"예약중" 제목, 관심목록 끝의 "관심 있을 만한 상품" 섹션을 비율/개수로 조절.
+    좋아요를 누르면 관심목록 맨 위에 추가되고 토스트가 TOAST_SECONDS 동안 보임
+    """
+
+    PACKAGE = "com.towneers.www"
+    SCREEN_SIZE = {'width': 1080, 'height': 2340}
+    # 목록 영역 (상단 바 아래 ~ 하단 네비게이션 바 위)
+    LIST_TOP = 200
+    LIST_BOTTOM = 2200
+    FEED_ROW_HEIGHT = 300
+    WATCHLIST_ROW_HEIGHT = 264
+    TOAST_SECONDS = 2.0
+    TOAST_ADDED = "관심목록에 추가했어요"
+    TOAST_REMOVED = "관심목록에서 삭제했어요"
+    SECTION_TEXTS = ("관심 있을 만한 ", " 상품")
+    NAVIGATION_LABELS = ("홈", "동네생활", "동네지도", "채팅", "나의 당근")
+
+    # 화면
+    FEED = "feed"
+    DETAIL = "detail"
+    PROFILE = "profile"
+    WATCHLIST = "watchlist"
+
+    ACTIVITIES = {
+        FEED: ".main.MainActivity",
+        PROFILE: ".main.MainActivity",
+        DETAIL: ".article.ArticleDetailActivity",
+        WATCHLIST: ".watchlist.WatchlistActivity",
+    }
+
+    def __init__(self, feed_size: int = 200, watchlist_size: int = 1000, seed: int = 0,
+                 detail_button_ratio: float = 0.3, title_view3_ratio: float = 0.5, status_ratio: float = 0.2,
+                 liked_ratio: float = 0.1, recommendations: int = 6):
+        """초기화 (feed_size: 피드 게시물 수, watchlist_size: 피드에 없는 관심목록 항목 수,
+        detail_button_ratio: "자세히 보기" 버튼이 있는 게시물 비율, title_view3_ratio: 제목이 View[3]에 있는 비율,
+        status_ratio: 제목에 거래 상태가 붙은 비율, liked_ratio: 이미 관심 추가된 피드 게시물 비율,
+        recommendations: 관심목록 끝 "관심 있을 만한 상품" 행 수 - 0이면 섹션 없이 목록이 끝남)"""
+        self.random = random.Random(seed)
+        self.detail_button_ratio = detail_button_ratio
+        self.title_view3_ratio = title_view3_ratio
+        self.status_ratio = status_ratio
+        self.feed = [self._make_post(number) for number in range(feed_size)]
+        # 관심목록 (맨 앞이 가장 최근): 이미 관심 추가된 피드 게시물 + 피드에 없는 게시물
+        self.watchlist = []
+        for post in self.feed:
+            if self.random.random() < liked_ratio:
+                post['liked'] = True
+                self.watchlist.append(post)
+        for number in range(feed_size, feed_size + watchlist_size):
+            post_value = self._make_post(number)
+            post_value['liked'] = True
+            self.watchlist.append(post_value)
+        self.recommended = [self._make_post(number)
+                            for number in range(feed_size + watchlist_size, feed_size + watchlist_size + recommendations)]
+
+        self.stack: List[Tuple[str, Optional[Dict]]] = [(self.FEED, None)]
+        self.offsets = {self.FEED: 0, self.WATCHLIST: 0}
+        # 피드를 당겨서 새로고침할 때마다 다음 게시물 묶음이 맨 위에 옴
+        self.feed_start = 0
+        self.last_post = None
+        self.toast = None
+        self.toast_until = 0.0
+        self.version = 0
+        self._tree = None
+        self._toast_node = None
+        self._handlers: Dict = {}
+        self._elements: Dict[str, object] = {}
+        self._element_ids: Dict = {}
+        self.stats = {'likes': 0, 'unlikes': 0, 'refreshes': 0, 'renders': 0}
+
+    def _make_post(self, number: int) -> Dict:
+        title_value = f"{self.random.choice(TITLE_WORDS)} {self.random.choice(ITEM_WORDS)} {number}"
+        display_title_value = title_value
+        if self.random.random() < self.status_ratio:
+            display_title_value = f"{self.random.choice(STATUS_WORDS)} {title_value}"
+        return {
+            'title': title_value,
+            'display_title': display_title_value,
+            'price': f"{self.random.randrange(1, 500) * 1000:,}원",
+            'location': self.random.choice(LOCATIONS),
+            'ago': f"{self.random.randrange(1, 59)}분 전",
+            'seller': f"판매자{self.random.randrange(1000)}",
+            'category': self.random.choice(("디지털기기", "생활가전", "가구/인테리어", "스포츠/레저")),
+            'counts': (self.random.randrange(10), self.random.randrange(30), self.random.randrange(500)),
+            'detail_button': self.random.random() < self.detail_button_ratio,
+            'title_in_view3': self.random.random() < self.title_view3_ratio,
+            'liked': False,
+        }
+
+    # ---- 화면 상태 ----
+
+    @property
+    def screen(self) -> str:
+        return self.stack[-1][0]
+
+    def _changed(self) -> None:
+        """화면이 바뀜 - 다시 그리고, 이전 element는 stale로 만듦"""
+        self.version += 1
+        self._tree = None
+
+    def _push(self, screen: str, post: Optional[Dict] = None) -> None:
+        if screen == self.WATCHLIST:
+            self.offsets[self.WATCHLIST] = 0
+        if post is not None:
+            self.last_post = post
+        self.stack.append((screen, post))
+        self._changed()
+
+    def _switch_tab(self, screen: str) -> None:
+        self.stack = [(screen, None)]
+        self._changed()
+
+    def _toggle_like(self, post: Dict) -> None:
+        post['liked'] = not post['liked']
+        if post['liked']:
+            self.watchlist.insert(0, post)
+            self.stats['likes'] += 1
+            self._show_toast(self.TOAST_ADDED)
+        else:
+            self.watchlist.remove(post)
+            self.stats['unlikes'] += 1
+            self._show_toast(self.TOAST_REMOVED)
+        self._changed()
+
+    def _show_toast(self, text: str) -> None:
+        self.toast = text
+        self.toast_until = time.monotonic() + self.TOAST_SECONDS
+
+    def _row_count(self, screen: str) -> int:
+        if screen == self.FEED:
+            return len(self.feed) - self.feed_start
+        section_rows_value = 1 + len(self.recommended) if self.recommended else 0
+        return len(self.watchlist) + section_rows_value
+
+    def _list_bottom(self, screen: str) -> int:
+        """목록 영역 아래쪽 (관심목록 화면은 네비게이션 바가 없어 화면 끝까지)"""
+        return self.LIST_BOTTOM if screen == self.FEED else self.SCREEN_SIZE['height']
+
+    def _max_offset(self, screen: str) -> int:
+        row_height_value = self.FEED_ROW_HEIGHT if screen == self.FEED else self.WATCHLIST_ROW_HEIGHT
+        return max(0, self._row_count(screen) * row_height_value - (self._list_bottom(screen) - self.LIST_TOP))
+
+    def _scroll(self, distance: int) -> bool:
+        """현재 목록을 distance(px)만큼 스크롤 (양수: 아래로) - 더 스크롤할 수 있으면 True"""
+        screen_value = self.screen
+        if screen_value not in self.offsets:
+            return False
+        if screen_value == self.FEED and distance < 0 and self.offsets[self.FEED] == 0:
+            return self._refresh_feed()
+        offset_value = min(max(self.offsets[screen_value] + distance, 0), self._max_offset(screen_value))
+        if offset_value != self.offsets[screen_value]:
+            self.offsets[screen_value] = offset_value
+            self._changed()
+        return offset_value < self._max_offset(screen_value)
+
+    def _refresh_feed(self) -> bool:
+        """피드 새로고침 - 지금 보이던 게시물 다음 묶음을 맨 위에 보여줌 (더 없으면 그대로)"""
+        visible_rows_value = -(-(self.LIST_BOTTOM - self.LIST_TOP) // self.FEED_ROW_HEIGHT)
+        feed_start_value = min(self.feed_start + visible_rows_value, len(self.feed))
+        self.stats['refreshes'] += 1
+        if feed_start_value != self.feed_start:
+            self.feed_start = feed_start_value
+            self._changed()
+        return self.feed_start < len(self.feed)
+
+    # ---- 그리기 ----
+
+    def _add(self, parent, class_name: str, bounds: Tuple[int, int, int, int], text: str = "",
+             content_desc: str = "", resource_id: str = "", clickable: bool = False, scrollable: bool = False,
+             checked: Optional[bool] = None, handler: Optional[Callable[[], None]] = None):
+        """UiAutomator2와 같은 속성을 가진 노드 추가 (handler: 클릭/탭 시 실행할 동작)"""
+        node_value = etree.SubElement(parent, class_name, {
+            'index': str(len(parent)),
+            'package': self.PACKAGE,
+            'class': class_name,
+            'text': text,
+            'resource-id': resource_id,
+            'checkable': "true" if checked is not None else "false",
+            'checked': "true" if checked else "false",
+            'clickable': "true" if clickable or handler is not None else "false",
+            'enabled': "true",
+            'focusable': "true" if clickable or handler is not None else "false",
+            'focused': "false",
+            'long-clickable': "false",
+            'password': "false",
+            'scrollable': "true" if scrollable else "false",
+            'selected': "false",
+            'bounds': _bounds_text(bounds),
+            'displayed': "true",
+            'content-desc': content_desc,
+        })
+        if handler is not None:
+            self._handlers[node_value] = handler
+        return node_value
+
+    def _add_clipped(self, parent, class_name: str, bounds: Tuple[int, int, int, int], clip: Tuple[int, int], **attributes):
+        """목록 영역(clip: 위, 아래) 안에 보이는 부분만 남긴 노드 추가 (보이지 않으면 None)"""
+        top_value, bottom_value = max(bounds[1], clip[0]), min(bounds[3], clip[1])
+        if bottom_value <= top_value:
+            return None
+        return self._add(parent, class_name, (bounds[0], top_value, bounds[2], bottom_value), **attributes)
+
+    def _visible_rows(self, screen: str, row_height: int):
+        """(행 번호, 화면상 위쪽 y) - 목록 영역에 조금이라도 보이는 행만"""
+        offset_value = self.offsets[screen]
+        first_value = offset_value // row_height
+        last_value = min(self._row_count(screen), (offset_value + self._list_bottom(screen) - self.LIST_TOP) // row_height + 1)
+        for row in range(first_value, last_value):
+            yield row, self.LIST_TOP + row * row_height - offset_value
+
+    def _navigation_bar(self, parent) -> None:
+        width_value = self.SCREEN_SIZE['width']
+        bar_value = self._add(parent, "android.widget.LinearLayout",
+                              (0, self.LIST_BOTTOM, width_value, self.SCREEN_SIZE['height']),
+                              resource_id=f"{self.PACKAGE}:id/navigation_bar")
+        item_width_value = width_value // len(self.NAVIGATION_LABELS)
+        for position, label in enumerate(self.NAVIGATION_LABELS):
+            left_value = position * item_width_value
+            target_value = {0: self.FEED, 4: self.PROFILE}.get(position)
+            item_value = self._add(bar_value, "android.widget.FrameLayout",
+                                   (left_value, self.LIST_BOTTOM, left_value + item_width_value, self.SCREEN_SIZE['height']),
+                                   content_desc=label, clickable=True,
+                                   handler=(lambda screen=target_value: self._switch_tab(screen)) if target_value else None)
+            self._add(item_value, "android.widget.ImageView",
+                      (left_value + 70, self.LIST_BOTTOM + 20, left_value + item_width_value - 70, self.LIST_BOTTOM + 90),
+                      resource_id=f"{self.PACKAGE}:id/navigation_bar_item_icon_view")
+            self._add(item_value, "android.widget.TextView",
+                      (left_value + 20, self.LIST_BOTTOM + 95, left_value + item_width_value - 20, self.LIST_BOTTOM + 130),
+                      text=label)
+
+    def _compose_base(self, frame):
+        """ComposeView/View/View/View - CarrotLikeBot.COMPOSE_VIEW_BASE와 같은 깊이"""
+        full_value = (0, 0, self.SCREEN_SIZE['width'], self.SCREEN_SIZE['height'])
+        node_value = self._add(frame, "androidx.compose.ui.platform.ComposeView", full_value)
+        for _ in range(3):
+            node_value = self._add(node_value, "android.view.View", full_value)
+        return node_value
+
+    def _render_feed(self, frame) -> None:
+        width_value = self.SCREEN_SIZE['width']
+        clip_value = (self.LIST_TOP, self.LIST_BOTTOM)
+        list_value = self._add(frame, "androidx.recyclerview.widget.RecyclerView",
+                               (0, self.LIST_TOP, width_value, self.LIST_BOTTOM),
+                               resource_id=f"{self.PACKAGE}:id/feedRecyclerView", scrollable=True)
+        for row, top in self._visible_rows(self.FEED, self.FEED_ROW_HEIGHT):
+            post_value = self.feed[self.feed_start + row]
+            row_value = self._add_clipped(
+                list_value, "android.view.ViewGroup", (0, top, width_value, top + self.FEED_ROW_HEIGHT), clip_value,
+                content_desc=f"{post_value['display_title']}, {post_value['price']}, {post_value['location']}, "
+                             f"{post_value['ago']}\n관심 {post_value['counts'][1]}",
+                handler=lambda post=post_value: self._push(self.DETAIL, post))
+            self._add_clipped(row_value, "android.widget.ImageView", (30, top + 30, 270, top + 270), clip_value)
+            self._add_clipped(row_value, "android.widget.TextView", (300, top + 30, 1050, top + 100), clip_value,
+                              text=post_value['display_title'])
+            self._add_clipped(row_value, "android.widget.TextView", (300, top + 110, 1050, top + 160), clip_value,
+                              text=f"{post_value['location']} · {post_value['ago']}")
+            self._add_clipped(row_value, "android.widget.TextView", (300, top + 170, 1050, top + 230), clip_value,
+                              text=post_value['price'])
+        self._navigation_bar(frame)
+
+    def _render_detail(self, frame, post: Dict) -> None:
+        width_value = self.SCREEN_SIZE['width']
+        base_value = self._compose_base(frame)
+
+        header_value = self._add(base_value, "android.view.View", (0, 0, width_value, 1300))
+        pager_value = self._add(header_value, "android.view.View", (0, 0, width_value, 900))
+        self._add(pager_value, "android.widget.ImageView", (0, 0, width_value, 900))
+        seller_value = self._add(header_value, "android.view.View", (0, 900, width_value, 1040))
+        self._add(seller_value, "android.widget.TextView", (40, 920, 600, 980), text=post['seller'])
+        self._add(seller_value, "android.widget.TextView", (40, 985, 600, 1030), text=post['location'])
+        meta_text_value = f"{post['category']} · {post['ago']}"
+        if post['title_in_view3']:
+            title_row_value = self._add(header_value, "android.view.View", (0, 1040, width_value, 1140))
+            self._add(title_row_value, "android.widget.TextView", (40, 1050, 1040, 1130), text=post['display_title'])
+            meta_row_value = self._add(header_value, "android.view.View", (0, 1140, width_value, 1300))
+            self._add(meta_row_value, "android.widget.TextView", (40, 1150, 1040, 1200), text=meta_text_value)
+        else:
+            # View[3]의 자식이 하나가 아니면 제목은 View[4]의 첫 번째 자식
+            badge_row_value = self._add(header_value, "android.view.View", (0, 1040, width_value, 1100))
+            self._add(badge_row_value, "android.widget.TextView", (40, 1045, 300, 1095), text="끌올")
+            self._add(badge_row_value, "android.widget.TextView", (320, 1045, 700, 1095), text=post['ago'])
+            title_row_value = self._add(header_value, "android.view.View", (0, 1100, width_value, 1300))
+            self._add(title_row_value, "android.widget.TextView", (40, 1110, 1040, 1190), text=post['display_title'])
+            self._add(title_row_value, "android.widget.TextView", (40, 1200, 1040, 1250), text=meta_text_value)
+
+        body_value = self._add(base_value, "android.view.View", (0, 1300, width_value, 1800))
+        self._add(body_value, "android.widget.TextView", (40, 1320, 1040, 1780),
+                  text=f"{post['title']} 팝니다. 직거래는 {post['location']}에서 가능해요.")
+        stats_value = self._add(base_value, "android.view.View", (0, 1800, width_value, 1880))
+        self._add(stats_value, "android.widget.TextView", (40, 1810, 1040, 1870),
+                  text="채팅 {} · 관심 {} · 조회 {}".format(*post['counts']))
+        if post['detail_button']:
+            more_value = self._add(base_value, "android.view.View", (0, 1880, width_value, 2000))
+            self._add(more_value, "android.widget.TextView", (40, 1890, 1040, 1990), text="자세히 보기",
+                      handler=lambda: None)
+
+        bottom_value = self._add(base_value, "android.view.View", (0, 2200, width_value, self.SCREEN_SIZE['height']))
+        self._add(bottom_value, "android.view.View", (20, 2220, 140, 2320), content_desc="관심", checked=post['liked'],
+                  handler=lambda: self._toggle_like(post))
+        self._add(bottom_value, "android.widget.TextView", (170, 2230, 600, 2310), text=post['price'])
+        self._add(bottom_value, "android.widget.Button", (760, 2220, 1060, 2320), text="채팅하기", handler=lambda: None)
+
+    def _render_profile(self, frame) -> None:
+        width_value = self.SCREEN_SIZE['width']
+        base_value = self._compose_base(frame)
+        header_value = self._add(base_value, "android.view.View", (0, self.LIST_TOP, width_value, 600))
+        self._add(header_value, "android.widget.TextView", (40, 250, 700, 330), text="합성 사용자")
+        menu_value = self._add(base_value, "android.view.View", (0, 600, width_value, 1200))
+        for position, label in enumerate(("관심목록", "판매내역", "구매내역")):
+            top_value = 620 + position * 150
+            self._add(menu_value, "android.widget.TextView", (40, top_value, 1040, top_value + 120), text=label,
+                      handler=(lambda: self._push(self.WATCHLIST)) if label == "관심목록" else (lambda: None))
+        self._navigation_bar(frame)
+
+    def _render_watchlist(self, frame) -> None:
+        width_value = self.SCREEN_SIZE['width']
+        clip_value = (self.LIST_TOP, self.SCREEN_SIZE['height'])
+        full_value = (0, 0, width_value, self.SCREEN_SIZE['height'])
+        compose_value = self._add(frame, "androidx.compose.ui.platform.ComposeView", full_value)
+        # //android.view.View[@resource-id='root']/View/View/View[2]/View/View (PageSnapshot.WATCHLIST_ROW_XPATH)
+        root_value = self._add(compose_value, "android.view.View", full_value, resource_id="root")
+        screen_value = self._add(self._add(root_value, "android.view.View", full_value), "android.view.View", full_value)
+        top_bar_value = self._add(screen_value, "android.view.View", (0, 0, width_value, self.LIST_TOP))
+        self._add(top_bar_value, "android.widget.TextView", (150, 60, 930, 140), text="관심목록")
+        area_value = self._add(screen_value, "android.view.View", (0, self.LIST_TOP, width_value, self.SCREEN_SIZE['height']),
+                               scrollable=True)
+        list_value = self._add(area_value, "android.view.View", (0, self.LIST_TOP, width_value, self.SCREEN_SIZE['height']))
+
+        row_height_value = self.WATCHLIST_ROW_HEIGHT
+        for row, top in self._visible_rows(self.WATCHLIST, row_height_value):
+            row_value = self._add_clipped(list_value, "android.view.View", (0, top, width_value, top + row_height_value),
+                                          clip_value)
+            if row == len(self.watchlist):
+                self._add_clipped(row_value, "android.widget.TextView", (40, top + 100, 500, top + 170), clip_value,
+                                  text=self.SECTION_TEXTS[0])
+                self._add_clipped(row_value, "android.widget.TextView", (500, top + 100, 700, top + 170), clip_value,
+                                  text=self.SECTION_TEXTS[1])
+                continue
+            post_value = self.watchlist[row] if row < len(self.watchlist) else self.recommended[row - len(self.watchlist) - 1]
+            self._add_clipped(row_value, "android.widget.ImageView", (30, top + 20, 250, top + 240), clip_value)
+            self._add_clipped(row_value, "android.widget.TextView", (280, top + 30, 1050, top + 90), clip_value,
+                              text=post_value['display_title'])
+            self._add_clipped(row_value, "android.widget.TextView", (280, top + 100, 1050, top + 150), clip_value,
+                              text=f"{post_value['location']} · {post_value['ago']}")
+            self._add_clipped(row_value, "android.widget.TextView", (280, top + 160, 1050, top + 220), clip_value,
+                              text=post_value['price'])
+
+    def _render(self):
+        """현재 화면의 계층구조 (화면이 바뀌지 않았으면 그대로 재사용)"""
+        if self._tree is None:
+            self._handlers = {}
+            self._elements = {}
+            self._element_ids = {}
+            self._toast_node = None
+            root_value = etree.Element("hierarchy", {
+                'index': "0", 'class': "hierarchy", 'rotation': "0",
+                'width': str(self.SCREEN_SIZE['width']), 'height': str(self.SCREEN_SIZE['height']),
+            })
+            frame_value = self._add(root_value, "android.widget.FrameLayout",
+                                    (0, 0, self.SCREEN_SIZE['width'], self.SCREEN_SIZE['height']))
+            screen_value, post_value = self.stack[-1]
+            if screen_value == self.FEED:
+                self._render_feed(frame_value)
+            elif screen_value == self.DETAIL:
+                self._render_detail(frame_value, post_value)
+            elif screen_value == self.PROFILE:
+                self._render_profile(frame_value)
+            else:
+                self._render_watchlist(frame_value)
+            self._tree = root_value
+            self.stats['renders'] += 1
+        self._sync_toast()
+        return self._tree
+
+    def _sync_toast(self) -> None:
+        """토스트는 화면과 상관없이 TOAST_SECONDS 동안 맨 위에 보임 (element는 stale로 만들지 않음)"""
+        visible_value = self.toast is not None and time.monotonic() < self.toast_until
+        if self._toast_node is not None and (not visible_value or self._toast_node.get("text") != self.toast):
+            self._tree.remove(self._toast_node)
+            self._toast_node = None
+        if visible_value and self._toast_node is None:
+            self._toast_node = self._add(self._tree, "android.widget.Toast", (240, 1900, 840, 2000), text=self.toast)
+
+    def page_source(self) -> str:
+        """현재 화면 page_source (UiAutomator2 형식)"""
+        return "<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>" + etree.tostring(self._render(), encoding="unicode")
+
+    # ---- WebDriver 명령 ----
+
+    def _element_id(self, node) -> str:
+        if node not in self._element_ids:
+            element_id_value = f"{self.version}-{len(self._elements)}"
+            self._element_ids[node] = element_id_value
+            self._elements[element_id_value] = node
+        return self._element_ids[node]
+
+    def element(self, element_id: str):
+        """element id의 노드 (화면이 바뀌었으면 stale)"""
+        self._render()
+        node_value = self._elements.get(element_id)
+        if node_value is None:
+            raise SyntheticError("stale element reference",
+                                 f"The element '{element_id}' does not exist in DOM anymore")
+        return node_value
+
+    @staticmethod
+    def _selector_xpath(using: str, value: str) -> Tuple[str, Dict[str, str]]:
+        """W3C 검색 방식을 XPath로 변환 (accessibility id, id, -android uiautomator의 text/resourceId/description)"""
+        if using == "xpath":
+            return value, {}
+        if using == "accessibility id":
+            return "//*[@content-desc=$value]", {'value': value}
+        if using == "id":
+            return "//*[@resource-id=$value]", {'value': value}
+        if using == "-android uiautomator":
+            attributes_value = {'text': "text", 'resourceId': "resource-id", 'description': "content-desc",
+                                'className': "class"}
+            conditions_value = []
+            variables_value = {}
+            for position, (method, argument) in enumerate(re.findall(r'\.(\w+)\("((?:[^"\\]|\\.)*)"\)', value)):
+                if method not in attributes_value:
+                    raise SyntheticError("invalid selector", f"UiSelector method '{method}' is not supported", 400)
+                variables_value[f"v{position}"] = argument
+                conditions_value.append(f"@{attributes_value[method]}=$v{position}")
+            if not conditions_value:
+                raise SyntheticError("invalid selector", f"Could not parse UiSelector: {value}", 400)
+            return f"//*[{' and '.join(conditions_value)}]", variables_value
+        raise SyntheticError("invalid selector", f"Locator strategy '{using}' is not supported", 400)
+
+    def find(self, using: str, value: str, parent_id: Optional[str] = None) -> List[str]:
+        """element id 목록 (parent_id: 그 element 아래에서 검색)"""
+        context_value = self.element(parent_id) if parent_id is not None else self._render()
+        xpath_value, variables_value = self._selector_xpath(using, value)
+        if parent_id is not None and xpath_value.startswith("//") and using != "xpath":
+            xpath_value = "." + xpath_value
+        try:
+            nodes_value = context_value.xpath(xpath_value, **variables_value)
+        except etree.XPathError as e:
+            raise SyntheticError("invalid selector", f"Invalid XPath '{value}': {e}", 400)
+        return [self._element_id(node) for node in nodes_value if isinstance(node, etree._Element)]
+
+    def attribute(self, element_id: str, name: str) -> Optional[str]:
+        return self.element(element_id).get(name)
+
+    def rect(self, element_id: str) -> Dict[str, int]:
+        left_value, top_value, right_value, bottom_value = _bounds_of(self.element(element_id))
+        return {'x': left_value, 'y': top_value, 'width': right_value - left_value, 'height': bottom_value - top_value}
+
+    def _activate(self, node) -> None:
+        """노드 또는 가장 가까운 클릭 가능한 조상의 동작 실행"""
+        while node is not None:
+            handler_value = self._handlers.get(node)
+            if handler_value is not None:
+                handler_value()
+                return
+            node = node.getparent()
+
+    def click(self, element_id: str) -> None:
+        self._activate(self.element(element_id))
+
+    def tap(self, x: int, y: int) -> None:
+        """좌표 탭 - 그 점을 포함하는 가장 안쪽의 클릭 가능한 노드"""
+        self._render()
+        hits_value = []
+        for node in self._handlers:
+            left_value, top_value, right_value, bottom_value = _bounds_of(node)
+            if left_value <= x < right_value and top_value <= y < bottom_value:
+                hits_value.append((len(list(node.iterancestors())), node))
+        if hits_value:
+            self._activate(max(hits_value, key=lambda hit: hit[0])[1])
+
+    def back(self) -> None:
+        if len(self.stack) > 1:
+            self.stack.pop()
+            self._changed()
+
+    def current_activity(self) -> str:
+        return self.ACTIVITIES[self.screen]
+
+    def perform_actions(self, sources: List[Dict]) -> None:
+        """W3C 포인터 동작 - 제자리에서 떼면 탭, 움직였으면 스와이프(세로 이동 거리만큼 스크롤)"""
+        for source in sources:
+            if source.get('type') != "pointer":
+                continue
+            position_value, down_value = (0, 0), None
+            for action in source.get('actions', []):
+                if action['type'] == "pointerMove":
+                    position_value = (int(action.get('x', 0)), int(action.get('y', 0)))
+                elif action['type'] == "pointerDown":
+                    down_value = position_value
+                elif action['type'] == "pointerUp" and down_value is not None:
+                    if abs(position_value[0] - down_value[0]) < 10 and abs(position_value[1] - down_value[1]) < 10:
+                        self.tap(*down_value)
+                    else:
+                        self._scroll(down_value[1] - position_value[1])
+                    down_value = None
+
+    def execute(self, script: str, args: Dict):
+        """mobile: 명령 (scrollGesture, flingGesture, startActivity, deepLink, getCurrentActivity/Package)"""
+        if script == "mobile: getCurrentActivity":
+            return self.current_activity()
+        if script == "mobile: getCurrentPackage":
+            return self.PACKAGE
+        if script in ("mobile: scrollGesture", "mobile: flingGesture"):
+            height_value = args.get('height', self.LIST_BOTTOM - self.LIST_TOP)
+            distance_value = int(height_value * float(args.get('percent', 1.0)))
+            return self._scroll(-distance_value if args.get('direction') == "up" else distance_value)
+        if script == "mobile: startActivity":
+            activity_value = args.get('component', "").split("/", 1)[-1]
+            if activity_value == self.ACTIVITIES[self.WATCHLIST]:
+                self._push(self.WATCHLIST)
+            elif activity_value == self.ACTIVITIES[self.FEED]:
+                self._switch_tab(self.FEED)
+            elif activity_value == self.ACTIVITIES[self.DETAIL] and self.last_post is not None:
+                self._push(self.DETAIL, self.last_post)
+            else:
+                raise SyntheticError("unknown error", f"Activity '{activity_value}' does not exist", 500)
+            return None
+        if script == "mobile: deepLink":
+            if "watchlist" not in args.get('url', ""):
+                raise SyntheticError("unknown error", f"No activity handles '{args.get('url')}'", 500)
+            self._push(self.WATCHLIST)
+            return None
+        raise SyntheticError("unknown command", f"'{script}' is not supported by the synthetic driver")
+
+    def expected_titles(self) -> List[str]:
+        """관심목록에 있어야 하는 제목 (정규화, 맨 앞이 가장 최근)"""
+        return [normalize_title(post['display_title']) for post in self.watchlist]
+
+
+class SyntheticState:
+    """합성 앱 하나와 세션들 (Appium 서버처럼 세션이 바뀌어도 앱 상태는 유지)"""
+
+    INSTRUMENTATION_CRASH = ("An unknown server-side error occurred while processing the command. Original error: "
+                             "'{command}' cannot be proxied to UiAutomator2 server because the instrumentation "
+                             "process is not running (probably crashed)")
+
+    def __init__(self, app: SyntheticCarrot, latency: Optional[float] = None, crash_rate: float = 0.0, seed: int = 0):
+        """초기화 (latency: 명령마다 고정 지연(초), crash_rate: 명령마다 instrumentation crash가 날 확률 -
+        crash 후에는 새 세션을 만들 때까지 그 세션의 명령이 모두 실패)"""
+        self.app = app
+        self.latency = latency
+        self.crash_rate = crash_rate
+        self.random = random.Random(seed)
+        self.sessions: Dict[str, Dict] = {}
+        self.crashed = set()
+        self.commands: Dict[str, int] = {}
+        self.served = 0
+        self.crashes = 0
+        self.lock = threading.Lock()
+
+    def new_session(self, capabilities: Dict) -> Dict:
+        session_id_value = uuid.uuid4().hex
+        self.sessions[session_id_value] = {'capabilities': capabilities, 'settings': {}}
+        return {'sessionId': session_id_value, 'capabilities': dict(capabilities, platformName="Android")}
+
+    def check_session(self, session_id: str, command: str) -> Dict:
+        """세션 확인과 crash 주입"""
+        if session_id not in self.sessions:
+            raise SyntheticError("invalid session id", "A session is either terminated or not started")
+        if session_id not in self.crashed and self.crash_rate and self.random.random() < self.crash_rate:
+            self.crashed.add(session_id)
+            self.crashes += 1
+        if session_id in self.crashed:
+            raise SyntheticError("unknown error", self.INSTRUMENTATION_CRASH.format(command=command), 500)
+        return self.sessions[session_id]
+
+
+def _element_value(element_id: str) -> Dict[str, str]:
+    return {W3C_ELEMENT_KEY: element_id, 'ELEMENT': element_id}
+
+
+def _first(element_ids: List[str]) -> Dict[str, str]:
+    if not element_ids:
+        raise SyntheticError("no such element", "An element could not be located on the page using the given search parameters.")
+    return _element_value(element_ids[0])
+
+
+# (메서드, 세션 이후 경로, 명령 이름, 처리 함수(state, session, match, body))
+ROUTES = [
+    ("GET", r"/source", "getPageSource", lambda state, session, match, body: state.app.page_source()),
+    ("POST", r"/elements", "findElements",
+     lambda state, session, match, body: [_element_value(element_id) for element_id in state.app.find(body['using'], body['value'])]),
+    ("POST", r"/element", "findElement",
+     lambda state, session, match, body: _first(state.app.find(body['using'], body['value']))),
+    ("POST", r"/element/([^/]+)/elements", "findChildElements",
+     lambda state, session, match, body: [_element_value(element_id) for element_id in
+                                         state.app.find(body['using'], body['value'], match.group(1))]),
+    ("POST", r"/element/([^/]+)/element", "findChildElement",
+     lambda state, session, match, body: _first(state.app.find(body['using'], body['value'], match.group(1)))),
+    ("POST", r"/element/([^/]+)/click", "clickElement",
+     lambda state, session, match, body: state.app.click(match.group(1))),
+    ("GET", r"/element/([^/]+)/attribute/([^/]+)", "getElementAttribute",
+     lambda state, session, match, body: state.app.attribute(match.group(1), unquote(match.group(2)))),
+    ("GET", r"/element/([^/]+)/text", "getElementText",
+     lambda state, session, match, body: state.app.attribute(match.group(1), "text")),
+    ("GET", r"/element/([^/]+)/displayed", "isElementDisplayed",
+     lambda state, session, match, body: state.app.attribute(match.group(1), "displayed") == "true"),
+    ("GET", r"/element/([^/]+)/rect", "getElementRect", lambda state, session, match, body: state.app.rect(match.group(1))),
+    ("POST", r"/back", "back", lambda state, session, match, body: state.app.back()),
+    ("GET", r"/appium/device/current_activity", "getCurrentActivity",
+     lambda state, session, match, body: state.app.current_activity()),
+    ("GET", r"/appium/device/current_package", "getCurrentPackage", lambda state, session, match, body: state.app.PACKAGE),
+    ("POST", r"/execute/sync", "executeScript",
+     lambda state, session, match, body: state.app.execute(body['script'], (body.get('args') or [{}])[0])),
+    ("GET", r"/window/rect", "getWindowRect", lambda state, session, match, body: dict(state.app.SCREEN_SIZE, x=0, y=0)),
+    ("POST", r"/actions", "w3cActions", lambda state, session, match, body: state.app.perform_actions(body['actions'])),
+    ("DELETE", r"/actions", "releaseActions", lambda state, session, match, body: None),
+    ("POST", r"/appium/settings", "updateSettings",
+     lambda state, session, match, body: session['settings'].update(body.get('settings', {}))),
+    ("GET", r"/appium/settings", "getSettings", lambda state, session, match, body: dict(session['settings'])),
+    ("POST", r"/timeouts", "setTimeouts", lambda state, session, match, body: None),
+]
+_COMPILED_ROUTES = [(method, re.compile(pattern + "$"), name, handler) for method, pattern, name, handler in ROUTES]
+_SESSION_PATH = re.compile(r"^/session/([^/]+)(/.*)?$")
+
+
+class SyntheticHandler(BaseHTTPRequestHandler):
+    """합성 앱 화면을 돌려주는 Appium 대역 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _dispatch(self, state: SyntheticState, path: str, body: Dict):
+        """(명령 이름, value) - 실패하면 SyntheticError"""
+        if path == "/status":
+            return "getStatus", {'ready': True, 'message': "synthetic Carrot driver"}
+        if path == "/session" and self.command == "POST":
+            capabilities_value = (body.get('capabilities') or {}).get('alwaysMatch') or {}
+            return "newSession", state.new_session(capabilities_value)
+
+        match_value = _SESSION_PATH.match(path)
+        if match_value is None:
+            raise SyntheticError("unknown command", f"{self.command} {path} is not supported")
+        session_id_value, rest_value = match_value.group(1), match_value.group(2) or ""
+        if rest_value == "" and self.command == "DELETE":
+            state.sessions.pop(session_id_value, None)
+            state.crashed.discard(session_id_value)
+            return "quit", None
+
+        for method, pattern, name, handler in _COMPILED_ROUTES:
+            route_match_value = pattern.match(rest_value)
+            if method == self.command and route_match_value is not None:
+                try:
+                    session_value = state.check_session(session_id_value, f"{self.command} {rest_value}")
+                    return name, handler(state, session_value, route_match_value, body)
+                except SyntheticError as e:
+                    e.command = name
+                    raise
+        raise SyntheticError("unknown command", f"{self.command} {path} is not supported")
+
+    def _reply(self) -> None:
+        length_value = int(self.headers.get("Content-Length") or 0)
+        body_value = json.loads(self.rfile.read(length_value) or b"{}") if length_value else {}
+        path_value = urlparse(self.path).path.rstrip("/") or "/"
+        state_value = self.server.state
+        if state_value.latency:
+            time.sleep(state_value.latency)
+
+        with state_value.lock:
+            try:
+                command_value, value = self._dispatch(state_value, path_value, body_value)
+                status_value = 200
+            except SyntheticError as e:
+                # 명령별 오류 수 (예: "clickElement: stale element reference")
+                command_value = f"{e.command or 'unknown'}: {e.error}"
+                value = {'error': e.error, 'message': e.message, 'stacktrace': ""}
+                status_value = e.status
+            state_value.served += 1
+            state_value.commands[command_value] = state_value.commands.get(command_value, 0) + 1
+
+        encoded_value = json.dumps({'value': value}, ensure_ascii=False).encode("utf-8")
+        self.send_response(status_value)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(encoded_value)))
+        self.end_headers()
+        self.wfile.write(encoded_value)
+
+    do_GET = _reply
+    do_POST = _reply
+    do_DELETE = _reply
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class SyntheticServer:
+    """합성 앱을 W3C WebDriver로 제공하는 로컬 Appium 대역 서버 (CarrotLikeBot, CarrotProfileReader,
+    비동기 봇 모두 server_url만 바꿔서 사용)"""
+
+    def __init__(self, app: Optional[SyntheticCarrot] = None, port: int = 0, latency: Optional[float] = None,
+                 crash_rate: float = 0.0, seed: int = 0):
+        """초기화 (port=0이면 빈 포트 자동 선택)"""
+        self.app = app or SyntheticCarrot(seed=seed)
+        self.state = SyntheticState(self.app, latency, crash_rate, seed)
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), SyntheticHandler)
+        self.httpd.state = self.state
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self) -> "SyntheticServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "SyntheticServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def load_test(target: str = "read", app: Optional[SyntheticCarrot] = None, max_posts: int = 10,
+              max_scrolls: Optional[int] = None, stream_path: Optional[str] = None,
+              latency: Optional[float] = None, crash_rate: float = 0.0, seed: int = 0) -> Dict:
+    """합성 앱에 봇을 실행하여 소요 시간, 봇 스레드 CPU 시간, 최대 메모리, 명령 수와 결과 정확도 측정
+    (target: read - 관심목록 전체 읽기, like - 좋아요 봇, verify - verify_likes, inline - verify_likes_inline)
+
+    서버가 같은 프로세스의 다른 스레드에서 돌기 때문에 CPU 시간은 봇 스레드만 재고, 최대 메모리(tracemalloc)에는
+    서버가 화면을 그리는 데 쓴 메모리도 포함됨
+    """
+    from carrot import verify_likes, verify_likes_inline
+    from carrot_like import CarrotLikeBot
+    from carrot_read_like import CarrotProfileReader
+    from carrot_session import AppiumSession
+    from carrot_sink import TitleSink, iter_sink_titles
+
+    app = app or SyntheticCarrot(seed=seed)
+    report_value = {'target': target, 'feed': len(app.feed), 'watchlist': len(app.watchlist)}
+    with SyntheticServer(app, latency=latency, crash_rate=crash_rate, seed=seed) as server:
+        session_value = AppiumSession(server_url=server.url)
+        tracemalloc.start()
+        started_value = time.perf_counter()
+        cpu_started_value = time.thread_time()
+        try:
+            if target == "read":
+                # 탭 경로 학습(상태 파일 기록) 없이 activity로 바로 이동
+                reader_value = CarrotProfileReader(session=session_value,
+                                                   watchlist_activity=SyntheticCarrot.ACTIVITIES[SyntheticCarrot.WATCHLIST])
+                sink_value = TitleSink(stream_path) if stream_path else None
+                try:
+                    # 스크롤마다 한 행 이상 넘어가므로 관심목록 크기를 상한으로 쓰면 끝까지 읽음
+                    titles_value = reader_value.run(max_scrolls=max_scrolls or len(app.watchlist) + 1, sink=sink_value)
+                finally:
+                    if sink_value is not None:
+                        sink_value.close()
+                if sink_value is not None:
+                    titles_value = list(iter_sink_titles(stream_path))
+                expected_value = set(app.expected_titles())
+                found_value = {normalize_title(title) for title in titles_value}
+                report_value.update(found=len(found_value & expected_value), expected=len(expected_value),
+                                    missing=len(expected_value - found_value), extra=len(found_value - expected_value))
+            elif target == "like":
+                results_value = CarrotLikeBot(session=session_value).run(max_posts=max_posts)
+                report_value.update(posts=results_value['processed_count'], liked=results_value['liked_count'],
+                                    head_matches=results_value['liked_count'] == 0 or set(
+                                        normalize_title(title) for title in results_value['liked_titles'])
+                                    <= set(app.expected_titles()[:app.stats['likes']]))
+            elif target == "verify":
+                report_value['passed'] = verify_likes(session=session_value)
+            else:
+                report_value['passed'] = verify_likes_inline(session=session_value)
+        finally:
+            session_value.quit()
+            report_value['cpu_seconds'] = time.thread_time() - cpu_started_value
+            report_value['elapsed_seconds'] = time.perf_counter() - started_value
+            report_value['peak_memory_mb'] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+
+    report_value.update(commands=server.state.served, crashes=server.state.crashes,
+                        command_counts=dict(server.state.commands), app=dict(app.stats))
+    return report_value
+
+
+def print_load_report(report: Dict) -> None:
+    """부하 테스트 결과 출력"""
+    print(f"\n=== 합성 부하 테스트 결과 ({report['target']}) ===")
+    print(f"피드 {report['feed']}개, 관심목록 {report['watchlist']}개")
+    print(f"소요 시간 {report['elapsed_seconds']:.2f}초, 봇 CPU {report['cpu_seconds']:.2f}초, "
+          f"최대 메모리 {report['peak_memory_mb']:.1f}MB")
+    print(f"명령 {report['commands']}회 (주입한 crash {report['crashes']}회)")
+    if 'expected' in report:
+        print(f"관심목록 제목 {report['found']}/{report['expected']}개 수집 (누락 {report['missing']}개, "
+              f"관심목록에 없는 제목 {report['extra']}개)")
+    if 'posts' in report:
+        print(f"게시물 {report['posts']}개 처리, 좋아요 {report['liked']}개 "
+              f"(관심목록 맨 위에 반영: {'예' if report['head_matches'] else '아니오'})")
+    if 'passed' in report:
+        print(f"검증 결과: {'PASS' if report['passed'] else 'FAIL'}")
+    for command, count in sorted(report['command_counts'].items()):
+        print(f"  {command}: {count}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="합성 당근마켓 화면과 Appium 대역 서버")
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    def add_app_arguments(subparser) -> None:
+        subparser.add_argument("--feed", type=int, default=200, help="피드 게시물 수")
+        subparser.add_argument("--watchlist", type=int, default=1000, help="피드에 없는 관심목록 항목 수")
+        subparser.add_argument("--seed", type=int, default=0)
+        subparser.add_argument("--detail-button-ratio", type=float, default=0.3)
+        subparser.add_argument("--status-ratio", type=float, default=0.2, help="제목에 거래완료/예약중이 붙은 비율")
+        subparser.add_argument("--liked-ratio", type=float, default=0.1, help="이미 관심 추가된 피드 게시물 비율")
+        subparser.add_argument("--recommendations", type=int, default=6,
+                               help="관심목록 끝 '관심 있을 만한 상품' 행 수 (0이면 섹션 없음)")
+
+    def add_server_arguments(subparser) -> None:
+        subparser.add_argument("--latency", type=float, default=None, help="명령마다 고정 지연(초)")
+        subparser.add_argument("--crash-rate", type=float, default=0.0, help="명령마다 instrumentation crash 확률")
+
+    serve_parser = subparsers.add_parser("serve", help="합성 앱을 Appium 대역 서버로 실행 (봇은 그대로 실행)")
+    add_app_arguments(serve_parser)
+    add_server_arguments(serve_parser)
+    serve_parser.add_argument("--port", type=int, default=4723)
+
+    load_parser = subparsers.add_parser("load", help="합성 앱에 봇을 실행하여 시간/CPU/메모리 측정")
+    load_parser.add_argument("target", choices=["read", "like", "verify", "inline"])
+    add_app_arguments(load_parser)
+    add_server_arguments(load_parser)
+    load_parser.add_argument("--max-posts", type=int, default=10)
+    load_parser.add_argument("--max-scrolls", type=int, default=None,
+                             help="관심목록 스크롤 상한 (read, 생략 시 끝까지)")
+    load_parser.add_argument("--stream", metavar="PATH", help="관심목록 제목을 JSONL 파일에 바로 기록 (read)")
+
+    dump_parser = subparsers.add_parser("dump", help="합성 화면 page_source 출력")
+    dump_parser.add_argument("screen", choices=["feed", "detail", "profile", "watchlist"])
+    add_app_arguments(dump_parser)
+
+    args = parser.parse_args()
+    app = SyntheticCarrot(args.feed, args.watchlist, args.seed, detail_button_ratio=args.detail_button_ratio,
+                          status_ratio=args.status_ratio, liked_ratio=args.liked_ratio,
+                          recommendations=args.recommendations)
+    if args.mode == "serve":
+        server = SyntheticServer(app, args.port, args.latency, args.crash_rate, args.seed)
+        print(f"합성 서버 실행 중: {server.url} (피드 {len(app.feed)}개, 관심목록 {len(app.watchlist)}개)")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
+    elif args.mode == "load":
+        print_load_report(load_test(args.target, app, args.max_posts, args.max_scrolls, args.stream,
+                                    args.latency, args.crash_rate, args.seed))
+    else:
+        if args.screen == "detail":
+            app._push(app.DETAIL, app.feed[0])
+        elif args.screen != "feed":
+            app._switch_tab(app.PROFILE)
+            if args.screen == "watchlist":
+                app._push(app.WATCHLIST)
+        print(app.page_source())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from carrot_snapshot import parse_bounds
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.actions import interaction
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.pointer_input import PointerInput
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import hashlib
+
+
+def layout_signature(node) -> Optional[str]:
+    """스냅샷 노드와 조상들의 클래스/경계로 만든 레이아웃 해시 (텍스트는 제외 - 게시물이 달라도 같은 배치면 같은 값)"""
+    if node is None:
+        return None
+    parts_value = []
+    while node is not None:
+        parts_value.append(f"{node.tag}{node.get('bounds', '')}")
+        node = node.getparent()
+    return hashlib.blake2b("/".join(parts_value).encode("utf-8"), digest_size=8).hexdigest()
+
+
+class CoordinateTapper:
+    """요소 경계를 레이아웃별로 기억해 두고 좌표로 한 번에 탭 (W3C 액션 한 번 = 왕복 한 번)
+
+    처음 보는 레이아웃(또는 해시가 달라진 레이아웃)은 기억만 하고 locator 클릭을 쓰게 하며, 같은 레이아웃이
+    다시 나오면 기억한 좌표로 탭. 탭이 빗나간 것으로 보이면 forget()으로 지움
+    """
+
+    # 좌표 탭을 누르고 있는 시간 (초) - 너무 짧으면 Compose가 클릭으로 인식하지 못함
+    PRESS_SECONDS = 0.05
+
+    def __init__(self, driver_getter: Callable, screen_size: Callable[[], Dict[str, int]]):
+        """초기화 (screen_size: 화면 크기 함수 - 예: ScrollEngine.screen_size, 회전/해상도가 바뀌면 캐시도 분리됨)"""
+        self.driver_getter = driver_getter
+        self.screen_size = screen_size
+        self._bounds: Dict[Tuple, Tuple[str, Tuple[int, int, int, int]]] = {}
+        self.stats = {'taps': 0, 'fallbacks': 0, 'forgotten': 0}
+
+    @property
+    def driver(self):
+        return self.driver_getter()
+
+    def _cache_key(self, layout_key: Hashable) -> Tuple:
+        screen_size_value = self.screen_size()
+        return layout_key, screen_size_value["width"], screen_size_value["height"]
+
+    def tap(self, x: int, y: int) -> None:
+        """좌표 탭 (누르기-떼기를 한 번의 W3C 액션으로 전송)"""
+        actions = ActionChains(self.driver)
+        actions.w3c_actions = ActionBuilder(self.driver, mouse=PointerInput(interaction.POINTER_TOUCH, "touch"))
+        actions.w3c_actions.pointer_action.move_to_location(x, y)
+        actions.w3c_actions.pointer_action.pointer_down()
+        actions.w3c_actions.pointer_action.pause(self.PRESS_SECONDS)
+        actions.w3c_actions.pointer_action.release()
+        actions.perform()
+        self.stats['taps'] += 1
+
+    def tap_bounds(self, bounds: Tuple[int, int, int, int]) -> None:
+        """경계 (left, top, right, bottom)의 가운데를 탭"""
+        left_value, top_value, right_value, bottom_value = bounds
+        self.tap((left_value + right_value) // 2, (top_value + bottom_value) // 2)
+
+    def tap_cached(self, layout_key: Hashable, signature: Optional[str], bounds: Optional[Tuple[int, int, int, int]]) -> bool:
+        """layout_key에 기억한 레이아웃 해시가 signature와 같으면 기억한 좌표로 탭하고 True
+
+        다르거나 처음이면 지금 값을 기억만 하고 False (호출한 쪽에서 locator로 클릭)
+        """
+        cached_bounds_value = self._cached_bounds(layout_key, signature, bounds)
+        if cached_bounds_value is None:
+            return False
+        self.tap_bounds(cached_bounds_value)
+        return True
+
+    def _cached_bounds(self, layout_key: Hashable, signature: Optional[str],
+                       bounds: Optional[Tuple[int, int, int, int]]) -> Optional[Tuple[int, int, int, int]]:
+        """tap_cached에서 탭할 기억한 경계 (없으면 지금 값을 기억하고 None)"""
+        if signature is None or bounds is None:
+            self.stats['fallbacks'] += 1
+            return None
+        cache_key_value = self._cache_key(layout_key)
+        cached_value = self._bounds.get(cache_key_value)
+        if cached_value is not None and cached_value[0] == signature:
+            return cached_value[1]
+        self._bounds[cache_key_value] = (signature, bounds)
+        self.stats['fallbacks'] += 1
+        return None
+
+    def tap_node(self, node) -> bool:
+        """스냅샷 노드의 현재 경계로 바로 탭 (경계가 없으면 False)"""
+        bounds_value = parse_bounds(node.get("bounds")) if node is not None else None
+        if bounds_value is None:
+            return False
+        self.tap_bounds(bounds_value)
+        return True
+
+    def forget(self, layout_key: Hashable) -> None:
+        """기억한 좌표 삭제 (탭이 빗나간 경우)"""
+        if self._bounds.pop(self._cache_key(layout_key), None) is not None:
+            self.stats['forgotten'] += 1
+
+    def print_report(self) -> None:
+        """탭 통계 출력"""
+        print(f"좌표 탭 {self.stats['taps']}회, locator 클릭 {self.stats['fallbacks']}회, "
+              f"빗나가서 지운 좌표 {self.stats['forgotten']}개")
@@ -0,0 +1,122 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional
+import difflib
+import hashlib
+import unicodedata
+
+
+# 게시물 제목에 붙는 거래 상태 문구
+STATUS_WORDS = ("거래완료", "예약중")
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 정규화 (유니코드 조합 통일, 상태 문구 제거, 공백 정리)"""
+    title_value = unicodedata.normalize("NFKC", title or "")
+    for status_word in STATUS_WORDS:
+        title_value = title_value.replace(status_word, " ")
+    return " ".join(title_value.split())
+
+
+class TitleIndex:
+    """정규화된 제목을 키로 하는 해시 색인 (중복 제거 및 포함 여부 확인)"""
+
+    def __init__(self, titles: Iterable[str] = (), fuzzy_cutoff: Optional[float] = None):
+        """초기화 (fuzzy_cutoff: 0~1, 지정하면 정확히 일치하지 않을 때 유사도 비교로 한 번 더 확인)"""
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self._titles: Dict[str, str] = {}
+        for title in titles:
+            self.add(title)
+
+    def add(self, title: str) -> bool:
+        """제목 추가 - 새 제목이면 True"""
+        key_value = normalize_title(title)
+        if not key_value or key_value in self._titles:
+            return False
+        self._titles[key_value] = title
+        return True
+
+    def match(self, title: str) -> Optional[str]:
+        """색인에서 일치하는 원래 제목 찾기"""
+        key_value = normalize_title(title)
+        if key_value in self._titles:
+            return self._titles[key_value]
+
+        if self.fuzzy_cutoff is not None and key_value:
+            close_keys_value = difflib.get_close_matches(key_value, self._titles.keys(), n=1, cutoff=self.fuzzy_cutoff)
+            if close_keys_value:
+                return self._titles[close_keys_value[0]]
+        return None
+
+    def __contains__(self, title: str) -> bool:
+        return self.match(title) is not None
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._titles.values())
+
+
+def title_fingerprint(title: str) -> int:
+    """정규화된 제목의 64비트 지문"""
+    return int.from_bytes(hashlib.blake2b(normalize_title(title).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class RollingTitleFilter:
+    """제목 문자열을 모두 들고 있지 않는 중복 제거 필터 (스트리밍 수집용)
+
+    최근 window개 제목은 그대로 비교하고(화면 사이 겹침), 그보다 오래된 제목은 64비트 지문으로만 기억.
+    fingerprints=False이면 최근 window개만 기억하여 메모리가 목록 크기와 무관
+    """
+
+    RECENT_WINDOW = 200
+
+    def __init__(self, window: int = RECENT_WINDOW, fingerprints: bool = True):
+        """초기화"""
+        self._recent = deque(maxlen=window)
+        self._recent_keys = set()
+        self._fingerprints = set() if fingerprints else None
+        self.count = 0
+
+    def add(self, title: str) -> bool:
+        """제목 추가 - 새 제목이면 True"""
+        key_value = normalize_title(title)
+        if not key_value or key_value in self._recent_keys:
+            return False
+        if self._fingerprints is not None:
+            fingerprint_value = title_fingerprint(key_value)
+            if fingerprint_value in self._fingerprints:
+                return False
+            self._fingerprints.add(fingerprint_value)
+
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_keys.discard(self._recent[0])
+        self._recent.append(key_value)
+        self._recent_keys.add(key_value)
+        self.count += 1
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def find_missing_streaming(expected_titles: Iterable[str], actual_titles: Iterable[str],
+                           fuzzy_cutoff: Optional[float] = None) -> List[str]:
+    """find_missing과 같지만 actual_titles를 한 번 훑기만 함 (디스크에서 읽는 큰 목록용, 메모리는 expected 크기)"""
+    expected_titles = list(expected_titles)
+    expected_index_value = TitleIndex(expected_titles, fuzzy_cutoff)
+    found_keys_value = set()
+    for title in actual_titles:
+        matched_value = expected_index_value.match(title)
+        if matched_value is not None:
+            found_keys_value.add(normalize_title(matched_value))
+            if len(found_keys_value) == len(expected_index_value):
+                break
+    return [title for title in expected_titles if normalize_title(title) not in found_keys_value]
+
+
+def find_missing(expected_titles: Iterable[str], actual_titles: Iterable[str],
+                 fuzzy_cutoff: Optional[float] = None) -> List[str]:
+    """expected_titles 중 actual_titles에 없는 제목 목록 (선형 시간)"""
+    actual_index_value = TitleIndex(actual_titles, fuzzy_cutoff)
+    return [title for title in expected_titles if title not in actual_index_value]
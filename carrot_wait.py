@@ -0,0 +1,129 @@
+from selenium.webdriver.common.by import By
+from typing import Callable, Dict, Optional, Tuple
+import hashlib
+import time
+
+
+class ScreenSettleWaiter:
+    """고정 sleep 대신 화면이 안정되는 즉시 반환하는 대기 엔진"""
+
+    # 폴링 간격 (점점 늘어나는 backoff)
+    INITIAL_INTERVAL = 0.1
+    BACKOFF_FACTOR = 1.5
+    MAX_INTERVAL = 0.5
+
+    def __init__(self, driver_getter: Callable):
+        """초기화 (driver_getter: 현재 driver를 반환하는 함수 - 세션 재시작 대응)"""
+        self.driver_getter = driver_getter
+        self.last_page_source = None
+        self.last_ready = False
+        self.stats = {
+            'waits': 0,
+            'timeouts': 0,
+            'waited_seconds': 0.0,
+            'fixed_seconds': 0.0,
+        }
+
+    @property
+    def driver(self):
+        return self.driver_getter()
+
+    def _hierarchy_hash(self) -> Optional[str]:
+        """현재 화면 계층구조 해시"""
+        try:
+            self.last_page_source = self.driver.page_source
+        except Exception:
+            self.last_page_source = None
+            return None
+        return hashlib.blake2b(self.last_page_source.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _current_activity(self) -> Optional[str]:
+        try:
+            return self.driver.current_activity
+        except Exception:
+            return None
+
+    def _locator_present(self, locator: Tuple[By, str]) -> bool:
+        try:
+            return len(self.driver.find_elements(*locator)) > 0
+        except Exception:
+            return False
+
+    def _poll(self, ceiling: float, is_ready: Callable[[], bool]) -> float:
+        """is_ready가 참이 될 때까지 backoff 폴링 (최대 ceiling초, 조건 충족 여부는 last_ready)"""
+        self.last_page_source = None
+        started_value = time.monotonic()
+        deadline_value = started_value + ceiling
+        interval_value = self.INITIAL_INTERVAL
+        ready_value = False
+
+        while True:
+            if is_ready():
+                ready_value = True
+                break
+            remaining_value = deadline_value - time.monotonic()
+            if remaining_value <= 0:
+                break
+            time.sleep(min(interval_value, remaining_value))
+            interval_value = min(interval_value * self.BACKOFF_FACTOR, self.MAX_INTERVAL)
+
+        elapsed_value = time.monotonic() - started_value
+        self.stats['waits'] += 1
+        self.stats['waited_seconds'] += elapsed_value
+        self.stats['fixed_seconds'] += ceiling
+        if not ready_value:
+            self.stats['timeouts'] += 1
+        self.last_ready = ready_value
+        return elapsed_value
+
+    def wait_until_stable(self, ceiling: float) -> float:
+        """계층구조 해시가 연속 두 번 같아질 때까지 대기"""
+        previous_hash = [None]
+
+        def is_stable() -> bool:
+            current_hash = self._hierarchy_hash()
+            stable_value = current_hash is not None and current_hash == previous_hash[0]
+            previous_hash[0] = current_hash
+            return stable_value
+
+        return self._poll(ceiling, is_stable)
+
+    def wait_for_locator(self, locator: Tuple[By, str], ceiling: float) -> float:
+        """locator에 해당하는 요소가 나타날 때까지 대기"""
+        return self._poll(ceiling, lambda: self._locator_present(locator))
+
+    def wait_for_activity(self, ceiling: float, previous_activity: Optional[str] = None,
+                          expected_activity: Optional[str] = None) -> float:
+        """현재 activity가 expected_activity가 되거나 previous_activity에서 바뀔 때까지 대기"""
+        def is_ready() -> bool:
+            activity_value = self._current_activity()
+            if activity_value is None:
+                return False
+            if expected_activity is not None:
+                return activity_value == expected_activity
+            return activity_value != previous_activity
+
+        return self._poll(ceiling, is_ready)
+
+    def consume_page_source(self) -> Optional[str]:
+        """안정화 확인에 사용한 마지막 page_source 반환 (한 번만 재사용)"""
+        page_source_value = self.last_page_source
+        self.last_page_source = None
+        return page_source_value
+
+    def get_report(self) -> Dict:
+        """고정 대기 대비 절약한 시간"""
+        return {
+            'waits': self.stats['waits'],
+            'timeouts': self.stats['timeouts'],
+            'waited_seconds': self.stats['waited_seconds'],
+            'fixed_seconds': self.stats['fixed_seconds'],
+            'saved_seconds': self.stats['fixed_seconds'] - self.stats['waited_seconds'],
+        }
+
+    def print_report(self) -> None:
+        """대기 통계 출력"""
+        report_value = self.get_report()
+        print(f"화면 대기 {report_value['waits']}회 (타임아웃 {report_value['timeouts']}회): "
+              f"{report_value['waited_seconds']:.1f}초 대기 / 고정 대기 {report_value['fixed_seconds']:.1f}초 "
+              f"→ {report_value['saved_seconds']:.1f}초 절약")